@@ -0,0 +1,202 @@
+/* ============================================================
+   한국어 n-gram 검색 — 빌드 때 만든 search/ko-index.json을 그대로 질의
+   (형식과 절차는 scripts/search_index.py의 Index와 같음)
+   색인은 검색창에 처음 들어갈 때 한 번 받고, 첫 글자 줄을 이진 탐색해 그 줄만 풀어 둔다.
+   ============================================================ */
+(function () {
+  "use strict";
+
+  var VERSION = 1;
+  var MAX_RESULTS = 20;
+  var DIGITS = "0123456789abcdefghijklmnopqrstuv";
+  var MORE_DIGITS = "ABCDEFGHIJKLMNOPQRSTUVWXYZwxyz_-";
+  var root = new URL("../", document.currentScript.src);
+  var indexURL = new URL("search/ko-index.json", root);
+  var loading = null;
+
+  function normalize(text) {
+    return text.normalize("NFC").replace(/\s+/g, " ").trim().toLowerCase();
+  }
+
+  function load() {
+    if (!loading) {
+      loading = fetch(indexURL).then(function (response) {
+        if (!response.ok) throw new Error("검색 색인을 받지 못했습니다: " + response.status);
+        return response.json();
+      }).then(function (payload) {
+        if (payload.v !== VERSION) throw new Error("검색 색인 버전이 다릅니다: " + payload.v);
+        return {
+          pages: payload.pages,
+          docs: payload.docs,
+          lines: payload.grams ? payload.grams.split("\n") : [],
+          parsed: new Map()
+        };
+      });
+    }
+    return loading;
+  }
+
+  /* 구역 목록 -> Set — 델타를 32진 가변 길이 숫자로 이은 것 */
+  function decode(postings) {
+    var docs = new Set(), doc = 0, value = 0;
+    for (var i = 0; postings && i < postings.length; i++) {
+      var digit = DIGITS.indexOf(postings.charAt(i));
+      if (digit < 0) {
+        value = value * 32 + MORE_DIGITS.indexOf(postings.charAt(i));
+        continue;
+      }
+      doc += value * 32 + digit;
+      docs.add(doc);
+      value = 0;
+    }
+    return docs;
+  }
+
+  /* 한 줄 -> Map(n-gram -> 구역 목록 문자열) — 첫 글자, 2-gram, 3-gram */
+  function parseLine(line) {
+    var table = new Map(), i = 1, bigram = null;
+    while (i < line.length && line[i] !== "/" && line[i] !== "|") i++;
+    table.set(line[0], line.slice(1, i));
+    while (i < line.length) {
+      var kind = line[i], ch = line[i + 1], j = i + 2;
+      while (j < line.length && line[j] !== "/" && line[j] !== "|") j++;
+      if (kind === "/") {
+        bigram = line[0] + ch;
+        table.set(bigram, line.slice(i + 2, j));
+      } else {
+        table.set(bigram + ch, line.slice(i + 2, j));
+      }
+      i = j;
+    }
+    return table;
+  }
+
+  /* 첫 글자 ch의 줄 — 줄은 첫 글자의 UTF-16 순서로 정렬되어 있음 */
+  function lineOf(index, ch) {
+    if (!index.parsed.has(ch)) {
+      var lines = index.lines, lo = 0, hi = lines.length;
+      while (lo < hi) {
+        var mid = (lo + hi) >> 1;
+        if (lines[mid][0] < ch) lo = mid + 1; else hi = mid;
+      }
+      index.parsed.set(ch, lo < lines.length && lines[lo][0] === ch ? parseLine(lines[lo]) : new Map());
+    }
+    return index.parsed.get(ch);
+  }
+
+  function intersect(a, b) {
+    var out = new Set();
+    a.forEach(function (doc) { if (b.has(doc)) out.add(doc); });
+    return out;
+  }
+
+  function bigram(index, gram) {
+    return decode(lineOf(index, gram[0]).get(gram));
+  }
+
+  function trigram(index, gram) {
+    var stored = lineOf(index, gram[0]).get(gram);
+    if (stored !== undefined) return decode(stored);
+    return intersect(bigram(index, gram.slice(0, 2)), bigram(index, gram.slice(1)));
+  }
+
+  /* 공백 없는 term이 들어 있는 구역 */
+  function term(index, text) {
+    if (text.length === 1) {
+      var all = new Set();
+      lineOf(index, text).forEach(function (postings, gram) {
+        if (gram.length < 3) decode(postings).forEach(function (doc) { all.add(doc); });
+      });
+      return all;
+    }
+    if (text.length === 2) return bigram(index, text);
+    var docs = null;
+    for (var i = 0; i + 3 <= text.length; i++) {
+      var found = trigram(index, text.slice(i, i + 3));
+      docs = docs ? intersect(docs, found) : found;
+      if (!docs.size) break;
+    }
+    return docs;
+  }
+
+  /* [[구역 번호, 점수]] — 모든 낱말이 들어 있는 구역, 제목에 든 낱말은 2점 */
+  function search(index, query) {
+    var terms = normalize(query).split(" ").filter(Boolean), docs = null;
+    for (var t = 0; t < terms.length; t++) {
+      var found = term(index, terms[t]);
+      docs = docs ? intersect(docs, found) : found;
+      if (!docs.size) return [];
+    }
+    var results = [];
+    (docs || []).forEach(function (doc) {
+      var title = normalize(index.docs[doc][2]), score = 0;
+      terms.forEach(function (word) { score += title.indexOf(word) >= 0 ? 2 : 1; });
+      results.push([doc, score]);
+    });
+    return results.sort(function (a, b) { return b[1] - a[1] || a[0] - b[0]; }).slice(0, MAX_RESULTS);
+  }
+
+  /* ----- 검색창 ----- */
+  function render(list, index, results, query) {
+    list.innerHTML = "";
+    if (!query) return;
+    if (!results.length) {
+      var empty = document.createElement("li");
+      empty.className = "ko-search__empty";
+      empty.textContent = "검색 결과가 없습니다";
+      list.appendChild(empty);
+      return;
+    }
+    results.forEach(function (result) {
+      var doc = index.docs[result[0]], page = index.pages[doc[0]];
+      var item = document.createElement("li");
+      var link = document.createElement("a");
+      link.href = new URL(page[0], root).href + (doc[1] ? "#" + doc[1] : "");
+      var title = document.createElement("strong");
+      title.textContent = doc[2];
+      link.appendChild(title);
+      if (doc[2] !== page[1]) {
+        var parent = document.createElement("span");
+        parent.textContent = page[1];
+        link.appendChild(parent);
+      }
+      item.appendChild(link);
+      list.appendChild(item);
+    });
+  }
+
+  function mount() {
+    var header = document.querySelector(".md-header__inner");
+    if (!header) return;
+    var box = document.createElement("div");
+    box.className = "ko-search";
+    box.innerHTML = '<input type="search" class="ko-search__input" placeholder="검색" ' +
+      'aria-label="검색" autocomplete="off"><ol class="ko-search__results"></ol>';
+    header.appendChild(box);
+    var input = box.querySelector("input"), list = box.querySelector("ol");
+
+    input.addEventListener("focus", load, { once: true });
+    input.addEventListener("input", function () {
+      var query = input.value;
+      load().then(function (index) {
+        if (input.value === query) render(list, index, search(index, query), normalize(query));
+      });
+    });
+    input.addEventListener("keydown", function (event) {
+      if (event.key === "Escape") { input.value = ""; list.innerHTML = ""; input.blur(); }
+      if (event.key === "Enter") {
+        var first = list.querySelector("a");
+        if (first) window.location.href = first.href;
+      }
+    });
+    document.addEventListener("keydown", function (event) {
+      if (event.key === "/" && !/^(INPUT|TEXTAREA)$/.test(document.activeElement.tagName)) {
+        event.preventDefault();
+        input.focus();
+      }
+    });
+  }
+
+  if (document.readyState === "loading") document.addEventListener("DOMContentLoaded", mount);
+  else mount();
+})();
@@ -0,0 +1,501 @@
+"""
+AI투 문체 검사기 — 5장(AI 글 평가와 교정)과 부록 한국어 글쓰기 가이드의 표를 규칙으로 읽어
+대량의 초안을 검사한다. 번역투·슬롭 워드·전환어·메타 해설 같은 구절 규칙은 전부
+Aho–Corasick 자동자 하나로 합쳐 글자당 한 번의 상태 전이로 찾고, 종결 어미 반복과
+짧은 문장·문단처럼 문장 단위 규칙은 문단을 모은 뒤 판단한다.
+파일은 한 줄씩 읽어 문단 단위로만 메모리에 두며, 여러 파일은 프로세스 풀로 나눠 검사한다.
+결과는 문서마다 JSON 한 줄 (규칙별 개수와 위치), 마지막에 규칙별 합계와 처리량(MB/s).
+
+사용법:
+    python scripts/ai_style_lint.py drafts/ -j 8 -o report.jsonl
+    python scripts/ai_style_lint.py --list-rules
+"""
+import argparse
+import bisect
+import json
+import os
+import re
+import sys
+import time
+
+ROOT_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+DOCS_DIR = os.path.join(ROOT_DIR, 'docs')
+
+# 규칙을 읽을 문서 — 같은 규칙이 두 곳에 있으면 한 번만
+RULE_SOURCES = [
+    os.path.join(DOCS_DIR, 'part2', 'ch05-evaluating-ai.md'),
+    os.path.join(DOCS_DIR, 'appendix', 'korean-writing-guide.md'),
+]
+TEXT_EXTENSIONS = ('.md', '.markdown', '.txt')
+
+# 규칙 종류 — 출력의 rule id는 '종류:구절'
+CATEGORIES = {
+    'translationese': '번역투',
+    'slop': '슬롭 워드',
+    'transition': '전환어 과용',
+    'meta': '메타 해설',
+    'monotone-ending': '종결 어미 반복',
+    'short-sentences': '짧게 끊긴 문장',
+    'short-paragraphs': '문단 분절',
+}
+
+# 표의 첫 열 제목 -> 규칙 종류
+TABLE_CATEGORIES = {'번역투': 'translationese', '슬롭 워드': 'slop', '메타 해설': 'meta'}
+# 목록 항목의 굵은 머리말(또는 소제목) -> 규칙 종류
+LIST_CATEGORIES = {'형용사/부사': 'slop', '접속구': 'slop', '전환어': 'transition'}
+
+# 문서에 수치가 없으면 쓰는 기본값
+DEFAULTS = {
+    'transition_limit': 2,        # 같은 전환어가 한 문서에 이만큼 나오면 과용
+    'min_paragraph_sentences': 3,  # 이보다 적은 문장의 문단이
+    'short_paragraph_run': 2,      # 이만큼 이어지면 문단 분절
+    'short_sentence_chars': 30,    # 이보다 짧은 문장이
+    'short_sentence_run': 3,       # 이만큼 이어지면 단절
+    'monotone_run': 3,             # 같은 종결 어미 묶음으로 끝나는 문장이 이만큼 이어지면 반복
+    'endings': ['합니다', '있습니다'],
+}
+
+# 구절 정규화 — 표의 '~', 'A', 'X' 같은 자리 표시자와 활용 어미를 떼어 본문에서 찾을 줄기만
+_PLACEHOLDER = re.compile(r'~|(?<![A-Za-z])[A-Z](?![A-Za-z])')
+_TRAILING_ENDINGS = ('합니다', '입니다', '습니다', '하다')
+# 앞에 붙은 조사는 받침에 따라 짝이 바뀜
+_PARTICLE_PAIRS = {'를': '을', '을': '를', '가': '이', '이': '가', '는': '은', '은': '는',
+                   '와': '과', '과': '와'}
+
+_FENCE = re.compile(r'^\s*(```|~~~)')
+_HEADING = re.compile(r'^(#{1,6})\s+(.*?)\s*#*\s*$')
+_TABLE_RULE = re.compile(r'^\|?\s*:?-{3,}')
+_BLOCK = re.compile(r'^(?:#{1,6}\s|\||!!!|\?\?\?|===|[-*+]\s|\d+[.)]\s|>)')
+_BOLD_LEAD = re.compile(r'^\*\*(.+?):?\*\*:?\s*(.*)$')
+_QUOTED_ENDING = re.compile(r"'~([가-힣]+)'")
+_MARKUP = re.compile(r'\*\*|__|`|\[([^\]]*)\]\([^)]*\)')
+_SENTENCE = re.compile(r'[^.!?。]*[.!?。]+["\')\]]*|[^.!?。]+$')
+_WORD_CHAR = re.compile(r'[\w가-힣]')
+
+
+# ============================================================
+# 규칙 읽기 — 마크다운 표와 목록
+# ============================================================
+def _sections(markdown):
+    """(소제목 경로, 코드 블록을 뺀 줄 목록) — 소제목마다 하나"""
+    headings, lines, fenced = [], [], False
+    for line in markdown.splitlines():
+        if _FENCE.match(line):
+            fenced = not fenced
+            continue
+        if fenced:
+            continue
+        m = _HEADING.match(line)
+        if m:
+            yield tuple(headings), lines
+            level = len(m.group(1))
+            headings = headings[:level - 1] + [m.group(2)]
+            lines = []
+        else:
+            lines.append(line)
+    yield tuple(headings), lines
+
+
+def _cells(line):
+    return [cell.strip() for cell in line.strip().strip('|').split('|')]
+
+
+def _tables(lines):
+    """[(머리 행, [행])] — 구분선(|---|) 바로 위가 머리 행"""
+    tables = []
+    for i, line in enumerate(lines):
+        if _TABLE_RULE.match(line.strip()) and i > 0 and lines[i - 1].lstrip().startswith('|'):
+            rows = []
+            for row in lines[i + 1:]:
+                if not row.lstrip().startswith('|'):
+                    break
+                rows.append(_cells(row))
+            tables.append((_cells(lines[i - 1]), rows))
+    return tables
+
+
+def _plain(text):
+    return _MARKUP.sub(lambda m: m.group(1) or '', text).strip()
+
+
+def stem(phrase):
+    """표의 구절에서 본문에서 찾을 줄기 — 자리 표시자 사이의 가장 긴 조각, 활용 어미 제외"""
+    phrase = _plain(phrase).strip(" :'\"")
+    fragment = max(_PLACEHOLDER.split(phrase), key=len).strip()
+    for ending in _TRAILING_ENDINGS:
+        if fragment.endswith(ending) and len(fragment) > len(ending):
+            fragment = fragment[:-len(ending)].rstrip()
+            break
+    return fragment
+
+
+def adjective_stem(word):
+    """'혁신적인' -> '혁신적', '원활한' -> '원활' — 활용형(혁신적으로, 원활하게)도 찾도록"""
+    if word.endswith('적인'):
+        return word[:-1]
+    if len(word) > 2 and word[-1] in '한된':
+        return word[:-1]
+    return word
+
+
+def _variants(phrase):
+    """앞 조사 짝 — '를 기반으로 한'이면 '을 기반으로 한'도"""
+    variants = [phrase]
+    if len(phrase) > 1 and phrase[0] in _PARTICLE_PAIRS and phrase[1] == ' ':
+        variants.append(_PARTICLE_PAIRS[phrase[0]] + phrase[1:])
+    return variants
+
+
+def load_rules(sources=None):
+    """문서에서 규칙 읽기 — {'phrases': [(rule id, 종류, 구절, 단어 경계 필요)], 수치 설정...}"""
+    settings = {k: (list(v) if isinstance(v, list) else v) for k, v in DEFAULTS.items()}
+    phrases = {}
+    endings = []
+
+    def add(category, phrase, boundary=False):
+        if not phrase:
+            return
+        rule = f'{category}:{phrase}'
+        for variant in _variants(phrase):
+            phrases.setdefault((category, variant), (rule, category, variant, boundary))
+
+    for source in sources or RULE_SOURCES:
+        with open(source, encoding='utf-8') as f:
+            markdown = f.read()
+        for headings, lines in _sections(markdown):
+            title = headings[-1] if headings else ''
+            for header, rows in _tables(lines):
+                category = next((c for key, c in TABLE_CATEGORIES.items() if key in header[0]), None)
+                for row in rows if category else ():
+                    cell = row[0]
+                    if category == 'meta' and not _PLACEHOLDER.search(cell):
+                        continue        # 자리 표시자가 없는 행은 예문
+                    if category == 'slop':
+                        add(category, adjective_stem(_plain(cell)))
+                    else:
+                        add(category, stem(cell))
+            for line in lines:
+                item = line.strip()
+                if not item.startswith(('- ', '* ')):
+                    continue
+                item = item[2:].strip()
+                m = _BOLD_LEAD.match(item)
+                lead, words = (m.group(1), m.group(2)) if m else (title, item)
+                category = LIST_CATEGORIES.get(lead.strip())
+                if category is None:
+                    continue
+                for word in _plain(words).split(','):
+                    word = word.strip()
+                    if category == 'slop':
+                        add(category, adjective_stem(word))
+                    else:
+                        add(category, word, boundary=True)
+            text = ' '.join(lines)
+            if '전환어' in text or '전환어' in title:
+                m = re.search(r'(\d+)회 이상', text)
+                if m:
+                    settings['transition_limit'] = int(m.group(1))
+            if '문단' in title:
+                m = re.search(r'최소 (\d+)', text)
+                if m:
+                    settings['min_paragraph_sentences'] = int(m.group(1))
+            if '종결' in title:
+                for line in lines:
+                    found = _QUOTED_ENDING.findall(line)
+                    if found:       # 첫 문단에 나온 단조로운 어미들
+                        endings += [e for e in found if e not in endings]
+                        break
+    if endings:
+        settings['endings'] = endings
+    settings['phrases'] = sorted(phrases.values())
+    return settings
+
+
+# ============================================================
+# Aho–Corasick 자동자
+# ============================================================
+class Automaton:
+    """여러 구절을 한 번에 찾는 자동자 — 실패 링크를 미리 펼친 DFA라 글자당 dict 조회 한 번"""
+
+    def __init__(self, patterns):
+        """patterns: [(구절, 값)]"""
+        goto = [{}]
+        outputs = [[]]
+        for phrase, value in patterns:
+            state = 0
+            for ch in phrase:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = goto[state][ch] = len(goto)
+                    goto.append({})
+                    outputs.append([])
+                state = nxt
+            outputs[state].append((len(phrase), value))
+        # 너비 우선으로 실패 링크를 따라가며 전이표를 완성 (루트에 없는 글자는 0으로)
+        delta = [dict(goto[0])] + [None] * (len(goto) - 1)
+        fail = [0] * len(goto)
+        queue = list(goto[0].values())
+        for state in queue:
+            delta[state] = {**delta[fail[state]], **goto[state]}
+            outputs[state] = outputs[state] + outputs[fail[state]]
+            for ch, child in goto[state].items():
+                fail[child] = delta[fail[state]].get(ch, 0) if state else 0
+                queue.append(child)
+        for ch, child in goto[0].items():
+            fail[child] = 0
+        self._delta = delta
+        self._outputs = [tuple(o) or None for o in outputs]
+        self.states = len(goto)
+
+    def finditer(self, text):
+        """(시작 위치, 값) — 끝 위치 순서"""
+        delta, outputs = self._delta, self._outputs
+        state = 0
+        for i, ch in enumerate(text):
+            state = delta[state].get(ch, 0)
+            found = outputs[state]
+            if found is not None:
+                for length, value in found:
+                    yield i - length + 1, value
+
+
+# ============================================================
+# 검사
+# ============================================================
+class Linter:
+    """규칙을 한 번 컴파일해 두고 문서마다 lint_lines() — 프로세스마다 하나"""
+
+    def __init__(self, rules):
+        self.rules = rules
+        self.automaton = Automaton([(phrase, (rule, category, boundary))
+                                    for rule, category, phrase, boundary in rules['phrases']])
+        self.endings = tuple(rules['endings'])
+
+    def lint_lines(self, lines):
+        """줄 반복자 하나를 검사 — {'counts': {rule: n}, 'hits': [{rule, line, col, text}]}"""
+        state = {'hits': [], 'sentences': [], 'paragraphs': []}
+        paragraph = []          # [(줄 번호, 들여쓰기를 뺀 줄)]
+        fenced = False
+        for number, line in enumerate(lines, 1):
+            line = line.rstrip('\n')
+            if _FENCE.match(line):
+                self._flush(paragraph, state)
+                fenced = not fenced
+                continue
+            if fenced:
+                continue
+            stripped = line.strip()
+            if not stripped:
+                self._flush(paragraph, state)
+            elif _BLOCK.match(stripped):
+                # 제목/표/목록/인용 — 구절만 검사, 문장·문단 흐름은 끊음
+                self._flush(paragraph, state)
+                self._end_run(state, heading=stripped.startswith('#'))
+                self._phrases([(number, line.index(stripped[0]), stripped)], state)
+            else:
+                paragraph.append((number, len(line) - len(line.lstrip()), stripped))
+        self._flush(paragraph, state)
+        self._end_run(state, heading=True)
+        return self._result(state)
+
+    def _phrases(self, parts, state):
+        """문단(여러 줄을 공백으로 이은 것)에서 구절 규칙 — 위치는 원래 줄/열로"""
+        text = ' '.join(p[2] for p in parts)
+        starts, offset = [], 0
+        for _, _, part in parts:
+            starts.append(offset)
+            offset += len(part) + 1
+        for start, (rule, category, boundary) in self.automaton.finditer(text):
+            if boundary and start and _WORD_CHAR.match(text[start - 1]):
+                continue
+            k = bisect.bisect_right(starts, start) - 1
+            number, indent, _ = parts[k]
+            length = len(rule) - len(category) - 1
+            state['hits'].append({'rule': rule, 'line': number, 'col': indent + start - starts[k] + 1,
+                                  'text': text[start:start + length]})
+        return text, starts
+
+    def _flush(self, paragraph, state):
+        if not paragraph:
+            return
+        text, starts = self._phrases(paragraph, state)
+        sentences = []
+        for m in _SENTENCE.finditer(text):
+            sentence = m.group().strip()
+            if sentence:
+                k = bisect.bisect_right(starts, m.start() + len(m.group()) - len(m.group().lstrip())) - 1
+                sentences.append((paragraph[k][0], sentence))
+        self._short_sentences(sentences, state)
+        state['sentences'] += sentences
+        state['paragraphs'].append((paragraph[0][0], len(sentences), sentences[0][1] if sentences else ''))
+        del paragraph[:]
+
+    def _short_sentences(self, sentences, state):
+        limit, run = self.rules['short_sentence_chars'], self.rules['short_sentence_run']
+        streak = []
+        for sentence in sentences + [(None, None)]:
+            if sentence[1] is not None and len(sentence[1]) < limit:
+                streak.append(sentence)
+                continue
+            if len(streak) >= run:
+                self._hit(state, 'short-sentences', streak)
+            streak = []
+
+    def _end_run(self, state, heading=False):
+        """문장·문단 흐름이 끊길 때 — 쌓인 문장의 종결 어미 반복과 문단 분절 판단"""
+        run = self.rules['monotone_run']
+        streak = []
+        for sentence in state['sentences'] + [(None, '')]:
+            if sentence[1].rstrip('.!?。"\')]').endswith(self.endings):
+                streak.append(sentence)
+                continue
+            if len(streak) >= run:
+                self._hit(state, 'monotone-ending', streak)
+            streak = []
+        state['sentences'] = []
+        if not heading:
+            return      # 목록/표 사이의 문단도 같은 흐름으로 봄
+        minimum, run = self.rules['min_paragraph_sentences'], self.rules['short_paragraph_run']
+        streak = []
+        for number, count, first in state['paragraphs'] + [(None, minimum, '')]:
+            if count < minimum:
+                streak.append((number, first))
+                continue
+            if len(streak) >= run:
+                self._hit(state, 'short-paragraphs', streak)
+            streak = []
+        state['paragraphs'] = []
+
+    @staticmethod
+    def _hit(state, category, streak):
+        number, first = streak[0]
+        state['hits'].append({'rule': category, 'line': number, 'col': 1,
+                              'text': first[:40], 'run': len(streak)})
+
+    def _result(self, state):
+        hits = state['hits']
+        # 전환어는 같은 단어가 한도 이상 나왔을 때만 위반
+        counts = {}
+        for hit in hits:
+            counts[hit['rule']] = counts.get(hit['rule'], 0) + 1
+        limit = self.rules['transition_limit']
+        hits = [hit for hit in hits
+                if not hit['rule'].startswith('transition:') or counts[hit['rule']] >= limit]
+        hits.sort(key=lambda hit: (hit['line'], hit['col']))
+        counts = {}
+        for hit in hits:
+            counts[hit['rule']] = counts.get(hit['rule'], 0) + 1
+        return {'counts': dict(sorted(counts.items())), 'hits': hits}
+
+
+# ============================================================
+# 파일 / 프로세스 풀
+# ============================================================
+_LINTER = None
+
+
+def init_worker(rules):
+    global _LINTER
+    _LINTER = Linter(rules)
+
+
+def lint_file(path):
+    """파일 하나 검사 — 한 줄씩 읽음"""
+    with open(path, encoding='utf-8', errors='replace') as f:
+        result = _LINTER.lint_lines(f)
+    return {'path': path, 'bytes': os.path.getsize(path), **result}
+
+
+def iter_paths(inputs):
+    """파일과 폴더(하위의 .md/.txt) — 폴더 안은 이름순"""
+    for path in inputs:
+        if os.path.isdir(path):
+            for dirpath, dirnames, filenames in os.walk(path):
+                dirnames.sort()
+                for filename in sorted(filenames):
+                    if filename.endswith(TEXT_EXTENSIONS):
+                        yield os.path.join(dirpath, filename)
+        else:
+            yield path
+
+
+# 프로세스 간 왕복을 줄이려고 파일을 이만큼씩 묶어 보냄
+CHUNK_SIZE = 16
+
+
+def lint_paths(paths, rules, jobs=1):
+    """결과를 입력 순서대로 내보냄 — jobs > 1이면 프로세스 풀"""
+    if jobs <= 1:
+        init_worker(rules)
+        yield from map(lint_file, paths)
+        return
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=jobs, initializer=init_worker, initargs=(rules,)) as pool:
+        yield from pool.map(lint_file, paths, chunksize=CHUNK_SIZE)
+
+
+def list_rules(rules):
+    for rule, category, phrase, boundary in rules['phrases']:
+        print(f"{CATEGORIES[category]:<8} {phrase}" + ("  (단어 시작)" if boundary else ""))
+    for key in DEFAULTS:
+        print(f"{key} = {rules[key]}")
+    print(f"\n구절 {len(rules['phrases'])}개")
+
+
+def summary(totals, docs, total_bytes, elapsed, jobs, out=sys.stderr):
+    print(f"\n{'규칙':<32} {'건수':>7} {'문서':>6}", file=out)
+    for rule, (count, in_docs) in sorted(totals.items(), key=lambda item: -item[1][0]):
+        print(f"{rule:<32} {count:>7,} {in_docs:>6,}", file=out)
+    mb = total_bytes / 1e6
+    print(f"\n문서 {docs:,}개, {mb:.2f} MB, {elapsed:.2f}s — {mb / max(elapsed, 1e-9):.1f} MB/s "
+          f"(프로세스 {jobs}개)", file=out)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='5장/글쓰기 가이드 규칙으로 AI투 문체 검사')
+    parser.add_argument('paths', nargs='*', help='검사할 파일 또는 폴더 (.md/.txt)')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1,
+                        help='검사 프로세스 수 (기본: CPU 코어 수)')
+    parser.add_argument('-o', '--output', metavar='PATH',
+                        help='JSONL 결과 파일 (기본: 표준 출력)')
+    parser.add_argument('--rules-from', action='append', metavar='MD',
+                        help='규칙을 읽을 마크다운 (기본: 5장과 한국어 글쓰기 가이드 / 반복 가능)')
+    parser.add_argument('--list-rules', action='store_true',
+                        help='읽은 규칙만 출력')
+    parser.add_argument('--no-hits', action='store_true',
+                        help='JSONL에 위치 없이 규칙별 개수만 기록')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    rules = load_rules(args.rules_from)
+    if args.list_rules:
+        list_rules(rules)
+        return 0
+    if not args.paths:
+        raise SystemExit('검사할 파일이나 폴더를 지정하세요 (--list-rules로 규칙 확인)')
+    paths = list(iter_paths(args.paths))
+    jobs = max(1, min(args.jobs, len(paths)))
+    out = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    totals = {}
+    total_bytes = 0
+    start = time.perf_counter()
+    try:
+        for result in lint_paths(paths, rules, jobs):
+            total_bytes += result['bytes']
+            for rule, count in result['counts'].items():
+                n, docs = totals.get(rule, (0, 0))
+                totals[rule] = (n + count, docs + 1)
+            if args.no_hits:
+                del result['hits']
+            out.write(json.dumps(result, ensure_ascii=False) + '\n')
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    summary(totals, len(paths), total_bytes, time.perf_counter() - start, jobs)
+    return 1 if totals else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -3,29 +3,328 @@
 참조: 한정님 블로그/fig_server_internal-1.png
 흰색 배경 + 카테고리 색상 테두리, SVG 출력
 """
-import matplotlib
-matplotlib.use('Agg')
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
-from matplotlib.patches import FancyBboxPatch, FancyArrowPatch
-import numpy as np
+import argparse
+import ast
+import contextlib
+import functools
+import hashlib
+import importlib.util
+import inspect
+import json
+import io
+import math
 import os
+import platform
+import re
+import resource
+import sys
+import tempfile
+import threading
+import time
+import traceback
+
+import site_pages
+import svg_native
+import svg_optimize
+import svg_sprite
+import text_metrics
 
 # ============================================================
 # 공통 설정
 # ============================================================
-BASE_DIR = os.path.join(os.path.dirname(__file__), '..', 'docs', 'assets', 'images', 'figures')
-
-# 챕터별 출력 폴더
-CHAPTER_DIRS = {}
-for ch in ['index', 'ch01', 'ch02', 'ch03', 'ch04', 'ch05']:
-    d = os.path.join(BASE_DIR, ch)
-    os.makedirs(d, exist_ok=True)
-    CHAPTER_DIRS[ch] = d
-
-# 한국어 폰트 설정
-plt.rcParams['font.family'] = 'Apple SD Gothic Neo'
-plt.rcParams['axes.unicode_minus'] = False
+ROOT_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+DOCS_DIR = os.path.join(ROOT_DIR, 'docs')
+BASE_DIR = os.path.join(DOCS_DIR, 'assets', 'images', 'figures')
+CACHE_DIR = os.path.join(ROOT_DIR, '.diagram-cache')
+
+# 챕터별 출력 폴더 (BASE_DIR/<챕터>) — 실제로 파일을 쓸 때 만든다
+CHAPTERS = ('index', 'ch01', 'ch02', 'ch03', 'ch04', 'ch05')
+
+# matplotlib/numpy는 렌더링이 실제로 필요할 때 setup_matplotlib()에서 import
+# (--list, --dry-run, 캐시 확인, native 엔진은 matplotlib 없이 동작)
+# pyplot은 쓰지 않는다 — Figure를 직접 만들어 전역 그림 목록 없이 스레드에서도 렌더링
+matplotlib = np = Figure = Circle = FancyBboxPatch = Line2D = LineCollection = PolyCollection = None
+
+
+# 한국어 글꼴 후보 — 앞에서부터 설치되어 있고 한글을 지원하는 첫 글꼴을 쓴다
+# (macOS: Apple SD Gothic Neo, Linux 빌드 호스트: Noto Sans KR/CJK, 나눔고딕)
+KOREAN_FONT_CHAIN = ['Apple SD Gothic Neo', 'Noto Sans KR', 'Noto Sans CJK KR',
+                     'NanumGothic', 'Nanum Gothic']
+FONT_CACHE_PATH = os.path.join(CACHE_DIR, 'font.json')
+# 한글 지원 확인용 — 대표 음절 + 완성형 음절 최소 개수(KS X 1001 2,350자)
+HANGUL_PROBE = '가나다라마바사아자차카타파하각힣'
+HANGUL_MIN_SYLLABLES = 2350
+
+# 렌더링 공통 설정 (캐시 키에도 포함)
+RC_PARAMS = {
+    'axes.unicode_minus': False,
+    # clip-path 등 SVG id를 고정 — 같은 입력이면 같은 바이트
+    'svg.hashsalt': 'ai-humanities-book',
+}
+
+
+# 글자 출력 방식 — 'path'(글리프 윤곽선 인라인) 또는 'text'(<text> 요소 + 웹 글꼴)
+TEXT_MODE = 'path'
+TEXT_MODES = ('path', 'text')
+
+# text 모드 SVG의 font-family — 사이트 본문 글꼴(mkdocs.yml의 Noto Sans KR)을 먼저,
+# <img>로 넣은 SVG는 페이지 웹 글꼴을 쓸 수 없으므로 시스템 한글 글꼴로 폴백.
+# 배치(글자 폭 측정)와 래스터는 path 모드처럼 resolve_korean_font()의 글꼴로 하고,
+# 저장한 SVG의 font-family만 이 목록 + 그 글꼴로 바꾼다 (web_font_family).
+WEB_FONT_FAMILY = ['Noto Sans KR', 'Apple SD Gothic Neo', 'Malgun Gothic', 'sans-serif']
+TEXT_RC_PARAMS = {
+    'svg.fonttype': 'none',
+}
+_FONT_FAMILY_DECL = re.compile(r"font-family:[^;\"]*")
+
+
+def web_font_family(data):
+    """text 모드 SVG의 font-family 선언을 WEB_FONT_FAMILY + 배치에 쓴 한글 글꼴로
+    (일반 글꼴 이름 sans-serif는 맨 뒤)"""
+    family = resolve_korean_font()[0]
+    names = [f for f in WEB_FONT_FAMILY if f != 'sans-serif']
+    names += [family] if family not in names else []
+    stack = ', '.join(f"'{f}'" if ' ' in f else f for f in names + ['sans-serif'])
+    return _FONT_FAMILY_DECL.sub(f'font-family:{stack}', data.decode('utf-8')).encode('utf-8')
+
+
+def rc_params():
+    """현재 TEXT_MODE에 맞는 rcParams 설정"""
+    if TEXT_MODE == 'text':
+        return {**RC_PARAMS, **TEXT_RC_PARAMS}
+    return RC_PARAMS
+
+
+def _hangul_coverage(path):
+    """글꼴 파일의 한글 음절 수 — 대표 음절이 하나라도 없으면 0"""
+    from matplotlib.ft2font import FT2Font
+    charmap = FT2Font(path).get_charmap()
+    if any(ord(ch) not in charmap for ch in HANGUL_PROBE):
+        return 0
+    return sum(1 for code in charmap if 0xAC00 <= code <= 0xD7A3)
+
+
+def _load_font_cache():
+    try:
+        with open(FONT_CACHE_PATH, encoding='utf-8') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if (cached.get('chain') != KOREAN_FONT_CHAIN
+            or cached.get('matplotlib') != matplotlib_version()):
+        return None
+    try:
+        if os.path.getmtime(cached['path']) != cached['mtime']:
+            return None
+    except (OSError, KeyError):
+        return None
+    return cached
+
+
+# 프로세스 안에서 한 번만 찾은 글꼴 (family, path)와 아직 출력하지 않은 보고 문구
+_KOREAN_FONT = None
+_FONT_REPORT = None
+
+
+def resolve_korean_font():
+    """KOREAN_FONT_CHAIN에서 한글을 지원하는 첫 글꼴을 찾아 (family, path) 반환
+    결과는 프로세스 안에서 재사용하고 .diagram-cache/font.json에도 저장한다."""
+    global _KOREAN_FONT, _FONT_REPORT
+    if _KOREAN_FONT is not None:
+        return _KOREAN_FONT
+    from matplotlib import font_manager
+    start = time.perf_counter()
+    cached = _load_font_cache()
+    if cached:
+        font_manager.fontManager.addfont(cached['path'])
+        family, path, source = cached['family'], cached['path'], '캐시'
+    else:
+        tried = []
+        for family in KOREAN_FONT_CHAIN:
+            try:
+                path = font_manager.findfont(font_manager.FontProperties(family=family),
+                                             fallback_to_default=False)
+            except ValueError:
+                tried.append(f'{family}: 없음')
+                continue
+            syllables = _hangul_coverage(path)
+            if syllables >= HANGUL_MIN_SYLLABLES:
+                break
+            tried.append(f'{family}: 한글 {syllables}자')
+        else:
+            raise RuntimeError('한글을 지원하는 글꼴을 찾지 못했습니다 ('
+                               + ', '.join(tried) + ') — Noto Sans KR 또는 나눔고딕을 설치하세요')
+        source = '탐색'
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(FONT_CACHE_PATH, 'w', encoding='utf-8') as f:
+            json.dump({'chain': KOREAN_FONT_CHAIN, 'matplotlib': matplotlib_version(),
+                       'family': family, 'path': path, 'mtime': os.path.getmtime(path)},
+                      f, ensure_ascii=False, indent=1)
+    elapsed = (time.perf_counter() - start) * 1000
+    _KOREAN_FONT = (family, path)
+    _FONT_REPORT = f"  글꼴: {family} ({path}) — {source} {elapsed:.1f}ms"
+    return _KOREAN_FONT
+
+
+def setup_matplotlib():
+    """matplotlib import + 한국어 폰트 등 렌더링 공통 설정
+    rcParams는 프로세스 전역이므로 렌더링을 시작하기 전에 한 번만 바꾼다."""
+    global matplotlib, np, Figure, Circle, FancyBboxPatch, Line2D, LineCollection, PolyCollection
+    global _MPL_READY
+    import matplotlib
+    from matplotlib.collections import LineCollection, PolyCollection
+    from matplotlib.figure import Figure
+    from matplotlib.lines import Line2D
+    from matplotlib.patches import Circle, FancyBboxPatch
+    import numpy as np
+    matplotlib.rcParams.update(rc_params())
+    # 실제로 한글이 있는 글꼴 하나만 지정 — path 모드는 그 윤곽선을 넣고,
+    # text 모드도 그 글꼴 폭으로 배치한 뒤 font-family만 웹 글꼴 목록으로 바꿈
+    matplotlib.rcParams['font.family'] = [resolve_korean_font()[0]]
+    _MPL_READY = True
+
+
+# setup_matplotlib()이 끝까지 성공했는지 (글꼴 탐색 실패 시 False로 남음)
+_MPL_READY = False
+_MPL_LOCK = threading.Lock()
+
+
+def ensure_matplotlib():
+    """아직 설정 전이면 setup_matplotlib() — 프로세스마다 한 번 (스레드 실행기에서도)"""
+    if not _MPL_READY:
+        with _MPL_LOCK:
+            if not _MPL_READY:
+                setup_matplotlib()
+
+
+def matplotlib_version():
+    """import 없이 설치된 matplotlib 버전 조회 (캐시 키용)"""
+    import importlib.metadata
+    try:
+        return importlib.metadata.version('matplotlib')
+    except importlib.metadata.PackageNotFoundError:
+        return 'missing'
+
+
+# 렌더링 엔진 — 'matplotlib' 또는 'native'(카드 프리미티브를 SVG로 직접 기록)
+# native에서도 make_axes를 쓰지 않는 차트(diagram_12 레이더)는 matplotlib으로 그린다.
+# native는 항상 <text> 요소로 글자를 쓴다.
+ENGINE = 'matplotlib'
+ENGINES = ('matplotlib', 'native')
+
+# save_fig 다음 단계의 SVG 최적화 설정 (None이면 끔)
+OPTIMIZE = dict(svg_optimize.DEFAULTS)
+
+# 래스터 내보내기 — save_fig(raster=True)인 그림(all이면 전부)을 Agg로 한 번 그려
+# 가장 큰 배율 이미지를 만든 뒤 작은 배율은 Pillow로 줄여 SVG 옆에 저장
+# (x.svg -> x.webp, x@2x.webp, x.png, x@2x.png)
+RASTER = {'all': False, 'formats': ['webp', 'png'], 'scales': [1, 2]}
+RASTER_DPI = 96             # 1x = SVG의 CSS 픽셀 크기
+RASTER_ENCODE = {
+    'webp': {'quality': 80, 'method': 6},
+    'png': {'optimize': True},
+}
+RASTER_PNG_COLORS = 128     # 플랫 색상 그림이라 팔레트 PNG로 충분 (None이면 RGB)
+
+# SVG마다 다크 모드 변형(x-dark.svg)도 저장 — 색상 치환만 하므로 다시 그리지 않음
+DARK_VARIANT = True
+
+# 정적 호스트가 그대로 내려보낼 사전 압축본 — x.svg 옆에 x.svg.gz, x.svg.br (최고 수준)
+# br은 brotli 모듈이 있을 때만 만든다.
+PRECOMPRESS = ['gz', 'br']
+PRECOMPRESS_FORMATS = ('gz', 'br')
+
+# 챕터 스프라이트 — 그림이 둘 이상인 챕터마다 sprite.svg(와 sprite-dark.svg)를 만들고
+# mkdocs 훅이 <img src="x.svg">를 <img src="sprite.svg#x">로 바꿈 (페이지당 요청 수와 중복 글리프 감소)
+SPRITE = False
+
+# 그림 크기 예산 — 기준(잠금 파일에 기록된 커밋 크기, 없으면 기존 파일)보다 이 비율 넘게
+# 커진 출력은 저장하되 매니페스트/잠금 파일에 넣지 않아 받아들일 때까지 매번 실패
+# (None이면 검사 안 함; build()가 --size-budget으로 설정)
+SIZE_BUDGET = None
+
+# 워커 프로세스에 그대로 전달할 실행 옵션
+WORKER_OPTIONS = ('ENGINE', 'TEXT_MODE', 'OPTIMIZE', 'RASTER', 'DARK_VARIANT', 'PRECOMPRESS',
+                  'BASE_DIR', 'KOREAN_FONT_CHAIN', 'SIZE_BUDGET')
+# main()이 명령줄로 바꾸는 전역 전부 — 감시 모드가 스크립트를 다시 읽은 뒤 그대로 복원
+# (SPRITE/EXECUTOR는 메인 프로세스에서만 쓰므로 워커에는 보내지 않음)
+CLI_OPTIONS = WORKER_OPTIONS + ('SPRITE', 'EXECUTOR')
+# 그중 출력 바이트와 무관해 캐시 키에서 빼는 옵션
+UNKEYED_OPTIONS = ('SIZE_BUDGET',)
+
+
+def current_options():
+    return {name: globals()[name] for name in WORKER_OPTIONS}
+
+
+def init_worker(options):
+    """프로세스 풀 워커 초기화 — 실행 옵션과 matplotlib 설정을 한 번만
+    native 엔진이면 matplotlib이 필요한 그림을 처음 만날 때까지 미룬다."""
+    globals().update(options)
+    if ENGINE == 'matplotlib':
+        # 실패(예: 한글 글꼴 없음)하면 그림마다 다시 시도해 그림별 오류로 보고
+        with contextlib.suppress(Exception):
+            setup_matplotlib()
+
+
+class JobState(threading.local):
+    """렌더링 작업 하나의 상태 — 스레드 실행기에서 동시에 도는 작업끼리 섞이지 않도록 스레드별"""
+
+    def __init__(self):
+        # 진행 로그 — 워커에서는 리스트에 모아 메인 프로세스가 순서대로 출력
+        self.log = None
+        # 렌더링 중 save_fig가 기록한 출력 파일 (ROOT_DIR 기준 상대 경로)
+        self.outputs = []
+        # save_fig가 기록한 크기 (상대 경로, 최적화 전, 최적화 후, 기준 크기 또는 None)
+        self.sizes = []
+        # SIZE_BUDGET을 넘은 출력 (상대 경로)
+        self.over = []
+        # 잠금 파일에 기록된 이 다이어그램의 출력 크기 {'/' 구분 상대 경로: 바이트}
+        self.baseline = {}
+        # dict이면 save_fig가 파일 대신 {상대 경로: SVG 바이트}로 모음 (보고서용)
+        self.sink = None
+        # 벤치마크 중에만 dict — 단계별 누적 시간(초)과 아티스트 수
+        self.phases = None
+
+
+_JOB = JobState()
+
+
+def log(msg):
+    if _JOB.log is None:
+        print(msg)
+    else:
+        _JOB.log.append(msg)
+
+
+@contextlib.contextmanager
+def phase(name):
+    """벤치마크 단계 시간 측정 (벤치마크가 아니면 아무 일도 하지 않음)"""
+    phases = _JOB.phases
+    if phases is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        phases[name] = phases.get(name, 0.0) + time.perf_counter() - start
+
+
+def timed(name):
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with phase(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def count_artists(fig):
+    if isinstance(fig, svg_native.Figure):
+        return len(fig.elements())
+    return sum(len(ax.get_children()) for ax in fig.axes)
 
 # ============================================================
 # 카테고리 색상 팔레트 (참조 이미지 스타일)
@@ -55,54 +354,409 @@ SUBTLE    = '#666666'
 GRAY_L    = '#E0E0E0'
 GRAY_M    = '#BDBDBD'
 
-
-def save_fig(fig, name, chapter='index'):
-    """SVG 저장 — 챕터별 폴더, pad_inches로 도형 잘림 방지"""
-    path = os.path.join(CHAPTER_DIRS[chapter], name)
-    fig.savefig(path, format='svg', bbox_inches='tight', pad_inches=0.3,
-                dpi=300, facecolor='white', edgecolor='none')
-    plt.close(fig)
-    print(f"  -> figures/{chapter}/{name}")
+# 다크 모드 변형 (x-dark.svg) — 렌더링된 SVG에서 이 색들만 바꿈
+# 배경은 Material slate 배경색, 채움은 어둡게, 글자와 선은 밝게. 범주 색(C_*)은 그대로.
+DARK_PALETTE = {
+    WHITE:     '#1E2029',   # 그림 배경, 카드 채움
+    BG_CARD:   '#272B38',
+    BG_RED:    '#3D2A2E',
+    BG_ORANGE: '#3D3128',
+    BG_PURPLE: '#362B40',
+    BG_GREEN:  '#2C3627',
+    BG_BLUE:   '#27324A',
+    DARK:      '#E3E5EA',
+    SUBTLE:    '#A9AEBA',
+    GRAY_L:    '#3C4150',
+    GRAY_M:    '#7A8090',
+    # matplotlib 기본값 (레이더 차트의 글자, 격자, 눈금, 범례 테두리)
+    '#000000': '#E3E5EA',
+    '#B0B0B0': '#4A5060',
+    '#999999': '#8A90A0',
+    '#CCCCCC': '#4A5060',
+}
+
+
+def write_if_changed(path, data):
+    """내용이 다를 때만 원자적으로 교체 — 실제로 썼으면 True"""
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                return False
+    except FileNotFoundError:
+        mode = 0o644
+    else:
+        mode = os.stat(path).st_mode & 0o777
+    # mkstemp는 0600으로 만들므로 기존 파일 권한(없으면 0644)을 유지
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.tmp-')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return True
+
+
+def dark_name(name):
+    """'x.svg' -> 'x-dark.svg'"""
+    stem, ext = os.path.splitext(name)
+    return f'{stem}-dark{ext}'
+
+
+def dark_variant(data):
+    """최적화까지 마친 SVG -> 다크 모드 SVG (DARK_PALETTE로 색만 치환, 다시 그리지 않음)"""
+    return svg_optimize.recolor(data, DARK_PALETTE, default_fill=DARK_PALETTE['#000000'])
+
+
+def raster_name(name, fmt, scale):
+    """'x.svg' -> 'x.webp'(1x), 'x@2x.webp'"""
+    stem = os.path.splitext(name)[0]
+    suffix = '' if scale == 1 else f'@{scale:g}x'
+    return f'{stem}{suffix}.{fmt}'
+
+
+def render_rasters(fig):
+    """Agg로 가장 큰 배율을 한 번 그리고 나머지는 줄여서 — {(형식, 배율): 바이트}"""
+    from PIL import Image       # matplotlib 의존성이라 항상 있음
+    scales = sorted(set(RASTER['scales']), reverse=True)
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', bbox_inches='tight', pad_inches=0.3,
+                dpi=RASTER_DPI * scales[0], facecolor='white', edgecolor='none',
+                pil_kwargs={'compress_level': 0})     # 바로 다시 읽을 중간 버퍼라 압축 안 함
+    full = Image.open(buf).convert('RGB')
+    rasters = {}
+    for scale in scales:
+        image = full
+        if scale != scales[0]:
+            ratio = scale / scales[0]
+            image = full.resize((max(1, round(full.width * ratio)),
+                                 max(1, round(full.height * ratio))), Image.LANCZOS)
+        for fmt in RASTER['formats']:
+            out = io.BytesIO()
+            encoded = image
+            if fmt == 'png' and RASTER_PNG_COLORS:
+                encoded = image.quantize(RASTER_PNG_COLORS, dither=Image.Dither.NONE)
+            encoded.save(out, format=fmt.upper(), **RASTER_ENCODE[fmt])
+            rasters[fmt, scale] = out.getvalue()
+    return dict(sorted(rasters.items(), key=lambda item: item[0][1]))
+
+
+def _codec(fmt):
+    """사전 압축 형식 -> (압축, 해제) 함수, 모듈이 없으면 None"""
+    if fmt == 'gz':
+        import gzip
+        # mtime=0 — 같은 SVG면 같은 .gz 바이트
+        return functools.partial(gzip.compress, compresslevel=9, mtime=0), gzip.decompress
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return functools.partial(brotli.compress, quality=11), brotli.decompress
+
+
+def missing_codecs():
+    """PRECOMPRESS 중 모듈이 없어 만들 수 없는 형식 (예: brotli 없으면 ['br'])"""
+    return [fmt for fmt in PRECOMPRESS if _codec(fmt) is None]
+
+
+def precompress(path, data):
+    """path 옆에 PRECOMPRESS 형식의 압축본 저장 — 압축본 경로 목록 반환
+    기존 압축본을 풀어 data와 같으면 다시 압축하지 않는다 (해제가 압축보다 훨씬 쌈).
+    모듈이 없어 만들 수 없는 형식의 기존 압축본은 내용이 달라졌을 수 있으므로 지운다."""
+    targets = []
+    for fmt in PRECOMPRESS:
+        codec = _codec(fmt)
+        target = f'{path}.{fmt}'
+        if codec is None:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(target)
+            continue
+        compress, decompress = codec
+        try:
+            with open(target, 'rb') as f:
+                fresh = decompress(f.read()) == data
+        except Exception:       # 없거나 깨진 압축본
+            fresh = False
+        if not fresh:
+            write_if_changed(target, compress(data))
+        targets.append(target)
+    return targets
+
+
+def _emit(chapter, name, data, raw_size):
+    """출력 하나를 싱크나 파일로 보냄 — 파일은 바이트가 다를 때만 교체"""
+    path = os.path.join(BASE_DIR, chapter, name)
+    rel = os.path.relpath(path, ROOT_DIR)
+    if _JOB.sink is not None:
+        _JOB.sink[rel] = data
+        return
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    previous = _JOB.baseline.get(rel.replace(os.sep, '/'))
+    if previous is None and os.path.exists(path):
+        previous = os.path.getsize(path)
+    _JOB.sizes.append((rel, raw_size, len(data), previous))
+    if SIZE_BUDGET is not None and previous and len(data) / previous - 1 > SIZE_BUDGET:
+        _JOB.over.append(rel)
+        log(f"  !! figures/{chapter}/{name} 크기 예산 초과: 기준 {previous:,} -> {len(data):,} bytes")
+    written = write_if_changed(path, data)
+    _JOB.outputs.append(rel)
+    log(f"  -> figures/{chapter}/{name}" + ("" if written else "  (변경 없음)"))
+    if PRECOMPRESS and name.endswith('.svg'):
+        with phase('compress'):
+            _JOB.outputs.extend(os.path.relpath(t, ROOT_DIR) for t in precompress(path, data))
+
+
+def save_fig(fig, name, chapter='index', raster=False):
+    """SVG 저장 — 챕터별 폴더, pad_inches로 도형 잘림 방지
+    메모리에서 렌더링한 뒤 기존 파일과 바이트가 다를 때만 교체한다.
+    DARK_VARIANT면 색만 바꾼 다크 모드 SVG를, raster=True(또는 RASTER['all'])면
+    같은 그림의 WebP/PNG도 배율별로 저장."""
+    if chapter not in CHAPTERS:
+        raise ValueError(f"알 수 없는 챕터: {chapter}")
+    native = isinstance(fig, svg_native.Figure)
+    if _JOB.phases is not None:
+        _JOB.phases['artists_count'] = _JOB.phases.get('artists_count', 0) + count_artists(fig)
+    with phase('savefig'):
+        if native:
+            data = fig.to_svg(pad_inches=0.3, facecolor=WHITE)
+        else:
+            buf = io.BytesIO()
+            fig.savefig(buf, format='svg', bbox_inches='tight', pad_inches=0.3,
+                        facecolor='white', edgecolor='none',
+                        metadata={'Date': None})
+            data = buf.getvalue()
+            if TEXT_MODE == 'text':
+                data = web_font_family(data)
+    rasters = {}
+    if (raster or RASTER['all']) and RASTER['formats']:
+        if native:
+            log(f"  (native 엔진 그림이라 {name} 래스터는 건너뜀)")
+        else:
+            with phase('raster'):
+                rasters = render_rasters(fig)
+    raw_size = len(data)
+    if OPTIMIZE is not None:
+        with phase('optimize'):
+            data = svg_optimize.optimize(data, **OPTIMIZE)
+    _emit(chapter, name, data, raw_size)
+    if DARK_VARIANT:
+        with phase('dark'):
+            dark = dark_variant(data)
+        _emit(chapter, dark_name(name), dark, len(dark))
+    for (fmt, scale), image in rasters.items():
+        _emit(chapter, raster_name(name, fmt, scale), image, len(image))
 
 
 def rounded_box(ax, x, y, w, h, fill, border, text='', fontsize=11,
-                text_color=None, lw=1.2):
+                text_color=None, lw=1.2, pad=0.15, zorder=2):
     """둥근 모서리 박스 — fill(배경)과 border(테두리) 분리"""
     if text_color is None:
         text_color = border
-    box = FancyBboxPatch((x, y), w, h,
-                         boxstyle="round,pad=0.15",
-                         facecolor=fill, edgecolor=border,
-                         linewidth=lw, zorder=2)
-    ax.add_patch(box)
+    if isinstance(ax, svg_native.Axes):
+        ax.box(x, y, w, h, pad, fill, border, lw, zorder)
+    else:
+        box = FancyBboxPatch((x, y), w, h,
+                             boxstyle=f"round,pad={pad}",
+                             facecolor=fill, edgecolor=border,
+                             linewidth=lw, zorder=zorder)
+        ax.add_patch(box)
     if text:
         ax.text(x + w/2, y + h/2, text, ha='center', va='center',
                 fontsize=fontsize, color=text_color, fontweight='bold', zorder=3)
 
 
+def circle(ax, x, y, r, fill, border, lw=1.5, zorder=3):
+    """원 — 데이터 좌표 반지름 (축 비율에 따라 타원)"""
+    if isinstance(ax, svg_native.Axes):
+        ax.circle(x, y, r, fill, border, lw, zorder)
+    else:
+        ax.add_patch(Circle((x, y), r, color=fill, ec=border, lw=lw, zorder=zorder))
+
+
+def arrow(ax, start, end, color, lw=1.5):
+    """start에서 end로 향하는 직선 화살표 (arrowstyle='->')"""
+    if isinstance(ax, svg_native.Axes):
+        ax.arrow(start, end, color, lw, zorder=3)
+    else:
+        ax.annotate('', xy=end, xytext=start,
+                    arrowprops=dict(arrowstyle='->', color=color, lw=lw))
+
+
+# make_axes가 xlim/ylim 바깥에 두는 여백 (범위 대비 x, y)
+AXES_MARGIN = (0.05, 0.08)
+
+
+def axes_scale(figsize, xlim, ylim):
+    """make_axes 좌표계에서 데이터 1단위당 포인트 (x, y) — 기본 subplot 위치 기준"""
+    span_x = (xlim[1] - xlim[0]) * (1 + 2 * AXES_MARGIN[0])
+    span_y = (ylim[1] - ylim[0]) * (1 + 2 * AXES_MARGIN[1])
+    width = figsize[0] * svg_native.PT_PER_INCH * (svg_native.SUBPLOT_RIGHT - svg_native.SUBPLOT_LEFT)
+    height = figsize[1] * svg_native.PT_PER_INCH * (svg_native.SUBPLOT_TOP - svg_native.SUBPLOT_BOTTOM)
+    return width / span_x, height / span_y
+
+
+def measure_text(text, fontsize, weight='normal'):
+    """글자를 그리지 않고 (폭, 높이) pt — 엔진과 무관하게 해석된 한글 글꼴의 advance 표
+    (native 엔진도 같은 값으로 배치하므로 --check-text 판정과 카드 크기가 엔진마다 같음)"""
+    from matplotlib import font_manager
+    path = font_manager.findfont(font_manager.FontProperties(
+        family=resolve_korean_font()[0], weight=weight))
+    return text_metrics.text_extent(path, text, fontsize)
+
+
+@timed('make_axes')
 def make_axes(figsize, xlim, ylim, title):
     """공통 Figure + Axes 생성 — 연한 블루그레이 카드 배경"""
-    fig, ax = plt.subplots(figsize=figsize)
-    margin_x = (xlim[1] - xlim[0]) * 0.05
-    margin_y = (ylim[1] - ylim[0]) * 0.08
+    if ENGINE == 'native':
+        fig = svg_native.Figure(figsize, WEB_FONT_FAMILY, measure=measure_text)
+        ax = fig.add_subplot()
+    else:
+        ensure_matplotlib()
+        fig = Figure(figsize=figsize)
+        ax = fig.add_subplot()
+    margin_x = (xlim[1] - xlim[0]) * AXES_MARGIN[0]
+    margin_y = (ylim[1] - ylim[0]) * AXES_MARGIN[1]
     ax.set_xlim(xlim[0] - margin_x, xlim[1] + margin_x)
     ax.set_ylim(ylim[0] - margin_y, ylim[1] + margin_y)
     ax.axis('off')
 
     # 연한 블루그레이 카드 배경
-    card = FancyBboxPatch(
-        (xlim[0] - margin_x * 0.5, ylim[0] - margin_y * 0.3),
-        (xlim[1] - xlim[0]) + margin_x,
-        (ylim[1] - ylim[0]) + margin_y * 0.6,
-        boxstyle="round,pad=0.3",
-        facecolor=BG_CARD, edgecolor=GRAY_L, linewidth=0.8, zorder=0
-    )
-    ax.add_patch(card)
+    rounded_box(ax, xlim[0] - margin_x * 0.5, ylim[0] - margin_y * 0.3,
+                (xlim[1] - xlim[0]) + margin_x,
+                (ylim[1] - ylim[0]) + margin_y * 0.6,
+                BG_CARD, GRAY_L, lw=0.8, pad=0.3, zorder=0)
 
     ax.set_title(title, fontsize=14, fontweight='bold', color=DARK, pad=18)
     return fig, ax
 
 
+def make_polar_axes(figsize):
+    """극좌표 Figure + Axes — 항상 matplotlib"""
+    ensure_matplotlib()
+    fig = Figure(figsize=figsize)
+    return fig, fig.add_subplot(projection='polar')
+
+
+# ============================================================
+# 레이더 차트 — 프로필 N개를 컬렉션 몇 개로
+# ============================================================
+# 색을 지정하지 않은 레이더 프로필에 차례로 씀
+RADAR_COLORS = [C_BLUE, C_PURPLE, C_GREEN, C_ORANGE, C_RED, GRAY_M]
+# 이보다 많은 프로필은 꼭짓점 표시와 범례를 생략하고 선을 가늘게 (겹쳐 그리기)
+RADAR_DETAIL_MAX = 12
+RADAR_MODES = ('overlay', 'grid')
+# 작은 배수(grid) 배치 — 칸 크기(인치), 열 수 상한, 칸 안 레이더 반지름(칸 대비)
+RADAR_CELL = 1.7
+RADAR_GRID_COLS = 10
+RADAR_CELL_RADIUS = 0.34
+
+
+def radar_colors(profiles):
+    """프로필마다 색 — None이면 RADAR_COLORS를 차례로"""
+    return [color or RADAR_COLORS[i % len(RADAR_COLORS)]
+            for i, (_, _, color) in enumerate(profiles)]
+
+
+def radar_vertices(values):
+    """(N, 축 수) 점수 -> 닫힌 다각형 꼭짓점 (N, 축 수 + 1, 2) (각도, 반지름)
+    첫 축이 12시 방향, 시계 방향 — 극좌표 축의 offset/direction과 짝을 이룸."""
+    values = np.asarray(values, dtype=float)
+    angles = np.linspace(0, 2 * np.pi, values.shape[1], endpoint=False)
+    closed = np.concatenate([values, values[:, :1]], axis=1)
+    return np.stack([np.broadcast_to(np.append(angles, 0.0), closed.shape), closed], axis=-1)
+
+
+def radar_chart(ax, categories, profiles, title, vmax=5):
+    """극좌표 축에 프로필 여러 개를 겹쳐 그림 — profiles: [(이름, 축별 점수, 색 또는 None)]
+    다각형 채움, 테두리, 꼭짓점을 각각 컬렉션 하나로 그려 프로필 수와 무관하게 아티스트 수가 같다.
+    점수 눈금은 1..vmax."""
+    angles = np.linspace(0, 2 * np.pi, len(categories), endpoint=False)
+    ax.set_theta_offset(np.pi / 2)
+    ax.set_theta_direction(-1)
+    ax.set_rlabel_position(0)
+    ax.set_ylim(0, vmax)
+    ticks = list(range(1, vmax + 1))
+    ax.set_yticks(ticks)
+    ax.set_yticklabels([str(t) for t in ticks], fontsize=8, color='#999')
+    ax.set_xticks(angles)
+    ax.set_xticklabels(categories, fontsize=11, fontweight='bold')
+    ax.set_title(title, fontsize=14, fontweight='bold', color=DARK, pad=20)
+    if not profiles:
+        return
+
+    verts = radar_vertices([values for _, values, _ in profiles])
+    colors = radar_colors(profiles)
+    detail = len(profiles) <= RADAR_DETAIL_MAX
+    linewidth = 1.8 if detail else 0.8
+    ax.add_collection(PolyCollection(verts, facecolors=colors, edgecolors='none', alpha=0.08,
+                                     closed=True))
+    ax.add_collection(LineCollection(verts, colors=colors, linewidths=linewidth))
+    if not detail:
+        return
+    points = verts[:, :-1].reshape(-1, 2)
+    ax.scatter(points[:, 0], points[:, 1], s=36, c=np.repeat(colors, len(categories)), zorder=3)
+    handles = [Line2D([], [], marker='o', linewidth=linewidth, color=color) for color in colors]
+    ax.legend(handles, [name for name, _, _ in profiles],
+              loc='upper right', bbox_to_anchor=(1.35, 1.1), fontsize=9)
+
+
+def radar_grid(categories, profiles, title, vmax=5, cols=None, reference=True):
+    """작은 배수 — 프로필마다 칸 하나의 레이더, 데카르트 축 하나에 전부
+    눈금 거미줄·축선·다각형·(reference면 전체 평균) 윤곽을 각각 컬렉션 하나로 그리고,
+    축 이름은 첫 칸에만 단다. -> (fig, ax)"""
+    ensure_matplotlib()
+    n, k = len(profiles), len(categories)
+    cols = cols or min(RADAR_GRID_COLS, max(n, 1))
+    rows = -(-n // cols) if n else 1
+    fig = Figure(figsize=(cols * RADAR_CELL, rows * RADAR_CELL + 0.6))
+    ax = fig.add_subplot()
+    ax.set_xlim(0, cols)
+    ax.set_ylim(-rows, 0)
+    ax.set_aspect('equal')
+    ax.axis('off')
+    ax.set_title(title, fontsize=14, fontweight='bold', color=DARK, pad=12)
+    if not n:
+        return fig, ax
+
+    # 칸 중심 (N, 1, 2) — 이름이 들어갈 위쪽 여백만큼 아래로
+    index = np.arange(n)
+    centers = np.stack([index % cols + 0.5, -(index // cols) - 0.55], axis=-1)[:, None, :]
+    angles = np.append(np.linspace(0, 2 * np.pi, k, endpoint=False), 0.0)
+    unit = np.stack([np.sin(angles), np.cos(angles)], axis=-1) * RADAR_CELL_RADIUS / vmax
+
+    def cartesian(radii):
+        """(N, 축 수 + 1) 반지름 -> (N, 축 수 + 1, 2) 칸 좌표"""
+        return centers + radii[..., None] * unit
+
+    levels = np.arange(1, vmax + 1, dtype=float)
+    web = (centers[:, None] + levels[None, :, None, None] * unit).reshape(-1, k + 1, 2)
+    spokes = np.stack([np.broadcast_to(centers, (n, k, 2)),
+                       cartesian(np.full((n, k + 1), float(vmax)))[:, :-1]], axis=2).reshape(-1, 2, 2)
+    ax.add_collection(LineCollection(web, colors=GRAY_L, linewidths=0.4))
+    ax.add_collection(LineCollection(spokes, colors=GRAY_L, linewidths=0.4))
+
+    values = radar_vertices([values for _, values, _ in profiles])[..., 1]
+    if reference:
+        mean = np.broadcast_to(values.mean(axis=0), values.shape)
+        ax.add_collection(LineCollection(cartesian(mean), colors=SUBTLE, linewidths=0.6,
+                                         linestyles='--'))
+    polygons = cartesian(values)
+    colors = radar_colors(profiles)
+    ax.add_collection(PolyCollection(polygons, facecolors=colors, edgecolors='none', alpha=0.2,
+                                     closed=True))
+    ax.add_collection(LineCollection(polygons, colors=colors, linewidths=1.0))
+
+    for (name, _, _), (cx, cy) in zip(profiles, centers[:, 0]):
+        ax.text(cx, cy + RADAR_CELL_RADIUS * 1.18 + 0.07, name, ha='center', va='bottom',
+                fontsize=8, color=DARK)
+    label_at = cartesian(np.full((1, k + 1), vmax * 1.18))[0, :-1]
+    for label, (x, y) in zip(categories, label_at):
+        ax.text(x, y, label, ha='center', va='center', fontsize=6, color=SUBTLE)
+    return fig, ax
+
+
 # ============================================================
 # 1. digital-humanities-timeline.svg
 # ============================================================
@@ -118,15 +772,13 @@ def diagram_01():
     ]
 
     for i, (x, era, desc, color, bg) in enumerate(eras):
-        circle = plt.Circle((x + 0.5, 1.8), 0.38, color=bg, ec=color, lw=1.5, zorder=3)
-        ax.add_patch(circle)
+        circle(ax, x + 0.5, 1.8, 0.38, bg, color, lw=1.5, zorder=3)
         ax.text(x + 0.5, 1.8, era, ha='center', va='center',
                 fontsize=9, fontweight='bold', color=color, zorder=4)
         ax.text(x + 0.5, 0.7, desc, ha='center', va='center',
                 fontsize=9, color=DARK)
         if i < len(eras) - 1:
-            ax.annotate('', xy=(eras[i+1][0], 1.8), xytext=(x + 1.0, 1.8),
-                        arrowprops=dict(arrowstyle='->', color=GRAY_M, lw=1.5))
+            arrow(ax, (x + 1.0, 1.8), (eras[i+1][0], 1.8), GRAY_M, lw=1.5)
 
     save_fig(fig, 'digital-humanities-timeline.svg', 'ch01')
 
@@ -146,9 +798,7 @@ def diagram_02():
     ]
 
     for x, y, w, h, fill, border, label, desc in layers:
-        box = FancyBboxPatch((x, y), w, h, boxstyle="round,pad=0.1",
-                             facecolor=fill, edgecolor=border, linewidth=1.5)
-        ax.add_patch(box)
+        rounded_box(ax, x, y, w, h, fill, border, pad=0.1, lw=1.5)
         ax.text(x + w/2, y + h/2 + 0.12, label, ha='center', va='center',
                 fontsize=12, fontweight='bold', color=border)
         ax.text(x + w/2, y + h/2 - 0.22, desc, ha='center', va='center',
@@ -157,32 +807,6 @@ def diagram_02():
     save_fig(fig, 'ai-hierarchy-pyramid.svg', 'ch02')
 
 
-# ============================================================
-# 3. ai-landscape-grid.svg
-# ============================================================
-def diagram_03():
-    fig, ax = make_axes((9, 6.5), (-0.3, 9.8), (-0.3, 5.8),
-                        'AI가 바꾸는 인문학 4영역')
-
-    cards = [
-        (0.5, 3, '글쓰기와 창작', 'AI와 함께 소설, 시,\n에세이를 쓰고\n문체를 실험', C_BLUE, BG_BLUE),
-        (5.0, 3, '텍스트 분석', '수천 편의 문학 작품을\n분석하고 패턴을 발견', C_PURPLE, BG_PURPLE),
-        (0.5, 0.2, '번역과 소통', '언어의 장벽을 넘어\n다양한 문화를 탐색', C_GREEN, BG_GREEN),
-        (5.0, 0.2, '시각적 스토리텔링', '텍스트를 이미지로 변환\n새로운 표현 방식 탐구', C_ORANGE, BG_ORANGE),
-    ]
-
-    for x, y, title, desc, color, bg in cards:
-        box = FancyBboxPatch((x, y), 3.8, 2.3, boxstyle="round,pad=0.2",
-                             facecolor=WHITE, edgecolor=color, linewidth=1.5)
-        ax.add_patch(box)
-        ax.text(x + 1.9, y + 1.75, title, ha='center', va='center',
-                fontsize=12, fontweight='bold', color=color)
-        ax.text(x + 1.9, y + 0.8, desc, ha='center', va='center',
-                fontsize=9, color=SUBTLE)
-
-    save_fig(fig, 'ai-landscape-grid.svg', 'ch01')
-
-
 # ============================================================
 # 4. search-vs-generative.svg
 # ============================================================
@@ -200,8 +824,7 @@ def diagram_04():
             fontsize=9, color=SUBTLE)
 
     # 화살표
-    ax.annotate('', xy=(6.0, 2.1), xytext=(5.0, 2.1),
-                arrowprops=dict(arrowstyle='->', color=DARK, lw=2))
+    arrow(ax, (5.0, 2.1), (6.0, 2.1), DARK, lw=2)
     ax.text(5.5, 2.6, 'vs', ha='center', va='center',
             fontsize=14, fontweight='bold', color=DARK)
 
@@ -235,17 +858,14 @@ def diagram_05():
     ]
 
     for x, era, desc, color, bg in eras:
-        box = FancyBboxPatch((x, 0.3), 3.2, 2.5, boxstyle="round,pad=0.15",
-                             facecolor=WHITE, edgecolor=color, linewidth=1.5)
-        ax.add_patch(box)
+        rounded_box(ax, x, 0.3, 3.2, 2.5, WHITE, color, pad=0.15, lw=1.5)
         ax.text(x + 1.6, 2.1, era, ha='center', va='center',
                 fontsize=10, fontweight='bold', color=color)
         ax.text(x + 1.6, 1.0, desc, ha='center', va='center',
                 fontsize=9, color=SUBTLE)
 
     for x1, x2 in [(3.4, 3.8), (7.0, 7.4)]:
-        ax.annotate('', xy=(x2, 1.55), xytext=(x1, 1.55),
-                    arrowprops=dict(arrowstyle='->', color=GRAY_M, lw=2))
+        arrow(ax, (x1, 1.55), (x2, 1.55), GRAY_M, lw=2)
 
     save_fig(fig, 'ml-era-timeline.svg', 'ch02')
 
@@ -265,8 +885,7 @@ def diagram_06():
             fontsize=9, color=SUBTLE)
 
     # 화살표
-    ax.annotate('', xy=(5.2, 2.1), xytext=(4.2, 2.1),
-                arrowprops=dict(arrowstyle='->', color=DARK, lw=2))
+    arrow(ax, (4.2, 2.1), (5.2, 2.1), DARK, lw=2)
     ax.text(4.7, 2.6, '전환', ha='center', va='center',
             fontsize=10, fontweight='bold', color=DARK)
 
@@ -284,36 +903,6 @@ def diagram_06():
     save_fig(fig, 'data-evolution-flow.svg', 'ch02')
 
 
-# ============================================================
-# 7. ai-working-principle.svg
-# ============================================================
-def diagram_07():
-    fig, ax = make_axes((11, 4), (-0.3, 11.3), (-0.2, 3.3),
-                        '생성형 AI 작동 원리 4단계')
-
-    steps = [
-        (0.2, '1단계', '대량의 텍스트\n학습', C_BLUE, BG_BLUE),
-        (2.9, '2단계', '다음 단어\n예측 능력', C_PURPLE, BG_PURPLE),
-        (5.6, '3단계', '사용자 질문에\n답변 생성', C_GREEN, BG_GREEN),
-        (8.3, '4단계', '대화로\n답변 개선', C_ORANGE, BG_ORANGE),
-    ]
-
-    for x, step, desc, color, bg in steps:
-        box = FancyBboxPatch((x, 0.3), 2.3, 2.4, boxstyle="round,pad=0.15",
-                             facecolor=WHITE, edgecolor=color, linewidth=1.5)
-        ax.add_patch(box)
-        ax.text(x + 1.15, 2.1, step, ha='center', va='center',
-                fontsize=11, fontweight='bold', color=color)
-        ax.text(x + 1.15, 1.0, desc, ha='center', va='center',
-                fontsize=9, color=SUBTLE)
-
-    for x in [2.5, 5.2, 7.9]:
-        ax.annotate('', xy=(x + 0.4, 1.5), xytext=(x, 1.5),
-                    arrowprops=dict(arrowstyle='->', color=GRAY_M, lw=2))
-
-    save_fig(fig, 'ai-working-principle.svg', 'ch02')
-
-
 # ============================================================
 # 8. data-misconceptions.svg
 # ============================================================
@@ -357,17 +946,14 @@ def diagram_09():
     ]
 
     for x, y, title, desc, color in principles:
-        box = FancyBboxPatch((x, y), 3.8, 2.0, boxstyle="round,pad=0.2",
-                             facecolor=WHITE, edgecolor=color, linewidth=1.5)
-        ax.add_patch(box)
+        rounded_box(ax, x, y, 3.8, 2.0, WHITE, color, pad=0.2, lw=1.5)
         ax.text(x + 1.9, y + 1.5, title, ha='center', va='center',
                 fontsize=12, fontweight='bold', color=color)
         ax.text(x + 1.9, y + 0.6, desc, ha='center', va='center',
                 fontsize=10, color=SUBTLE)
 
     # 중앙 레이블
-    center = plt.Circle((4.65, 3.6), 0.5, color=BG_BLUE, ec=C_BLUE, lw=1.5, zorder=5)
-    ax.add_patch(center)
+    circle(ax, 4.65, 3.6, 0.5, BG_BLUE, C_BLUE, lw=1.5, zorder=5)
     ax.text(4.65, 3.6, '4원칙', ha='center', va='center',
             fontsize=11, fontweight='bold', color=C_BLUE, zorder=6)
 
@@ -391,8 +977,7 @@ def diagram_10():
             fontsize=9, color=SUBTLE)
 
     # 화살표
-    ax.annotate('', xy=(5.7, 1.85), xytext=(5.0, 1.85),
-                arrowprops=dict(arrowstyle='->', color=DARK, lw=2.5))
+    arrow(ax, (5.0, 1.85), (5.7, 1.85), DARK, lw=2.5)
 
     # After
     rounded_box(ax, 5.9, 0.5, 4.3, 2.7, WHITE, C_GREEN)
@@ -421,9 +1006,7 @@ def diagram_11():
     ]
 
     for x, label, color in elements:
-        box = FancyBboxPatch((x, 1.5), 1.6, 1.6, boxstyle="round,pad=0.15",
-                             facecolor=WHITE, edgecolor=color, linewidth=1.5)
-        ax.add_patch(box)
+        rounded_box(ax, x, 1.5, 1.6, 1.6, WHITE, color, pad=0.15, lw=1.5)
         ax.text(x + 0.8, 2.3, label, ha='center', va='center',
                 fontsize=11, fontweight='bold', color=color)
 
@@ -437,9 +1020,7 @@ def diagram_11():
             fontsize=18, fontweight='bold', color=DARK)
 
     # 결과
-    box = FancyBboxPatch((8.6, 1.3), 1.6, 2.0, boxstyle="round,pad=0.15",
-                         facecolor=BG_BLUE, edgecolor=C_BLUE, linewidth=1.8)
-    ax.add_patch(box)
+    rounded_box(ax, 8.6, 1.3, 1.6, 2.0, BG_BLUE, C_BLUE, pad=0.15, lw=1.8)
     ax.text(9.4, 2.3, '말투\n결정!', ha='center', va='center',
             fontsize=12, fontweight='bold', color=C_BLUE)
 
@@ -454,67 +1035,18 @@ def diagram_11():
 # 12. six-tones-radar.svg
 # ============================================================
 def diagram_12():
+    fig, ax = make_polar_axes((8, 8))
     categories = ['친근감', '전문성', '격식', '설득력', '객관성', '간결함']
-    N = len(categories)
-    angles = np.linspace(0, 2 * np.pi, N, endpoint=False).tolist()
-    angles += angles[:1]
-
-    tones = {
-        'A. 강의형':   ([5, 3, 2, 3, 2, 3], C_BLUE),
-        'B. 경험자형': ([4, 4, 3, 4, 3, 3], C_PURPLE),
-        'C. 보고서형': ([1, 5, 5, 3, 5, 2], C_GREEN),
-        'D. 선배형':   ([5, 2, 1, 2, 2, 5], C_ORANGE),
-        'E. 마케팅형': ([3, 2, 3, 5, 2, 5], C_RED),
-        'F. 기사형':   ([2, 4, 4, 3, 5, 3], GRAY_M),
-    }
-
-    fig, ax = plt.subplots(figsize=(8, 8), subplot_kw=dict(polar=True))
-    ax.set_theta_offset(np.pi / 2)
-    ax.set_theta_direction(-1)
-    ax.set_rlabel_position(0)
-    ax.set_ylim(0, 5)
-    ax.set_yticks([1, 2, 3, 4, 5])
-    ax.set_yticklabels(['1', '2', '3', '4', '5'], fontsize=8, color='#999')
-    ax.set_xticks(angles[:-1])
-    ax.set_xticklabels(categories, fontsize=11, fontweight='bold')
-    ax.set_title('6가지 말투 레이더 차트', fontsize=14, fontweight='bold',
-                 color=DARK, pad=20)
-
-    for name, (values, color) in tones.items():
-        values_closed = values + values[:1]
-        ax.plot(angles, values_closed, 'o-', linewidth=1.8, label=name, color=color)
-        ax.fill(angles, values_closed, alpha=0.08, color=color)
-
-    ax.legend(loc='upper right', bbox_to_anchor=(1.35, 1.1), fontsize=9)
-    save_fig(fig, 'six-tones-radar.svg', 'ch04')
-
-
-# ============================================================
-# 13. ai-writing-problems.svg
-# ============================================================
-def diagram_13():
-    fig, ax = make_axes((10, 5.5), (-0.3, 10.5), (-0.3, 5.3),
-                        'AI 글의 6가지 전형적 문제')
-
-    problems = [
-        (0.3, 3.2, '① 문장 단절', '짧고 끊긴 문장', C_RED),
-        (3.6, 3.2, '② 문단 분절', '지나친 줄바꿈', C_RED),
-        (6.9, 3.2, '③ 번역투', '영어 직역 표현', C_RED),
-        (0.3, 0.8, '④ 슬롭 워드', 'AI 과용 단어', C_ORANGE),
-        (3.6, 0.8, '⑤ 종결 단조', '~합니다만 반복', C_ORANGE),
-        (6.9, 0.8, '⑥ 메타 해설', '투어 가이드 문장', C_ORANGE),
+    tones = [
+        ('A. 강의형',   [5, 3, 2, 3, 2, 3], C_BLUE),
+        ('B. 경험자형', [4, 4, 3, 4, 3, 3], C_PURPLE),
+        ('C. 보고서형', [1, 5, 5, 3, 5, 2], C_GREEN),
+        ('D. 선배형',   [5, 2, 1, 2, 2, 5], C_ORANGE),
+        ('E. 마케팅형', [3, 2, 3, 5, 2, 5], C_RED),
+        ('F. 기사형',   [2, 4, 4, 3, 5, 3], GRAY_M),
     ]
-
-    for x, y, title, desc, color in problems:
-        box = FancyBboxPatch((x, y), 2.8, 1.8, boxstyle="round,pad=0.15",
-                             facecolor=WHITE, edgecolor=color, linewidth=1.5)
-        ax.add_patch(box)
-        ax.text(x + 1.4, y + 1.2, title, ha='center', va='center',
-                fontsize=11, fontweight='bold', color=color)
-        ax.text(x + 1.4, y + 0.5, desc, ha='center', va='center',
-                fontsize=9, color=SUBTLE)
-
-    save_fig(fig, 'ai-writing-problems.svg', 'ch05')
+    radar_chart(ax, categories, tones, '6가지 말투 레이더 차트')
+    save_fig(fig, 'six-tones-radar.svg', 'ch04')
 
 
 # ============================================================
@@ -538,9 +1070,7 @@ def diagram_14():
 
     for items in [steps, strategies]:
         for x, y, title, desc, color in items:
-            box = FancyBboxPatch((x, y), 4.0, 1.1, boxstyle="round,pad=0.12",
-                                 facecolor=WHITE, edgecolor=color, linewidth=1.5)
-            ax.add_patch(box)
+            rounded_box(ax, x, y, 4.0, 1.1, WHITE, color, pad=0.12, lw=1.5)
             ax.text(x + 2.0, y + 0.7, title, ha='center', va='center',
                     fontsize=11, fontweight='bold', color=color)
             ax.text(x + 2.0, y + 0.3, desc, ha='center', va='center',
@@ -548,8 +1078,7 @@ def diagram_14():
 
     # 세로 화살표
     for y1, y2 in [(3.5, 3.2), (2.1, 1.8)]:
-        ax.annotate('', xy=(2.5, y2), xytext=(2.5, y1),
-                    arrowprops=dict(arrowstyle='->', color=GRAY_M, lw=1.5))
+        arrow(ax, (2.5, y1), (2.5, y2), GRAY_M, lw=1.5)
 
     ax.text(2.5, 5.0, '단계적 심화', ha='center', va='center',
             fontsize=12, fontweight='bold', color=C_BLUE)
@@ -559,33 +1088,6 @@ def diagram_14():
     save_fig(fig, 'multiturn-strategy.svg', 'ch03')
 
 
-# ============================================================
-# 15. ai-limitations-overview.svg
-# ============================================================
-def diagram_15():
-    fig, ax = make_axes((10, 4.5), (-0.3, 10.8), (-0.3, 3.8),
-                        'AI의 5가지 한계')
-
-    limits = [
-        (0.3, '환각\n(Hallucination)', '사실이 아닌 정보를\n자신있게 답함', C_RED),
-        (2.3, '최신 정보\n부족', '학습 데이터 이후\n정보를 모름', C_ORANGE),
-        (4.3, '개인 경험\n부재', '자기만의 경험이나\n감정이 없음', C_BLUE),
-        (6.3, '수학적\n추론 한계', '복잡한 계산에서\n실수', C_PURPLE),
-        (8.3, '일관성\n부족', '같은 질문에\n다른 답변', C_GREEN),
-    ]
-
-    for x, title, desc, color in limits:
-        box = FancyBboxPatch((x, 0.3), 1.7, 2.8, boxstyle="round,pad=0.12",
-                             facecolor=WHITE, edgecolor=color, linewidth=1.5)
-        ax.add_patch(box)
-        ax.text(x + 0.85, 2.5, title, ha='center', va='center',
-                fontsize=9, fontweight='bold', color=color)
-        ax.text(x + 0.85, 1.1, desc, ha='center', va='center',
-                fontsize=8, color=SUBTLE)
-
-    save_fig(fig, 'ai-limitations-overview.svg', 'ch05')
-
-
 # ============================================================
 # 16. book-roadmap.svg
 # ============================================================
@@ -608,8 +1110,7 @@ def diagram_16():
             fontsize=9, color=SUBTLE)
 
     # 화살표
-    ax.annotate('', xy=(5.7, 4.0), xytext=(5.1, 4.0),
-                arrowprops=dict(arrowstyle='->', color=DARK, lw=2))
+    arrow(ax, (5.1, 4.0), (5.7, 4.0), DARK, lw=2)
 
     # 부록
     rounded_box(ax, 2.5, 0.8, 6.0, 1.6, WHITE, C_PURPLE)
@@ -619,24 +1120,1339 @@ def diagram_16():
             ha='center', va='center', fontsize=9, color=SUBTLE)
 
     # 하향 화살표
-    ax.annotate('', xy=(5.5, 2.4), xytext=(5.5, 3.2),
-                arrowprops=dict(arrowstyle='->', color=DARK, lw=1.5))
+    arrow(ax, (5.5, 3.2), (5.5, 2.4), DARK, lw=1.5)
 
     save_fig(fig, 'book-roadmap.svg', 'index')
 
 
+# ============================================================
+# 스펙 기반 카드 레이아웃 — diagram_specs/*.json (PyYAML이 있으면 *.yaml도)
+# 파일 이름(확장자 제외)이 다이어그램 이름, 카드 좌표는 layout에서 계산
+# ============================================================
+SPEC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'diagram_specs')
+SPEC_EXTENSIONS = ('.json', '.yaml', '.yml')
+
+# 스펙에서 생략한 layout 값
+SPEC_LAYOUT = {
+    'origin': [0, 0],        # 첫 행 첫 카드의 왼쪽 아래
+    'columns': 1,
+    'card': [2.0, 2.0],      # 카드 폭, 높이
+    'gap': [0.4, 0.4],       # 카드 사이 가로, 세로 간격
+    'pad': 0.15,
+    'lw': 1.5,
+    'arrows': False,         # 같은 행의 이웃 카드를 화살표로 연결 (파이프라인, 타임라인)
+    'arrow_color': 'GRAY_M',
+    'arrow_lw': 2,
+    'fit': 'check',          # 글이 카드를 넘칠 때 — SPEC_FITS 중 하나
+}
+# 카드 텍스트 [카드 아래 변에서의 높이, 글자 크기] — 높이를 생략하면 카드 높이 비율로
+SPEC_TEXT = {'title': [None, 11], 'desc': [None, 9]}
+SPEC_TEXT_RATIO = {'title': 0.75, 'desc': 0.35}
+SPEC_TEXT_WEIGHT = {'title': 'bold', 'desc': 'normal'}
+
+# 글 맞춤 — check: 경고만, shrink: 넘치는 글의 크기를 모든 카드에서 함께 줄임,
+# grow: 카드 폭/높이를 키움 (모든 카드 같은 크기 유지). 그래도 남는 문제는 경고
+SPEC_FITS = ('check', 'shrink', 'grow')
+SPEC_MIN_FONTSIZE = 7
+SPEC_FONT_STEP = 0.5
+SPEC_GROW_STEP = 0.05        # 키운 카드 크기를 이 단위로 올림
+# 넘침 종류 — 글이 카드 안쪽(둘레 pad의 절반을 여백으로 남긴 영역)을 벗어난 방향
+SPEC_OVERFLOW = {'width': '폭', 'top': '위쪽', 'bottom': '아래쪽', 'overlap': '제목과 설명 겹침',
+                 'frame': '카드가 그림 범위(xlim/ylim) 밖'}
+
+
+def _read_spec(path):
+    with open(path, encoding='utf-8') as f:
+        if path.endswith('.json'):
+            return json.load(f)
+        import yaml     # 선택 의존성 — YAML 스펙을 쓸 때만 필요
+        return yaml.safe_load(f)
+
+
+@functools.lru_cache(maxsize=None)
+def load_specs():
+    """다이어그램 이름 -> 스펙 (파일 이름순, 프로세스당 한 번만 읽음)"""
+    specs = {}
+    if not os.path.isdir(SPEC_DIR):
+        return specs
+    for filename in sorted(os.listdir(SPEC_DIR)):
+        name, ext = os.path.splitext(filename)
+        if ext not in SPEC_EXTENSIONS:
+            continue
+        if name in specs:
+            raise ValueError(f"스펙 이름이 겹칩니다: {name} ({SPEC_DIR})")
+        specs[name] = _read_spec(os.path.join(SPEC_DIR, filename))
+    return specs
+
+
+def spec_color(value):
+    """팔레트 상수 이름('C_BLUE') 또는 hex 색상"""
+    return palette().get(value, value)
+
+
+def card_positions(layout, count):
+    """카드 count개의 왼쪽 아래 좌표 — 행은 위에서 아래로 채움"""
+    (x0, y0), (w, h), (gx, gy) = layout['origin'], layout['card'], layout['gap']
+    cols = layout['columns']
+    return [(x0 + (i % cols) * (w + gx), y0 - (i // cols) * (h + gy))
+            for i in range(count)]
+
+
+def card_overflows(spec, layout, text):
+    """글이 카드를 넘치는 곳 [(카드 번호, 키, 종류, 초과량(데이터 단위), 글)]
+    렌더링 없이 글자 폭과 줄 수만 재서 판단한다."""
+    sx, sy = axes_scale(spec['figsize'], spec['xlim'], spec['ylim'])
+    w, h = layout['card']
+    margin = layout['pad'] / 2
+    problems = []
+    for i, item in enumerate(spec['items'], 1):
+        spans = {}
+        for key, weight in SPEC_TEXT_WEIGHT.items():
+            if not item.get(key):
+                continue
+            dy, fontsize = text[key]
+            if dy is None:
+                dy = h * SPEC_TEXT_RATIO[key]
+            width, height = measure_text(item[key], fontsize, weight)
+            width, height = width / sx, height / sy
+            lo, hi = dy - height / 2, dy + height / 2
+            spans[key] = (lo, hi)
+            for kind, excess in (('width', width - (w + 2 * margin)),
+                                 ('top', hi - (h + margin)), ('bottom', -margin - lo)):
+                if excess > 1e-9:
+                    problems.append((i, key, kind, excess, item[key]))
+        if len(spans) == 2 and spans['title'][0] < spans['desc'][1]:
+            problems.append((i, 'desc', 'overlap', spans['desc'][1] - spans['title'][0],
+                             item['desc']))
+
+    positions = card_positions(layout, len(spec['items']))
+    pad = layout['pad']
+    x0 = min(x for x, _ in positions) - pad
+    x1 = max(x for x, _ in positions) + w + pad
+    y0 = min(y for _, y in positions) - pad
+    y1 = max(y for _, y in positions) + h + pad
+    excess = max(spec['xlim'][0] - x0, x1 - spec['xlim'][1],
+                 spec['ylim'][0] - y0, y1 - spec['ylim'][1])
+    if excess > 1e-9:
+        problems.append((0, None, 'frame', excess, ''))
+    return problems
+
+
+def fit_cards(spec, layout, text):
+    """layout['fit']에 따라 글 크기나 카드 크기를 고침 — (layout, text, 남은 문제)"""
+    mode = layout['fit']
+    if mode not in SPEC_FITS:
+        raise ValueError(f"알 수 없는 fit: {mode} ({', '.join(SPEC_FITS)} 중 하나)")
+    problems = card_overflows(spec, layout, text)
+    if mode == 'shrink':
+        text = {key: list(value) for key, value in text.items()}
+        while problems:
+            keys = {key for _, key, kind, _, _ in problems
+                    if kind != 'frame' and text[key][1] - SPEC_FONT_STEP >= SPEC_MIN_FONTSIZE}
+            if not keys:
+                break
+            for key in keys:
+                text[key][1] -= SPEC_FONT_STEP
+            problems = card_overflows(spec, layout, text)
+    elif mode == 'grow':
+        def up(v):
+            return round(math.ceil(round(v / SPEC_GROW_STEP, 6)) * SPEC_GROW_STEP, 6)
+        while True:
+            w, h = layout['card']
+            grow_w = max((e for _, _, kind, e, _ in problems if kind == 'width'), default=0)
+            grow_h = max((e for _, _, kind, e, _ in problems if kind == 'top'), default=0)
+            if not grow_w and not grow_h:
+                break
+            layout = {**layout, 'card': [up(w + grow_w), up(h + grow_h)]}
+            problems = card_overflows(spec, layout, text)
+    return layout, text, problems
+
+
+def overflow_message(name, problem):
+    i, key, kind, excess, content = problem
+    where = f"{i}번 카드 {key} " if i else ""
+    line = content.split('\n')[0]
+    return (f"{name}: {where}{SPEC_OVERFLOW[kind]} {excess:.2f} 초과"
+            + (f" — '{line}'" if line else ""))
+
+
+def render_spec(name):
+    """스펙 하나 렌더링 — 흰 카드 + 색상 테두리, 굵은 제목과 회색 설명"""
+    spec = load_specs()[name]
+    layout = {**SPEC_LAYOUT, **spec.get('layout', {})}
+    text = {**SPEC_TEXT, **spec.get('text', {})}
+    layout, text, problems = fit_cards(spec, layout, text)
+    for problem in problems:
+        log(f"  !! {overflow_message(name, problem)}")
+    w, h = layout['card']
+    fig, ax = make_axes(tuple(spec['figsize']), tuple(spec['xlim']), tuple(spec['ylim']),
+                        spec['title'])
+
+    positions = card_positions(layout, len(spec['items']))
+    for (x, y), item in zip(positions, spec['items']):
+        color = spec_color(item['color'])
+        rounded_box(ax, x, y, w, h, WHITE, color, pad=layout['pad'], lw=layout['lw'])
+        for key, text_color in (('title', color), ('desc', SUBTLE)):
+            weight = SPEC_TEXT_WEIGHT[key]
+            if not item.get(key):
+                continue
+            dy, fontsize = text[key]
+            if dy is None:
+                dy = h * SPEC_TEXT_RATIO[key]
+            ax.text(x + w / 2, y + dy, item[key], ha='center', va='center',
+                    fontsize=fontsize, fontweight=weight, color=text_color)
+
+    if layout['arrows']:
+        for (x1, y1), (x2, y2) in zip(positions, positions[1:]):
+            if y1 == y2:
+                arrow(ax, (x1 + w, y1 + h / 2), (x2, y2 + h / 2),
+                      spec_color(layout['arrow_color']), lw=layout['arrow_lw'])
+
+    save_fig(fig, spec['output'], spec.get('chapter', 'index'))
+
+
 # ============================================================
 # 메인 실행
 # ============================================================
+# 03, 07, 13, 15는 diagram_specs/의 스펙으로 그림
+DIAGRAMS = [
+    diagram_01, diagram_02, diagram_04,
+    diagram_05, diagram_06, diagram_08,
+    diagram_09, diagram_10, diagram_11, diagram_12,
+    diagram_14, diagram_16,
+]
+DIAGRAM_BY_NAME = {fn.__name__: fn for fn in DIAGRAMS}
+for _name in load_specs():
+    if _name in DIAGRAM_BY_NAME:
+        raise ValueError(f"스펙 {_name}이 같은 이름의 다이어그램 함수와 겹칩니다")
+    DIAGRAM_BY_NAME[_name] = functools.partial(render_spec, _name)
+DIAGRAM_BY_NAME = dict(sorted(DIAGRAM_BY_NAME.items()))
+
+# 스펙 다이어그램의 출력에 영향을 주는 레이아웃 코드
+SPEC_HELPERS = [spec_color, card_positions, axes_scale, measure_text, card_overflows, fit_cards,
+                render_spec, text_metrics]
+
+
+# ============================================================
+# 증분 빌드 캐시 — 함수 소스 + 공통 입력의 해시가 같으면 건너뜀
+# ============================================================
+MANIFEST_PATH = os.path.join(CACHE_DIR, 'manifest.json')
+# 커밋되는 잠금 파일 — 다이어그램별 이식 가능한 소스 키와 출력 파일 해시.
+# 매니페스트(.diagram-cache, gitignore)가 없는 새 클론에서도 커밋된 그림이 소스와
+# 맞는지 렌더링 없이 판단한다.
+LOCK_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'figures.lock.json')
+
+# 모든 다이어그램 출력에 영향을 주는 공통 헬퍼
+RENDER_HELPERS = [rc_params, web_font_family, setup_matplotlib, write_if_changed, count_artists,
+                  dark_name, dark_variant, raster_name, render_rasters, _codec, precompress, _emit,
+                  save_fig, rounded_box, circle, arrow, make_axes, make_polar_axes, radar_colors,
+                  radar_vertices, radar_chart, svg_native, svg_optimize]
+
+
+def palette():
+    """C_*/BG_* 및 중립 색상 상수"""
+    return {k: v for k, v in globals().items()
+            if k.startswith(('C_', 'BG_', 'GRAY_')) or k in ('WHITE', 'DARK', 'SUBTLE')}
+
+
+@functools.lru_cache(maxsize=None)
+def _function_nodes():
+    """이 파일의 최상위 함수 이름 -> (ast 노드, 소스) — 한 번만 파싱"""
+    with open(__file__, encoding='utf-8') as f:
+        text = f.read()
+    lines = text.splitlines(keepends=True)
+    return {node.name: (node, ''.join(lines[node.lineno - 1:node.end_lineno]))
+            for node in ast.parse(text).body if isinstance(node, ast.FunctionDef)}
+
+
+def source_of(obj):
+    """해시용 소스 — 모듈은 파일 전체, 이 파일의 함수는 캐시된 ast 조각"""
+    if inspect.ismodule(obj):
+        with open(obj.__file__, encoding='utf-8') as f:
+            return f.read()
+    if obj.__module__ == __name__ and obj.__name__ in _function_nodes():
+        return _function_nodes()[obj.__name__][1]
+    return inspect.getsource(obj)
+
+
+def common_key(portable=False):
+    """모든 다이어그램이 공유하는 입력의 해시
+    portable이면 기계마다 다른 값(matplotlib 버전, 출력 폴더의 절대 경로)을 빼고 — 잠금 파일용"""
+    h = hashlib.sha256()
+    h.update(json.dumps([palette(), DARK_PALETTE], sort_keys=True).encode())
+    for helper in RENDER_HELPERS:
+        h.update(source_of(helper).encode())
+    h.update(json.dumps(rc_params(), sort_keys=True).encode())
+    options = {k: v for k, v in current_options().items() if k not in UNKEYED_OPTIONS}
+    if portable:
+        options['BASE_DIR'] = os.path.relpath(BASE_DIR, ROOT_DIR).replace(os.sep, '/')
+    else:
+        h.update(matplotlib_version().encode())
+    h.update(json.dumps(options, sort_keys=True).encode())
+    return h.hexdigest()
+
+
+def diagram_key(name, common=None):
+    h = hashlib.sha256((common or common_key()).encode())
+    spec = load_specs().get(name)
+    if spec is None:
+        h.update(source_of(DIAGRAM_BY_NAME[name]).encode())
+        return h.hexdigest()
+    for helper in SPEC_HELPERS:
+        h.update(source_of(helper).encode())
+    h.update(json.dumps([SPEC_LAYOUT, SPEC_TEXT, SPEC_TEXT_RATIO, SPEC_TEXT_WEIGHT, SPEC_MIN_FONTSIZE,
+                         SPEC_FONT_STEP, SPEC_GROW_STEP, AXES_MARGIN, spec],
+                        sort_keys=True).encode())
+    return h.hexdigest()
+
+
+def load_manifest():
+    try:
+        with open(MANIFEST_PATH, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(manifest):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp = MANIFEST_PATH + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=1, sort_keys=True)
+    os.replace(tmp, MANIFEST_PATH)
+
+
+def is_fresh(entry, key):
+    """캐시 항목이 key와 일치하고 출력 파일이 모두 남아 있는지"""
+    return (entry is not None and entry.get('key') == key and entry.get('outputs')
+            and all(os.path.exists(os.path.join(ROOT_DIR, p)) for p in entry['outputs']))
+
+
+def load_lock():
+    try:
+        with open(LOCK_PATH, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def file_sha256(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def is_locked(entry, key):
+    """잠금 항목이 이식 가능한 소스 키와 일치하고 출력 파일이 기록된 해시 그대로인지
+    (새 클론에서 커밋된 그림을 그대로 쓸 수 있는지)"""
+    if entry is None or entry.get('source') != key or not entry.get('outputs'):
+        return False
+    try:
+        return all(file_sha256(os.path.join(ROOT_DIR, *p.split('/'))) == sha
+                   for p, sha in entry['outputs'].items())
+    except OSError:
+        return False
+
+
+def update_lock(names, manifest):
+    """렌더링에 성공한 names의 소스 키와 출력 해시를 잠금 파일에 기록
+    기본 출력 폴더일 때만 — --out-dir 결과는 커밋되는 그림이 아니므로 건드리지 않음"""
+    if not names or os.path.normpath(BASE_DIR) != os.path.join(DOCS_DIR, 'assets', 'images',
+                                                                'figures'):
+        return
+    lock = load_lock()
+    common = common_key(portable=True)
+    for name in names:
+        entry = manifest.get(name)
+        if entry is None:
+            continue
+        paths = {p.replace(os.sep, '/'): os.path.join(ROOT_DIR, p) for p in sorted(entry['outputs'])}
+        # bytes는 크기 예산의 기준 — 커밋된 그림보다 얼마나 커졌는지
+        lock[name] = {'source': diagram_key(name, common),
+                      'outputs': {p: file_sha256(path) for p, path in paths.items()},
+                      'bytes': {p: os.path.getsize(path) for p, path in paths.items()}}
+    lock = {name: lock[name] for name in DIAGRAM_BY_NAME if name in lock}
+    data = (json.dumps(lock, ensure_ascii=False, indent=1, sort_keys=True) + '\n').encode('utf-8')
+    write_if_changed(LOCK_PATH, data)
+
+
+def output_index():
+    """다이어그램 -> [(챕터, 파일명)] — 함수 소스의 save_fig 호출을 정적으로 읽음"""
+    specs = load_specs()
+    index = {}
+    for name in DIAGRAM_BY_NAME:
+        if name in specs:
+            index[name] = [(specs[name].get('chapter', 'index'), specs[name]['output'])]
+            continue
+        outputs = []
+        for node in ast.walk(_function_nodes()[name][0]):
+            if (isinstance(node, ast.Call) and isinstance(node.func, ast.Name)
+                    and node.func.id == 'save_fig'):
+                args = [a.value for a in node.args[1:] if isinstance(a, ast.Constant)]
+                outputs.append((args[1] if len(args) > 1 else 'index', args[0]))
+        index[name] = outputs
+    return index
+
+
+def figure_index():
+    """docs 기준 그림 경로('assets/images/figures/ch03/x.svg', 다크 변형 포함) -> 다이어그램 이름"""
+    base = os.path.relpath(BASE_DIR, DOCS_DIR).replace(os.sep, '/')
+    index = {}
+    for name, outputs in output_index().items():
+        for chapter, filename in outputs:
+            index[f'{base}/{chapter}/{filename}'] = name
+            if DARK_VARIANT:
+                index[f'{base}/{chapter}/{dark_name(filename)}'] = name
+    return index
+
+
+def resolve_names(selectors):
+    """'diagram_03', '03', '3', 'ai-landscape-grid(.svg)' 형태의 선택자를 함수 이름으로"""
+    by_file = {}
+    for name, outputs in output_index().items():
+        for _, filename in outputs:
+            by_file[filename] = by_file[os.path.splitext(filename)[0]] = name
+    names = []
+    for sel in selectors:
+        if sel in DIAGRAM_BY_NAME:
+            name = sel
+        elif sel in by_file:
+            name = by_file[sel]
+        else:
+            name = f'diagram_{sel.zfill(2)}'
+        if name not in DIAGRAM_BY_NAME:
+            raise SystemExit(f"알 수 없는 다이어그램: {sel}")
+        names.append(name)
+    return names
+
+
+def render_one(name):
+    """다이어그램 하나 렌더링 — 로그, 출력 경로, 크기, 오류 traceback(또는 None)"""
+    global _FONT_REPORT
+    job = _JOB
+    job.log, job.outputs, job.sizes, job.over = [], [], [], []
+    job.baseline = load_lock().get(name, {}).get('bytes', {})
+    try:
+        DIAGRAM_BY_NAME[name]()
+        error = None
+    except Exception:
+        error = traceback.format_exc()
+    lines, job.log = job.log, None
+    report, _FONT_REPORT = _FONT_REPORT, None
+    if report:
+        # 이 프로세스에서 글꼴을 찾은 뒤 처음 끝난 작업에 한 번만 붙임
+        lines.insert(0, report)
+    return {'name': name, 'log': lines, 'outputs': job.outputs,
+            'sizes': job.sizes, 'over': job.over, 'error': error}
+
+
+# 풀 작업 묶음 — 워커당 이만큼의 묶음으로 나눠 보냄
+RUN_CHUNKS_PER_WORKER = 4
+
+# jobs > 1일 때의 실행기 — 'process'(CPU 코어를 다 씀) 또는 'thread'(프로세스를 띄우지 않아
+# 감시 모드/mkdocs serve처럼 오래 떠 있는 프로세스에서 시작 비용과 메모리가 적음)
+EXECUTOR = 'process'
+EXECUTORS = ('process', 'thread')
+
+
+def run(names, jobs):
+    """names를 순서대로 렌더링 — jobs > 1이면 프로세스(또는 스레드) 풀 사용
+    (matplotlib은 워커/그림이 실제로 필요로 할 때만 import)"""
+    if jobs > 1 and len(names) > 1 and EXECUTOR == 'thread':
+        from concurrent.futures import ThreadPoolExecutor
+        # 옵션은 이 프로세스의 전역 그대로 — rcParams만 스레드를 띄우기 전에 맞춤
+        init_worker(current_options())
+        with ThreadPoolExecutor(max_workers=min(jobs, len(names))) as pool:
+            yield from pool.map(render_one, names)
+        return
+    if jobs > 1 and len(names) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        workers = min(jobs, len(names))
+        pool = ProcessPoolExecutor(max_workers=workers,
+                                   initializer=init_worker, initargs=(current_options(),))
+        with pool:
+            # 그림마다 프로세스 간 왕복하지 않도록 여러 개씩 묶어 보냄
+            chunksize = max(1, len(names) // (workers * RUN_CHUNKS_PER_WORKER))
+            yield from pool.map(render_one, names, chunksize=chunksize)
+        return
+    init_worker(current_options())
+    for name in names:
+        yield render_one(name)
+
+
+def check_text(names):
+    """스펙 카드의 글 넘침을 렌더링 없이 검사 — fit으로 바뀌는 값과 남은 문제 출력, 종료 코드"""
+    specs = load_specs()
+    remaining = 0
+    for name in names:
+        if name not in specs:
+            continue
+        spec = specs[name]
+        layout = {**SPEC_LAYOUT, **spec.get('layout', {})}
+        text = {**SPEC_TEXT, **spec.get('text', {})}
+        fitted, fitted_text, problems = fit_cards(spec, layout, text)
+        notes = []
+        if fitted['card'] != layout['card']:
+            notes.append(f"카드 {layout['card']} -> {fitted['card']}")
+        notes += [f"{key} {text[key][1]:g}pt -> {fitted_text[key][1]:g}pt"
+                  for key in text if fitted_text[key][1] != text[key][1]]
+        status = '문제 %d건' % len(problems) if problems else 'OK'
+        print(f"{name:<12} fit={layout['fit']:<7} {status}" + (f"  ({', '.join(notes)})" if notes else ""))
+        for problem in problems:
+            print(f"  !! {overflow_message(name, problem)}")
+        remaining += len(problems)
+    return 1 if remaining else 0
+
+
+def recolor_existing(names):
+    """렌더링 없이 디스크의 SVG에서 다크 변형을 다시 만들고 사전 압축본을 맞춤 — 종료 코드
+    SVG 자체는 건드리지 않는다. save_fig와 같은 순서(OPTIMIZE 후 dark_variant)라
+    커밋된 그림을 이 기계의 글꼴로 다시 그리지 않고도 그 그림에 맞는 다크 변형이 나온다."""
+    changed = []
+    missing = []
+    for name in names:
+        for chapter, filename in output_index()[name]:
+            path = os.path.join(BASE_DIR, chapter, filename)
+            if not os.path.exists(path):
+                missing.append(os.path.relpath(path, ROOT_DIR))
+                continue
+            with open(path, 'rb') as f:
+                data = f.read()
+            outputs = {path: data}
+            if DARK_VARIANT:
+                dark = data if OPTIMIZE is None else svg_optimize.optimize(data, **OPTIMIZE)
+                outputs[os.path.join(BASE_DIR, chapter, dark_name(filename))] = dark_variant(dark)
+            for target, content in outputs.items():
+                if target != path:
+                    written = write_if_changed(target, content)
+                    print(f"  -> figures/{chapter}/{os.path.basename(target)}"
+                          + ("" if written else "  (변경 없음)"))
+                changed.append(os.path.relpath(target, ROOT_DIR))
+                changed += [os.path.relpath(t, ROOT_DIR) for t in precompress(target, content)]
+    update_assets(changed)
+    for rel in missing:
+        print(f"  !! {rel} 없음 — 먼저 렌더링하세요", file=sys.stderr)
+    return 1 if missing else 0
+
+
+def lock_existing(names):
+    """렌더링 없이 디스크의 출력(SVG, 다크 변형, 사전 압축본)을 names의 현재 소스 키로 잠금
+    다른 기계(글꼴)에서 커밋한 그림을 다시 그리지 않고 새 클론의 기준으로 삼을 때 쓴다 — 종료 코드"""
+    manifest = {}
+    missing = []
+    for name in names:
+        outputs = []
+        for chapter, filename in output_index()[name]:
+            svgs = [filename] + ([dark_name(filename)] if DARK_VARIANT else [])
+            for svg in svgs:
+                path = os.path.join(BASE_DIR, chapter, svg)
+                if not os.path.exists(path):
+                    missing.append(os.path.relpath(path, ROOT_DIR))
+                    continue
+                with open(path, 'rb') as f:
+                    targets = precompress(path, f.read())
+                outputs += [os.path.relpath(p, ROOT_DIR) for p in [path] + targets]
+        if outputs:
+            manifest[name] = {'outputs': outputs}
+    for rel in missing:
+        print(f"  !! {rel} 없음 — 먼저 렌더링하세요", file=sys.stderr)
+    if missing:
+        return 1
+    update_lock(names, manifest)
+    print(f"잠금 파일에 {len(manifest)}개 다이어그램 기록: {os.path.relpath(LOCK_PATH, ROOT_DIR)}")
+    return 0
+
+
+def render_bytes(name):
+    """파일을 쓰지 않고 다이어그램 하나를 렌더링 — {상대 경로: 바이트}"""
+    _JOB.sink = sink = {}
+    try:
+        DIAGRAM_BY_NAME[name]()
+    finally:
+        _JOB.sink = None
+    return sink
+
+
+def font_report(names):
+    """path(글리프 윤곽선) 모드와 text 모드의 그림별 바이트 비교 표"""
+    global TEXT_MODE
+    sizes = {}
+    for mode in TEXT_MODES:
+        TEXT_MODE = mode
+        setup_matplotlib()
+        for name in names:
+            for rel, data in render_bytes(name).items():
+                sizes.setdefault(rel, {})[mode] = len(data)
+    print(f"\n{'그림':<44} {'path':>9} {'text':>9} {'비율':>6}")
+    total = dict.fromkeys(TEXT_MODES, 0)
+    for rel, by_mode in sorted(sizes.items()):
+        for mode in TEXT_MODES:
+            total[mode] += by_mode[mode]
+        ratio = by_mode['text'] / by_mode['path']
+        print(f"{os.path.basename(rel):<44} {by_mode['path']:>9,} {by_mode['text']:>9,} {ratio:>6.0%}")
+    print(f"{'합계':<44} {total['path']:>9,} {total['text']:>9,} "
+          f"{total['text'] / total['path']:>6.0%}")
+
+
+# ============================================================
+# 챕터 스프라이트 — 챕터의 그림을 sprite.svg 하나로 묶어 fragment(#그림)로 참조
+# ============================================================
+SPRITE_NAME = 'sprite.svg'
+SPRITE_MIN_FIGURES = 2
+
+_SPRITE_FILE = re.compile(r'(?:^|/)sprite(?:-dark)?\.svg(?:\.gz|\.br)?$')
+
+
+def chapter_figures():
+    """챕터 -> 그 챕터에 저장되는 SVG 파일 이름 (다이어그램 순서)"""
+    figures = {}
+    for outputs in output_index().values():
+        for chapter, filename in outputs:
+            figures.setdefault(chapter, []).append(filename)
+    return figures
+
+
+def write_sprites():
+    """챕터마다 스프라이트를 다시 묶어 바뀌었을 때만 저장
+    [(BASE_DIR 기준 경로, 그림 수, 그림 바이트 목록, 스프라이트 바이트)] 반환.
+    이미 저장된 그림 파일을 읽어 묶으므로 렌더링 뒤에 부른다."""
+    variants = [(SPRITE_NAME, lambda filename: filename)]
+    if DARK_VARIANT:
+        variants.append((dark_name(SPRITE_NAME), dark_name))
+    results = []
+    for chapter, filenames in chapter_figures().items():
+        if len(filenames) < SPRITE_MIN_FIGURES:
+            continue
+        folder = os.path.join(BASE_DIR, chapter)
+        for sprite, variant in variants:
+            figures = []
+            for filename in filenames:
+                path = os.path.join(folder, variant(filename))
+                if os.path.exists(path):
+                    with open(path, 'rb') as f:
+                        figures.append((os.path.splitext(filename)[0], f.read()))
+            if not figures:
+                continue
+            data = svg_sprite.build(figures)
+            path = os.path.join(folder, sprite)
+            write_if_changed(path, data)
+            if PRECOMPRESS:
+                precompress(path, data)
+            results.append((os.path.relpath(path, BASE_DIR), len(figures),
+                            [d for _, d in figures], data))
+    return results
+
+
+def sprite_report(results):
+    """스프라이트마다 개별 파일 합계와 비교 (원본, gzip)"""
+    print(f"\n{'스프라이트':<32} {'그림':>4} {'개별':>9} {'묶음':>9} {'개별 gz':>9} {'묶음 gz':>9}")
+    for rel, count, parts, data in results:
+        parts_gz = sum(compressed_sizes(part)['gzip'] for part in parts)
+        print(f"{rel:<32} {count:>4} {sum(map(len, parts)):>9,} "
+              f"{len(data):>9,} {parts_gz:>9,} {compressed_sizes(data)['gzip']:>9,}")
+
+
+# ============================================================
+# 자산 매니페스트와 정리 — docs/assets/images의 이미지마다 해시와 참조 페이지
+# ============================================================
+IMAGES_DIR = os.path.join(DOCS_DIR, 'assets', 'images')
+ASSETS_PATH = os.path.join(CACHE_DIR, 'assets.json')
+IMAGE_EXTENSIONS = ('.svg', '.png', '.webp', '.jpg', '.jpeg', '.gif', '.svg.gz', '.svg.br')
+
+# 파생 파일 이름 — x-dark.svg, x.webp, x@2x.png, x.svg.gz -> x.svg
+_VARIANT = re.compile(r'(?:-dark)?(?:@[\d.]+x)?\.(?:svg|png|webp)(?:\.gz|\.br)?$')
+
+
+def variant_of(path):
+    """다크/래스터 변형이나 사전 압축본이면 원본 SVG 경로, 아니면 None"""
+    base = _VARIANT.sub('.svg', path)
+    return None if base == path else base
+
+
+def image_references():
+    """docs 기준 이미지 경로 -> 참조하는 페이지/스타일시트 목록"""
+    refs = {}
+    sources = [(page, site_pages.image_refs) for page in site_pages.markdown_pages(DOCS_DIR)]
+    sources += [(css, site_pages.url_refs) for css in site_pages.stylesheets(DOCS_DIR)]
+    for source, parse in sources:
+        with open(os.path.join(DOCS_DIR, source), encoding='utf-8') as f:
+            for ref in parse(f.read(), source):
+                refs.setdefault(ref, []).append(source)
+    return refs
+
+
+def asset_entry(path, paths, refs, producers):
+    """docs 기준 이미지 하나의 매니페스트 항목 — paths는 있는 이미지 전체 (변형 판별용)"""
+    with open(os.path.join(DOCS_DIR, path), 'rb') as f:
+        data = f.read()
+    entry = {'sha256': hashlib.sha256(data).hexdigest(), 'bytes': len(data),
+             'pages': refs.get(path, [])}
+    base = variant_of(path)
+    if base in paths and path not in refs:
+        entry['variant_of'] = base
+        entry['pages'] = refs.get(base, [])
+    if _SPRITE_FILE.search(path) and path not in refs:
+        # 스프라이트는 묶은 그림을 참조하는 페이지가 씀
+        folder = path.rsplit('/', 1)[0]
+        members = [f'{folder}/{f}' for f in chapter_figures().get(folder.rsplit('/', 1)[-1], [])]
+        entry['sprite_of'] = members
+        entry['pages'] = sorted({page for m in members for page in refs.get(m, [])})
+        entry.pop('variant_of', None)
+    diagram = producers.get(path) or producers.get(base)
+    if diagram:
+        entry['diagram'] = diagram
+    return entry
+
+
+def asset_manifest():
+    """이미지마다 {sha256, bytes, pages, diagram, variant_of} — 변형은 원본의 참조를 물려받음"""
+    refs = image_references()
+    producers = figure_index()
+    paths = []
+    for dirpath, dirnames, filenames in os.walk(IMAGES_DIR):
+        dirnames.sort()
+        paths += [os.path.relpath(os.path.join(dirpath, f), DOCS_DIR).replace(os.sep, '/')
+                  for f in sorted(filenames) if f.lower().endswith(IMAGE_EXTENSIONS)]
+    return {path: asset_entry(path, set(paths), refs, producers) for path in paths}
+
+
+def load_assets():
+    try:
+        with open(ASSETS_PATH, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def update_assets(changed):
+    """ROOT_DIR 기준 출력 경로 중 이미지만 다시 해시해 assets.json 갱신
+    (저장된 매니페스트가 없으면 docs/assets/images 전체를 처음부터)"""
+    assets = load_assets()
+    if assets is None:
+        save_assets(asset_manifest())
+        return
+    images = os.path.relpath(IMAGES_DIR, DOCS_DIR).replace(os.sep, '/') + '/'
+    changed = {os.path.relpath(os.path.join(ROOT_DIR, p), DOCS_DIR).replace(os.sep, '/')
+               for p in changed}
+    changed = {p for p in changed if p.startswith(images) and p.lower().endswith(IMAGE_EXTENSIONS)}
+    if not changed:
+        return
+    refs = image_references()
+    producers = figure_index()
+    present = {p for p in changed if os.path.isfile(os.path.join(DOCS_DIR, p))}
+    paths = (set(assets) - changed) | present
+    for path in changed:
+        if path in present:
+            assets[path] = asset_entry(path, paths, refs, producers)
+        else:
+            assets.pop(path, None)
+    save_assets(dict(sorted(assets.items())))
+
+
+def save_assets(assets):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    write_if_changed(ASSETS_PATH, (json.dumps(assets, ensure_ascii=False, indent=1,
+                                              sort_keys=True) + '\n').encode('utf-8'))
+
+
+def gc(remove=False):
+    """참조되지 않은 이미지와 내용이 같은 중복을 보고 — remove면 참조 없는 이미지를 삭제
+    참조되는 중복은 페이지를 고쳐야 하므로 보고만 한다."""
+    assets = asset_manifest()
+    orphans = [p for p, e in assets.items() if not e['pages']]
+    by_hash = {}
+    for path, entry in assets.items():
+        by_hash.setdefault(entry['sha256'], []).append(path)
+    duplicates = []
+    for paths in by_hash.values():
+        keep = next((p for p in paths if assets[p]['pages']), paths[0])
+        duplicates += [(p, keep) for p in paths if p != keep]
+
+    print(f"이미지 {len(assets)}개, {sum(e['bytes'] for e in assets.values()):,} bytes")
+    print(f"\n참조 없음 {len(orphans)}개 ({sum(assets[p]['bytes'] for p in orphans):,} bytes):")
+    for path in orphans:
+        print(f"  {path}")
+    print(f"\n중복 {len(duplicates)}개:")
+    for path, keep in duplicates:
+        note = '' if path in orphans else '  (참조됨 — 페이지를 원본으로 고칠 것)'
+        print(f"  {path} = {keep}{note}")
+
+    if remove and orphans:
+        for path in orphans:
+            full = os.path.join(DOCS_DIR, path)
+            os.remove(full)
+            # 비게 된 폴더도 정리 (docs/assets/images 자체는 남김)
+            folder = os.path.dirname(full)
+            while folder != IMAGES_DIR and not os.listdir(folder):
+                os.rmdir(folder)
+                folder = os.path.dirname(folder)
+        print(f"\n{len(orphans)}개 삭제")
+        assets = asset_manifest()
+    save_assets(assets)
+    return 0
+
+
+# ============================================================
+# 페이지 무게 예산 — nav의 페이지마다 본문 이미지 바이트 합계 (원본, gzip, brotli)
+# ============================================================
+CONFIG_PATH = os.path.join(ROOT_DIR, 'mkdocs.yml')
+
+# 페이지 하나가 싣는 이미지 합계 상한 (바이트) — 커밋된 그림 기준 가장 무거운 2장
+# (6장, 원본 약 242 KB, gzip 약 60 KB)에 25~35% 여유. 넘으면 mkdocs 빌드와 --page-report 모두 실패
+PAGE_BUDGET = {'raw': 300 * 1024, 'gzip': 80 * 1024}
+PAGE_METRICS = ('raw', 'gzip', 'brotli')
+
+
+def load_nav(config_path=CONFIG_PATH):
+    """mkdocs.yml의 nav — nav만 필요하므로 !!python/name, !ENV 같은 태그는 무시"""
+    import yaml     # mkdocs 의존성
+
+    class Loader(yaml.SafeLoader):
+        pass
+    Loader.add_multi_constructor('', lambda loader, suffix, node: None)
+    with open(config_path, encoding='utf-8') as f:
+        return (yaml.load(f, Loader) or {}).get('nav')
+
+
+# 페이지 무게 지표 -> 같은 설정으로 만든 사전 압축본 형식
+PAGE_METRIC_FORMATS = {'gzip': 'gz', 'brotli': 'br'}
+
+
+def compressed_sizes(data, path=None):
+    """{'raw', 'gzip', 'brotli'} 바이트 — brotli는 모듈이 있을 때만
+    path 옆 사전 압축본(precompress와 같은 설정)이 data와 같으면 다시 압축하지 않고 그 크기를 쓴다."""
+    sizes = {'raw': len(data)}
+    for metric, fmt in PAGE_METRIC_FORMATS.items():
+        codec = _codec(fmt)
+        if codec is None:
+            continue
+        compress, decompress = codec
+        try:
+            with open(f'{path}.{fmt}', 'rb') as f:
+                packed = f.read()
+            if decompress(packed) == data:
+                sizes[metric] = len(packed)
+                continue
+        except Exception:       # path 없음, 압축본 없음, 깨진 압축본
+            pass
+        sizes[metric] = len(compress(data))
+    return sizes
+
+
+def page_weights(nav=None):
+    """nav 순서대로 [(페이지, 이미지 수, {지표: 바이트})] — nav가 없으면 docs의 모든 페이지
+    다크 변형과 래스터는 테마/화면에 따라 하나만 받으므로 본문이 참조한 그림만 센다."""
+    if nav:
+        pages = [page for _, page in site_pages.nav_pages(nav)]
+    else:
+        pages = site_pages.markdown_pages(DOCS_DIR)
+    sizes = {}
+    report = []
+    for page in pages:
+        with open(os.path.join(DOCS_DIR, page), encoding='utf-8') as f:
+            refs = site_pages.image_refs(f.read(), page)
+        totals = {}
+        count = 0
+        for ref in refs:
+            path = os.path.join(DOCS_DIR, ref)
+            if not os.path.isfile(path):
+                continue        # 없는 그림은 mkdocs가 경고
+            if ref not in sizes:
+                with open(path, 'rb') as f:
+                    sizes[ref] = compressed_sizes(f.read(), path)
+            for metric, size in sizes[ref].items():
+                totals[metric] = totals.get(metric, 0) + size
+            count += 1
+        report.append((page, count, totals))
+    return report
+
+
+def page_report(report, budget):
+    """페이지별 표 출력 — 예산을 넘은 [(페이지, 지표, 바이트)] 반환"""
+    print(f"{'페이지':<40} {'그림':>4} {'원본':>9} {'gzip':>9} {'brotli':>9}")
+    over = []
+    for page, count, totals in report:
+        exceeded = [(page, m, totals[m]) for m, limit in budget.items()
+                    if totals.get(m, 0) > limit]
+        over += exceeded
+        cells = ' '.join(f"{totals[m]:>9,}" if m in totals else f"{'-':>9}" for m in PAGE_METRICS)
+        print(f"{page:<40} {count:>4} {cells}" + ("  !!" if exceeded else ""))
+    limits = ', '.join(f'{m} {limit // 1024:,} KB' for m, limit in budget.items())
+    print(f"\n예산 (페이지당): {limits}")
+    return over
+
+
+def parse_budget(text):
+    """'raw=300,gzip=80' (KB) -> {'raw': 307200, 'gzip': 81920}"""
+    budget = {}
+    for part in filter(None, text.split(',')):
+        metric, _, kb = part.partition('=')
+        if metric not in PAGE_METRICS or not kb:
+            raise SystemExit(f"잘못된 페이지 예산: {part} (예: raw=300,gzip=80)")
+        budget[metric] = int(float(kb) * 1024)
+    return budget
+
+
+# ============================================================
+# 벤치마크 / 프로파일
+# ============================================================
+BENCH_PATH = os.path.join(CACHE_DIR, 'bench.json')
+
+
+def bench_one(name, profile_dir=None):
+    """다이어그램 하나를 파일 없이 렌더링하며 단계별 시간과 자원을 잰다"""
+    import cProfile
+    _JOB.phases, _JOB.sink = phases, sink = {}, {}
+    profiler = cProfile.Profile() if profile_dir else None
+    start = time.perf_counter()
+    try:
+        if profiler:
+            profiler.runcall(DIAGRAM_BY_NAME[name])
+        else:
+            DIAGRAM_BY_NAME[name]()
+    finally:
+        wall = time.perf_counter() - start
+        _JOB.phases = _JOB.sink = None
+    if profiler:
+        profiler.dump_stats(os.path.join(profile_dir, f'{name}.prof'))
+    artists_count = phases.pop('artists_count', 0)
+    phases['artists'] = wall - sum(phases.values())
+    # ru_maxrss: Linux는 KiB, macOS는 바이트
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    rss_mb = rss / (1024 * 1024) if sys.platform == 'darwin' else rss / 1024
+    return name, {
+        'wall_s': round(wall, 5),
+        'phases_s': {k: round(v, 5) for k, v in sorted(phases.items())},
+        'peak_rss_mb': round(rss_mb, 1),
+        'artists': artists_count,
+        'bytes': sum(len(data) for data in sink.values()),
+    }
+
+
+def bench(names, jobs, profile_dir=None):
+    """다이어그램마다 새 프로세스에서 측정 — peak RSS가 그림별 값이 되도록"""
+    if profile_dir:
+        os.makedirs(profile_dir, exist_ok=True)
+    workers = max(1, min(jobs, len(names)))
+    if sys.version_info >= (3, 11):
+        from concurrent.futures import ProcessPoolExecutor
+        pool = ProcessPoolExecutor(max_workers=workers, max_tasks_per_child=1,
+                                   initializer=init_worker, initargs=(current_options(),))
+        with pool:
+            futures = [pool.submit(bench_one, name, profile_dir) for name in names]
+            results = dict(f.result() for f in futures)
+    else:
+        # max_tasks_per_child는 3.11부터 — 그 전에는 multiprocessing.Pool의 maxtasksperchild
+        # (chunksize=1이어야 작업 하나가 프로세스 하나)
+        import multiprocessing
+        with multiprocessing.Pool(workers, init_worker, (current_options(),),
+                                  maxtasksperchild=1) as pool:
+            results = dict(pool.starmap(bench_one, [(name, profile_dir) for name in names],
+                                        chunksize=1))
+    return {
+        'meta': {
+            'options': current_options(),
+            'matplotlib': matplotlib_version(),
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+        },
+        'diagrams': results,
+    }
+
+
+def print_bench(report, baseline=None):
+    base = (baseline or {}).get('diagrams', {})
+    print(f"\n{'다이어그램':<12} {'전체ms':>8} {'axes':>7} {'artists':>8} {'savefig':>8} "
+          f"{'optimize':>8} {'raster':>7} {'RSS MB':>7} {'아티스트':>6} {'bytes':>8}  기준 대비")
+    for name, r in report['diagrams'].items():
+        ph = r['phases_s']
+        ms = {k: ph.get(k, 0.0) * 1000
+              for k in ('make_axes', 'artists', 'savefig', 'optimize', 'raster')}
+        line = (f"{name:<12} {r['wall_s'] * 1000:>8.1f} {ms['make_axes']:>7.1f} "
+                f"{ms['artists']:>8.1f} {ms['savefig']:>8.1f} {ms['optimize']:>8.1f} {ms['raster']:>7.1f} "
+                f"{r['peak_rss_mb']:>7.1f} {r['artists']:>6} {r['bytes']:>8,}")
+        if name in base:
+            b = base[name]
+            line += (f"  시간 {r['wall_s'] / b['wall_s'] - 1:+.0%}, "
+                     f"크기 {r['bytes'] / max(b['bytes'], 1) - 1:+.0%}")
+        print(line)
+    total = sum(r['wall_s'] for r in report['diagrams'].values())
+    print(f"{'합계':<12} {total * 1000:>8.1f}")
+
+
+def _report(results, total, manifest, keys):
+    """결과를 순서대로 출력하고 성공한 항목은 매니페스트에 기록 — (실패 목록, 크기 목록)"""
+    failures = []
+    sizes = []
+    for i, result in enumerate(results, 1):
+        name, error = result['name'], result['error']
+        print(f"[{i:2d}/{total}] {name}" + ("  !! 실패" if error else ""))
+        for line in result['log']:
+            print(line)
+        sizes.extend(result['sizes'])
+        if error:
+            failures.append((name, error))
+            manifest.pop(name, None)
+        elif result['over']:
+            # 예산을 넘은 다이어그램은 캐시와 잠금 파일에 넣지 않아 다음 실행에서도 다시 검사
+            manifest.pop(name, None)
+        else:
+            manifest[name] = {'key': keys[name], 'outputs': result['outputs']}
+    return failures, sizes
+
+
+def size_report(sizes, budget):
+    """그림별 크기 표 — 기준 크기(잠금 파일, 없으면 기존 파일)보다 budget(비율) 넘게 커진 그림 목록 반환"""
+    print(f"\n{'그림':<40} {'렌더링':>9} {'최적화':>9} {'기준':>9} {'변화':>7}")
+    over = []
+    for rel, raw, final, previous in sizes:
+        change = ''
+        if previous:
+            growth = final / previous - 1
+            change = f'{growth:+.1%}'
+            if growth > budget:
+                over.append((rel, previous, final))
+                change += ' !!'
+        prev = f'{previous:,}' if previous is not None else '-'
+        print(f"{os.path.basename(rel):<40} {raw:>9,} {final:>9,} {prev:>9} {change:>7}")
+    total_raw = sum(s[1] for s in sizes)
+    total_final = sum(s[2] for s in sizes)
+    print(f"{'합계':<40} {total_raw:>9,} {total_final:>9,}")
+    return over
+
+
+def compression_report(sizes):
+    """이번에 저장한 SVG의 사전 압축본 크기와 압축률 표"""
+    formats = [fmt for fmt in PRECOMPRESS if _codec(fmt) is not None]
+    svgs = [(rel, final) for rel, _, final, _ in sizes if rel.endswith('.svg')]
+    if not formats or not svgs:
+        return
+    print(f"\n{'사전 압축':<40} {'SVG':>9}" + ''.join(f" {fmt:>9} {'비율':>6}" for fmt in formats))
+    totals = dict.fromkeys(formats, 0)
+    for rel, final in svgs:
+        line = f"{os.path.basename(rel):<40} {final:>9,}"
+        for fmt in formats:
+            size = os.path.getsize(os.path.join(ROOT_DIR, f'{rel}.{fmt}'))
+            totals[fmt] += size
+            line += f" {size:>9,} {size / final:>6.1%}"
+        print(line)
+    total = sum(final for _, final in svgs)
+    print(f"{'합계':<40} {total:>9,}"
+          + ''.join(f" {totals[fmt]:>9,} {totals[fmt] / total:>6.1%}" for fmt in formats))
+
+
+def codec_warning():
+    """만들 수 없는 사전 압축 형식 경고 문구 — 모두 만들 수 있으면 None"""
+    missing = missing_codecs()
+    if not missing:
+        return None
+    return (f"brotli 모듈이 없어 {', '.join('.svg.' + fmt for fmt in missing)} 압축본을 만들지 않고 "
+            "기존 파일은 지웁니다 — pip install brotli")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='플랫 카드 스타일 다이어그램 생성')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1,
+                        help='동시에 렌더링할 프로세스 수 (기본: CPU 코어 수)')
+    parser.add_argument('--list', action='store_true',
+                        help='다이어그램과 출력 파일 목록만 출력')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='렌더링할 다이어그램만 출력하고 아무것도 쓰지 않음')
+    parser.add_argument('--out-dir', metavar='DIR',
+                        help='출력 루트 폴더 (기본: docs/assets/images/figures)')
+    parser.add_argument('--watch', action='store_true',
+                        help='프로세스를 띄워 둔 채 파일이 바뀔 때마다 바뀐 다이어그램만 렌더링')
+    parser.add_argument('--executor', choices=EXECUTORS, default=EXECUTOR,
+                        help='-j > 1일 때 프로세스 풀 또는 스레드 풀 (기본: %(default)s)')
+    parser.add_argument('--force', action='store_true',
+                        help='캐시를 무시하고 모두 다시 렌더링')
+    parser.add_argument('--only', action='append', default=[], metavar='NAME',
+                        help='지정한 다이어그램만 렌더링 (예: diagram_03, 03, book-roadmap.svg / 반복 가능)')
+    parser.add_argument('--engine', choices=ENGINES, default=ENGINE,
+                        help='카드 다이어그램 렌더링 엔진 (native: SVG 직접 기록)')
+    parser.add_argument('--text-mode', choices=TEXT_MODES, default=TEXT_MODE,
+                        help="글자 출력 방식 (text: <text> 요소 + 'Noto Sans KR')")
+    parser.add_argument('--font', action='append', default=[], metavar='FAMILY',
+                        help='한국어 글꼴 후보 맨 앞에 추가 (반복 가능)')
+    parser.add_argument('--check-text', action='store_true',
+                        help='스펙 카드의 글이 카드를 넘치는지 렌더링 없이 검사 (fit 결과 포함)')
+    parser.add_argument('--font-report', action='store_true',
+                        help='path/text 모드의 그림별 바이트를 비교하고 종료 (파일은 쓰지 않음)')
+    parser.add_argument('--no-optimize', action='store_true',
+                        help='SVG 후처리 최적화를 끔')
+    parser.add_argument('--precision', type=int, default=svg_optimize.DEFAULTS['precision'],
+                        help='최적화할 때 남길 좌표 소수점 자릿수')
+    parser.add_argument('--no-dark', action='store_true',
+                        help='다크 모드 변형(x-dark.svg)을 만들지 않음')
+    parser.add_argument('--dark-only', action='store_true',
+                        help='렌더링 없이 기존 SVG의 색만 바꿔 다크 변형과 사전 압축본을 씀 (SVG는 그대로)')
+    parser.add_argument('--lock-existing', action='store_true',
+                        help='렌더링 없이 디스크의 그림을 현재 소스 키로 잠금 파일에 기록 '
+                             '(커밋된 그림을 최신이자 크기 예산의 기준으로 받아들임)')
+    parser.add_argument('--raster', action='store_true',
+                        help='모든 그림의 WebP/PNG도 함께 저장 (기본: raster=True인 그림만)')
+    parser.add_argument('--no-raster', action='store_true',
+                        help='래스터 내보내기를 끔')
+    parser.add_argument('--raster-formats', default=','.join(RASTER['formats']), metavar='LIST',
+                        help=f"래스터 형식 ({', '.join(RASTER_ENCODE)} 중, 쉼표 구분)")
+    parser.add_argument('--raster-scales', default=','.join(map(str, RASTER['scales'])),
+                        metavar='LIST', help='래스터 배율 (쉼표 구분, 1 = CSS 픽셀 크기)')
+    parser.add_argument('--precompress', default=','.join(PRECOMPRESS), metavar='LIST',
+                        help=f"SVG 옆에 저장할 사전 압축본 ({', '.join(PRECOMPRESS_FORMATS)} 중, 쉼표 구분)")
+    parser.add_argument('--no-precompress', action='store_true',
+                        help='사전 압축본(.svg.gz/.svg.br)을 만들지 않음')
+    parser.add_argument('--sprite', action='store_true',
+                        help='챕터마다 그림을 묶은 sprite.svg도 만듦 (mkdocs 훅이 fragment로 참조)')
+    parser.add_argument('--size-budget', type=float, default=10.0, metavar='PCT',
+                        help='잠금 파일의 커밋 크기(없으면 기존 파일)보다 이 비율(%%) 넘게 '
+                             '커지면 실패 (기본: 10, 의도한 증가는 큰 값이나 inf로 받아들임)')
+    parser.add_argument('--gc', action='store_true',
+                        help='docs/assets/images에서 참조 없는 이미지와 중복을 보고')
+    parser.add_argument('--gc-remove', action='store_true',
+                        help='--gc와 같되 참조 없는 이미지를 삭제')
+    parser.add_argument('--page-report', action='store_true',
+                        help='nav의 페이지별 이미지 바이트(원본/gzip/brotli)를 보고, 예산을 넘으면 실패')
+    parser.add_argument('--page-budget', metavar='SPEC',
+                        default=','.join(f'{m}={v // 1024}' for m, v in PAGE_BUDGET.items()),
+                        help='페이지당 이미지 예산, KB (기본: %(default)s)')
+    parser.add_argument('--bench', action='store_true',
+                        help='파일을 쓰지 않고 다이어그램별 단계 시간, peak RSS, 아티스트 수, 바이트 측정')
+    parser.add_argument('--bench-out', default=BENCH_PATH, metavar='PATH',
+                        help='벤치마크 결과 JSON 경로 (기본: .diagram-cache/bench.json)')
+    parser.add_argument('--bench-baseline', metavar='PATH',
+                        help='비교할 이전 벤치마크 JSON')
+    parser.add_argument('--profile', metavar='DIR',
+                        help='벤치마크 중 다이어그램별 cProfile 통계(<이름>.prof)를 DIR에 저장')
+    return parser.parse_args(argv)
+
+
+def list_diagrams():
+    for name, outputs in output_index().items():
+        files = ', '.join(f'{chapter}/{filename}' for chapter, filename in outputs)
+        print(f"{name}  {files}")
+
+
+def main(argv=None):
+    global ENGINE, EXECUTOR, TEXT_MODE, OPTIMIZE, RASTER, DARK_VARIANT, PRECOMPRESS, \
+        SPRITE, BASE_DIR, KOREAN_FONT_CHAIN
+    args = parse_args(argv)
+    KOREAN_FONT_CHAIN = args.font + [f for f in KOREAN_FONT_CHAIN if f not in args.font]
+    ENGINE = args.engine
+    EXECUTOR = args.executor
+    TEXT_MODE = args.text_mode
+    OPTIMIZE = None if args.no_optimize else {**OPTIMIZE, 'precision': args.precision}
+    formats = [f for f in args.raster_formats.split(',') if f]
+    unknown = set(formats) - set(RASTER_ENCODE)
+    if unknown:
+        raise SystemExit(f"알 수 없는 래스터 형식: {', '.join(sorted(unknown))}")
+    scales = [int(v) if float(v).is_integer() else float(v)
+              for v in args.raster_scales.split(',') if v]
+    DARK_VARIANT = not args.no_dark
+    compressed = [f for f in args.precompress.split(',') if f]
+    unknown = set(compressed) - set(PRECOMPRESS_FORMATS)
+    if unknown:
+        raise SystemExit(f"알 수 없는 사전 압축 형식: {', '.join(sorted(unknown))}")
+    PRECOMPRESS = [] if args.no_precompress else compressed
+    SPRITE = SPRITE or args.sprite
+    RASTER = {'all': args.raster, 'formats': [] if args.no_raster else formats,
+              'scales': scales}
+    if args.out_dir:
+        BASE_DIR = os.path.abspath(args.out_dir)
+    if args.list:
+        list_diagrams()
+        return 0
+    if args.page_report:
+        budget = parse_budget(args.page_budget)
+        report = page_weights(load_nav())
+        if 'brotli' in budget and not any('brotli' in t for *_, t in report):
+            print("brotli 모듈이 없어 brotli 예산은 검사하지 않습니다", file=sys.stderr)
+        over = page_report(report, budget)
+        for page, metric, size in over:
+            print(f"  {page}: {metric} {size:,} bytes > {budget[metric]:,}", file=sys.stderr)
+        return 1 if over else 0
+    if args.gc or args.gc_remove:
+        return gc(remove=args.gc_remove)
+    if args.lock_existing:
+        return lock_existing(resolve_names(args.only) if args.only else list(DIAGRAM_BY_NAME))
+    if args.dark_only:
+        return recolor_existing(resolve_names(args.only) if args.only else list(DIAGRAM_BY_NAME))
+    if args.check_text:
+        return check_text(resolve_names(args.only) if args.only else list(DIAGRAM_BY_NAME))
+    if args.font_report:
+        font_report(resolve_names(args.only) if args.only else list(DIAGRAM_BY_NAME))
+        return 0
+    if args.bench or args.profile:
+        report = bench(resolve_names(args.only) if args.only else list(DIAGRAM_BY_NAME),
+                       args.jobs, args.profile)
+        baseline = None
+        if args.bench_baseline:
+            with open(args.bench_baseline, encoding='utf-8') as f:
+                baseline = json.load(f)
+        print_bench(report, baseline)
+        os.makedirs(os.path.dirname(os.path.abspath(args.bench_out)), exist_ok=True)
+        with open(args.bench_out, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=1)
+        print(f"\n벤치마크 결과: {args.bench_out}")
+        return 0
+    if args.watch:
+        return watch(args.size_budget)
+    return build(args.only, args.force, args.jobs, args.dry_run, args.size_budget)
+
+
+def stale_names(names=None):
+    """캐시 키가 바뀌었거나 출력 파일이 없는 다이어그램 (names가 없으면 전체에서)
+    로컬 매니페스트에 없어도 잠금 파일과 소스·출력 해시가 맞으면(커밋된 그대로) 최신으로 본다."""
+    manifest = load_manifest()
+    common = common_key()
+    lock = None
+    stale = []
+    for n in (DIAGRAM_BY_NAME if names is None else names):
+        if is_fresh(manifest.get(n), diagram_key(n, common)):
+            continue
+        if lock is None:
+            lock, portable = load_lock(), common_key(portable=True)
+        if not is_locked(lock.get(n), diagram_key(n, portable)):
+            stale.append(n)
+    return stale
+
+
+def render(names, jobs=1):
+    """names를 렌더링하고 매니페스트 갱신 — (실패 목록, 크기 목록)"""
+    manifest = load_manifest()
+    common = common_key()
+    keys = {name: diagram_key(name, common) for name in names}
+    failures, sizes = _report(run(names, jobs), len(names), manifest, keys)
+    save_manifest(manifest)
+    update_lock([name for name in names if name in manifest], manifest)
+    return failures, sizes
+
+
+def build(only=(), force=False, jobs=1, dry_run=False, size_budget=10.0):
+    """캐시를 보고 바뀐 다이어그램만 렌더링 — 종료 코드 반환
+    size_budget(%)을 넘게 커진 출력은 저장하되 매니페스트와 잠금 파일에 남기지 않고 실패한다."""
+    global SIZE_BUDGET
+    if only:
+        names = resolve_names(only)
+    elif force:
+        names = list(DIAGRAM_BY_NAME)
+    else:
+        names = stale_names()
+    skipped = len(DIAGRAM_BY_NAME) - len(names)
+    if dry_run:
+        for name in names:
+            print(name)
+        print(f"렌더링 {len(names)}개, 변경 없음 {skipped}개")
+        return 0
+
+    print(f"다이어그램 생성 시작 (플랫 카드 스타일, engine={ENGINE}, "
+          f"text-mode={TEXT_MODE}, jobs={jobs}, executor={EXECUTOR})...")
+    warning = codec_warning()
+    if warning:
+        print(f"경고: {warning}", file=sys.stderr)
+    if skipped and not only:
+        print(f"  변경 없음 {skipped}개 건너뜀 (--force로 전체 렌더링)")
+    SIZE_BUDGET = size_budget / 100
+    try:
+        failures, sizes = render(names, jobs)
+    finally:
+        SIZE_BUDGET = None
+    over = size_report(sizes, size_budget / 100) if sizes else []
+    compression_report(sizes)
+    changed = [rel for rel, *_ in sizes]
+    # 사전 압축본은 크기 목록에 없으므로 SVG 옆 이름으로 (없으면 매니페스트에서 빠짐)
+    changed += [f'{rel}.{fmt}' for rel in changed if rel.endswith('.svg')
+                for fmt in PRECOMPRESS_FORMATS]
+    if SPRITE:
+        sprites = write_sprites()
+        sprite_report(sprites)
+        changed += [os.path.relpath(os.path.join(BASE_DIR, path), ROOT_DIR) + suffix
+                    for path, *_ in sprites
+                    for suffix in [''] + [f'.{fmt}' for fmt in PRECOMPRESS_FORMATS]]
+    update_assets(changed)
+
+    done = len(names) - len(failures)
+    print(f"\n완료! {done}개 다이어그램이 {BASE_DIR}에 저장되었습니다.")
+    if over:
+        print(f"\n크기 예산 초과 {len(over)}개 (잠금 파일 기준 +{size_budget:g}% 이상) — 새 출력은 "
+              "저장했지만 잠금 파일에 기록하지 않아 받아들일 때까지 매번 실패합니다. "
+              "의도한 변경이면 --size-budget을 늘려(inf 가능) 다시 실행하세요:", file=sys.stderr)
+        for rel, previous, final in over:
+            print(f"  {rel}: {previous:,} -> {final:,} bytes ({final / previous - 1:+.1%})",
+                  file=sys.stderr)
+    if failures:
+        print(f"\n실패 {len(failures)}개:", file=sys.stderr)
+        for name, error in failures:
+            print(f"--- {name} ---\n{error}", file=sys.stderr)
+        return 1
+    return 1 if over else 0
+
+
+# ============================================================
+# 감시 모드 — matplotlib을 띄워 둔 프로세스에서 바뀐 다이어그램만 다시 렌더링
+# ============================================================
+WATCH_INTERVAL = 0.25
+
+
+def watched_paths():
+    """감시할 파일 — 이 스크립트, 렌더링 모듈, 스펙 디렉터리(추가/삭제)와 스펙 파일"""
+    paths = [os.path.abspath(__file__), svg_native.__file__, svg_optimize.__file__,
+             svg_sprite.__file__, text_metrics.__file__, SPEC_DIR]
+    if os.path.isdir(SPEC_DIR):
+        paths += [os.path.join(SPEC_DIR, f) for f in sorted(os.listdir(SPEC_DIR))]
+    return paths
+
+
+def _mtimes(paths):
+    mtimes = {}
+    for path in paths:
+        try:
+            mtimes[path] = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            mtimes[path] = None
+    return mtimes
+
+
+def _reload_script():
+    """스크립트를 새 모듈로 다시 실행 — matplotlib 등 이미 import한 모듈은 그대로 재사용"""
+    # text_metrics 먼저 — svg_native가 그 LINE_HEIGHT를 가져다 씀
+    for module in (text_metrics, svg_native, svg_optimize, svg_sprite):
+        # importlib.reload 대신 파일 위치로 다시 실행 — sys.path에 없어도 됨 (mkdocs 훅)
+        spec = importlib.util.spec_from_file_location(module.__name__, module.__file__)
+        spec.loader.exec_module(module)
+    spec = importlib.util.spec_from_file_location('generate_diagrams_watch', __file__)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def watch(size_budget, interval=WATCH_INTERVAL):
+    """파일을 폴링하다 바뀌면 다시 읽어 함수 소스 해시가 달라진 다이어그램만 렌더링"""
+    options = {name: globals()[name] for name in CLI_OPTIONS}
+    module = sys.modules[__name__]
+    print("감시 모드 — 저장하면 바뀐 다이어그램만 다시 렌더링합니다 (Ctrl+C로 종료)")
+    init_worker(options)
+    build(size_budget=size_budget)
+    seen = _mtimes(watched_paths())
+    try:
+        while True:
+            time.sleep(interval)
+            current = _mtimes(module.watched_paths())
+            if current == seen:
+                continue
+            seen = current
+            start = time.perf_counter()
+            try:
+                module = _reload_script()
+            except Exception:
+                # 저장 중간 상태의 문법 오류 등 — 다음 저장을 기다림
+                traceback.print_exc()
+                continue
+            module.init_worker(options)
+            module.build(size_budget=size_budget)
+            print(f"  ({(time.perf_counter() - start) * 1000:.0f}ms)")
+    except KeyboardInterrupt:
+        print("\n감시 종료")
+    return 0
+
+
 if __name__ == '__main__':
-    print("다이어그램 생성 시작 (플랫 카드 스타일)...")
-    funcs = [
-        diagram_01, diagram_02, diagram_03, diagram_04,
-        diagram_05, diagram_06, diagram_07, diagram_08,
-        diagram_09, diagram_10, diagram_11, diagram_12,
-        diagram_13, diagram_14, diagram_15, diagram_16,
-    ]
-    for i, fn in enumerate(funcs, 1):
-        print(f"[{i:2d}/16] {fn.__name__}")
-        fn()
-    print(f"\n완료! {len(funcs)}개 다이어그램이 {BASE_DIR}에 저장되었습니다.")
+    sys.exit(main())
@@ -0,0 +1,261 @@
+"""
+mkdocs 훅 — 빌드 전에 페이지가 참조하는 다이어그램 그림을 최신으로 맞춘다
+mkdocs.yml의 hooks:에 등록되어 build와 serve 양쪽에서 동작한다.
+바뀐 페이지만 다시 읽어 그림 참조를 모으고, 그중 파일이 없거나 생성 코드/스펙이
+바뀐 그림만 generate_diagrams로 렌더링한다. 생성 코드가 바뀌면 모든 참조를 다시 검사.
+래스터(WebP/PNG)가 함께 있는 그림은 <picture>로 감싸 휴대폰 폭에서는 래스터를 받게 하되,
+압축한 SVG보다 작은 래스터만 <source>에 넣는다.
+다크 변형(x-dark.svg)이 있으면 나란히 넣어 extra.css가 테마에 따라 하나만 보여 준다.
+SPRITE가 켜져 있으면 챕터 스프라이트를 다시 묶고 그림을 sprite.svg#x로 참조한다.
+빌드가 끝나면 nav 페이지의 렌더링된 본문으로 한국어 n-gram 검색 색인(search_index)을 쓰고,
+페이지마다 이미지 바이트를 합산해 PAGE_BUDGET을 넘는 페이지가 있으면 빌드를 실패시킨다.
+새 클론에서는 커밋된 잠금 파일(figures.lock.json)과 소스·출력 해시가 맞는 그림을 최신으로 본다.
+DIAGRAMS_SKIP=1이거나 한글 글꼴(또는 matplotlib)이 없으면 렌더링하지 않고 경고만 남기며
+커밋된 그림을 그대로 쓴다.
+"""
+import contextlib
+import io
+import logging
+import os
+import posixpath
+import re
+import sys
+
+from mkdocs.exceptions import PluginError
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import generate_diagrams  # noqa: E402
+import search_index  # noqa: E402
+import site_pages  # noqa: E402
+import svg_sprite  # noqa: E402
+
+log = logging.getLogger('mkdocs.hooks.diagrams')
+
+SKIP_ENV = 'DIAGRAMS_SKIP'
+
+# Material 레이아웃의 휴대폰 폭 — 이보다 좁으면 SVG 대신 래스터
+RASTER_MEDIA = '(max-width: 44.9375em)'
+IMG_SVG = re.compile(r'<img\b[^>]*?\bsrc="([^"]+\.svg)"[^>]*>')
+PX_PER_PT = 96 / 72
+
+_gd = generate_diagrams
+_gd_mtimes = None       # 생성 코드/스펙 mtime — serve 중에 바뀌면 모듈을 다시 읽음
+_page_refs = {}         # 페이지 -> (mtime_ns, 이미지 참조)
+_sprite_views = {}      # 스프라이트 파일 -> (mtime_ns, {그림: (x, y, 폭, 높이)})
+_search_pages = {}      # 페이지 -> (URL, 제목, 렌더링된 본문 HTML) — 검색 색인용
+
+
+def _generator():
+    """(생성 스크립트 모듈, 다시 읽었는지) — 첫 빌드는 다시 읽은 것으로 취급"""
+    global _gd, _gd_mtimes
+    mtimes = _gd._mtimes(_gd.watched_paths())
+    reloaded = mtimes != _gd_mtimes
+    if reloaded and _gd_mtimes is not None:
+        _gd = _gd._reload_script()
+        mtimes = _gd._mtimes(_gd.watched_paths())
+    _gd_mtimes = mtimes
+    return _gd, reloaded
+
+
+def _changed_pages(docs_dir):
+    """mtime이 바뀐 페이지만 다시 읽어 참조 갱신 — 바뀐 페이지 목록 반환"""
+    pages = site_pages.markdown_pages(docs_dir)
+    for page in set(_page_refs) - set(pages):
+        del _page_refs[page]
+    changed = []
+    for page in pages:
+        path = os.path.join(docs_dir, page)
+        mtime = os.stat(path).st_mtime_ns
+        cached = _page_refs.get(page)
+        if cached is None or cached[0] != mtime:
+            with open(path, encoding='utf-8') as f:
+                _page_refs[page] = (mtime, site_pages.image_refs(f.read(), page))
+            changed.append(page)
+    return changed
+
+
+def _render(gd, stale):
+    log.info(f"다이어그램 {len(stale)}개 렌더링: {', '.join(stale)}")
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        failures, _ = gd.render(stale)
+    for line in out.getvalue().splitlines():
+        log.debug(line)
+    if failures:
+        details = '\n'.join(f"--- {name} ---\n{error}" for name, error in failures)
+        raise PluginError(f"다이어그램 {len(failures)}개 렌더링 실패\n{details}")
+
+
+def on_pre_build(config):
+    gd, reloaded = _generator()
+    changed = _changed_pages(config['docs_dir'])
+    pages = list(_page_refs) if reloaded else changed
+    index = gd.figure_index()
+    figures_dir = os.path.relpath(gd.BASE_DIR, gd.DOCS_DIR).replace(os.sep, '/') + '/'
+
+    names = []
+    for page in pages:
+        for ref in _page_refs[page][1]:
+            name = index.get(ref)
+            if name is None:
+                if ref.startswith(figures_dir):
+                    log.warning(f"{page}: {ref}를 만드는 다이어그램이 없습니다")
+            elif name not in names:
+                names.append(name)
+    stale = gd.stale_names(sorted(names)) if names else []
+    if stale and os.environ.get(SKIP_ENV):
+        log.warning(f"{SKIP_ENV} 설정 — 오래되었거나 없는 그림 {len(stale)}개를 그대로 둡니다: "
+                    + ', '.join(stale))
+        stale = []
+    if stale:
+        try:
+            gd.resolve_korean_font()
+        except (ImportError, RuntimeError) as e:
+            log.warning(f"렌더링할 수 없어 오래되었거나 없는 그림 {len(stale)}개를 그대로 둡니다 "
+                        f"({e}): " + ', '.join(stale))
+            stale = []
+    if stale:
+        warning = gd.codec_warning()
+        if warning:
+            log.warning(warning)
+        _render(gd, stale)
+    if gd.SPRITE and (stale or reloaded):
+        gd.write_sprites()
+
+
+def write_search_index(config):
+    """nav 순서로 페이지 본문을 모아 site_dir에 검색 색인과 압축본을 씀"""
+    pages = [_search_pages[path] for _, path in site_pages.nav_pages(config['nav'])
+             if path in _search_pages]
+    index = search_index.build(pages)
+    data = search_index.encode(index)
+    path = os.path.join(config['site_dir'], *search_index.INDEX_PATH.split('/'))
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    _gd.write_if_changed(path, data)
+    _gd.precompress(path, data)
+    log.info(f"검색 색인: 구역 {len(index['docs'])}개, 2-gram {len(index['bi']):,}개, "
+             f"3-gram {len(index['tri']):,}/{index['trigrams']:,}개 수록, {len(data):,} bytes")
+
+
+def on_post_build(config):
+    write_search_index(config)
+    report = _gd.page_weights(config['nav'])
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        over = _gd.page_report(report, _gd.PAGE_BUDGET)
+    for line in out.getvalue().splitlines():
+        log.debug(line)
+    if over:
+        details = '\n'.join(f"  {page}: {metric} {size:,} bytes > {_gd.PAGE_BUDGET[metric]:,}"
+                            for page, metric, size in over)
+        raise PluginError(f"이미지 예산을 넘은 페이지 {len(over)}건\n{details}")
+
+
+def svg_transfer_size(filename):
+    """SVG를 받을 때 내려가는 바이트 — 원본, gzip, brotli(사전 압축본 재사용) 중 가장 작은 값"""
+    with open(filename, 'rb') as f:
+        return min(_gd.compressed_sizes(f.read(), filename).values())
+
+
+def raster_sources(path):
+    """docs 기준 SVG 경로 옆의 래스터 — [(형식, [(픽셀 폭, 파일명)])], 배율이 다 있는 형식만
+    압축한 SVG보다 큰 래스터는 휴대폰에서 오히려 무거우므로 뺀다 (남는 배율이 없으면 형식째)."""
+    from PIL import Image
+    name = posixpath.basename(path)
+    folder = os.path.join(_gd.DOCS_DIR, posixpath.dirname(path))
+    svg_size = None
+    sources = []
+    for fmt in _gd.RASTER['formats']:
+        items = []
+        for scale in sorted(_gd.RASTER['scales']):
+            filename = _gd.raster_name(name, fmt, scale)
+            try:
+                with Image.open(os.path.join(folder, filename)) as image:
+                    items.append((image.width, filename))
+            except FileNotFoundError:
+                break
+        else:
+            if svg_size is None:
+                svg_size = svg_transfer_size(os.path.join(_gd.DOCS_DIR, path))
+            items = [(width, filename) for width, filename in items
+                     if os.path.getsize(os.path.join(folder, filename)) < svg_size]
+            if items:
+                sources.append((fmt, items))
+    return sources
+
+
+def sprite_view(path, sprite):
+    """docs 기준 SVG 경로 옆 스프라이트에서 그 그림의 (폭, 높이) pt — 스프라이트에 없으면 None"""
+    filename = os.path.join(_gd.DOCS_DIR, posixpath.dirname(path), sprite)
+    try:
+        mtime = os.stat(filename).st_mtime_ns
+    except FileNotFoundError:
+        return None
+    cached = _sprite_views.get(filename)
+    if cached is None or cached[0] != mtime:
+        with open(filename, 'rb') as f:
+            cached = _sprite_views[filename] = (mtime, svg_sprite.views(f.read()))
+    box = cached[1].get(posixpath.splitext(posixpath.basename(path))[0])
+    return box[2:] if box else None
+
+
+def sprite_img(img, src, path, sprite):
+    """<img src="x.svg"> -> <img src="sprite.svg#x" width height> — 스프라이트에 없으면 그대로
+    스프라이트 문서 전체가 아니라 그림 크기로 배치되도록 width/height를 넣는다."""
+    size = sprite_view(path, sprite)
+    if size is None:
+        return img
+    stem = posixpath.splitext(posixpath.basename(path))[0]
+    target = posixpath.join(posixpath.dirname(src), sprite) + '#' + stem
+    img = img.replace(f'src="{src}"', f'src="{target}"', 1)
+    if ' width=' not in img:
+        width, height = (round(v * PX_PER_PT) for v in size)
+        img = img.replace('<img ', f'<img width="{width}" height="{height}" ', 1)
+    return img
+
+
+def on_page_content(html, page, config, files):
+    _search_pages[page.file.src_uri] = (page.url, page.title, html)
+    # page.url 기준 상대 경로 -> docs 기준 경로
+    base = page.url if page.url.endswith('/') else posixpath.dirname(page.url)
+
+    def figure(m):
+        img, src = m.group(), m.group(1)
+        if '://' in src:
+            return img
+        path = posixpath.normpath(posixpath.join(base, src))
+        folder = posixpath.dirname(src)
+        dark = _gd.dark_name(posixpath.basename(path))
+        # 다크 <img>는 스프라이트로 바꾸기 전의 태그에서 만든다
+        dark_img = img.replace(f'src="{src}"', f'src="{posixpath.join(folder, dark)}"', 1)
+        if _gd.SPRITE:
+            img = sprite_img(img, src, path, _gd.SPRITE_NAME)
+            dark_img = sprite_img(dark_img, posixpath.join(folder, dark), path,
+                                  _gd.dark_name(_gd.SPRITE_NAME))
+        light = img
+        sources = raster_sources(path)
+        if sources:
+            tags = []
+            for fmt, items in sources:
+                srcset = ', '.join(f'{posixpath.join(folder, filename)} {width}w'
+                                   for width, filename in items)
+                tags.append(f'<source type="image/{fmt}" media="{RASTER_MEDIA}" '
+                            f'srcset="{srcset}" sizes="100vw">')
+            light = '<picture>' + ''.join(tags) + img + '</picture>'
+
+        if not os.path.exists(os.path.join(_gd.DOCS_DIR, posixpath.dirname(path), dark)):
+            return light
+        # 숨겨진 쪽은 테마를 바꿀 때 받도록 lazy
+        dark_img = dark_img.replace('<img ', '<img loading="lazy" ', 1)
+        return (f'<span class="diagram-light">{light}</span>'
+                f'<span class="diagram-dark">{dark_img}</span>')
+    return IMG_SVG.sub(figure, html)
+
+
+def on_serve(server, config, builder):
+    # 생성 코드나 스펙을 고치면 페이지가 그대로여도 다시 빌드
+    for path in _gd.watched_paths():
+        if os.path.exists(path):
+            server.watch(path)
+    return server
@@ -0,0 +1,310 @@
+"""
+한국어 n-gram 검색 색인 — 빌드할 때 nav 페이지의 렌더링된 HTML에서 만들어 두는 정적 색인
+기본 검색(lunr)은 한글을 어절 단위로만 잘라 '말투'로 '말투로'를 찾지 못하고, 읽는 사람의
+브라우저가 페이지를 열 때마다 전문(全文)으로 색인을 새로 만든다. 여기서는 제목(h1~h3)마다
+구역을 나누고, 본문·어드모니션·표·코드 블록의 글자를 정규화해 글자 2-gram과 3-gram마다
+그 글자가 나오는 구역 번호를 역색인으로 저장한다. 세 글자 이상 질의는 질의의 모든 3-gram이
+있는 구역, 두 글자는 그 2-gram이 있는 구역, 한 글자는 그 글자로 시작하는 2-gram들의 구역에
+낱말 끝에만 나오는 구역(글자 목록)을 더한 것이다. 3-gram의 구역 목록이 두 2-gram 목록의
+교집합과 같으면 로더가 교집합으로 다시 얻을 수 있으므로 싣지 않는다 (대부분이 그렇다).
+빠뜨리는 구역은 없고, 네 글자 이상 질의의 3-gram들이 한 구역 안 서로 다른 곳에 흩어져 있으면
+드물게 더 잡힌다. 본문을 싣지 않으므로 기본 색인보다 작다.
+
+파일 형식 (JSON 한 개):
+    {"v": 1, "pages": [[URL, 제목], ...], "docs": [[페이지 번호, 앵커, 구역 제목], ...],
+     "grams": "줄\\n줄..."}
+grams는 첫 글자마다 한 줄이고 UTF-16 순서로 정렬되어 있어 로더(docs/javascripts/ko-search.js)가
+줄을 나눈 뒤 첫 글자로 이진 탐색한다. 줄 = 첫 글자 + 글자 목록 + 2-gram 항목들,
+    2-gram 항목: '/' + 둘째 글자 + 구역 목록, 뒤에 그 2-gram으로 시작하는 3-gram 항목들
+    3-gram 항목: '|' + 셋째 글자 + 구역 목록
+키 글자는 항상 한 글자라 구분자와 같은 글자여도 위치로 구별된다. 구역 목록은 오름차순 번호의
+앞 값과의 차이(델타)를 32진 가변 길이 숫자로 이은 것 — 마지막 자리는 DIGITS, 앞자리는
+MORE_DIGITS에서 골라 구분자 없이 경계가 드러난다 (델타는 대부분 한 글자).
+"""
+import html.parser
+import json
+import re
+import unicodedata
+
+VERSION = 1
+# 색인 파일 (site_dir 기준)
+INDEX_PATH = 'search/ko-index.json'
+# 구역을 나누는 제목 단계
+SECTION_TAGS = ('h1', 'h2', 'h3')
+# 글자를 모으지 않는 요소 — 제목 옆 ¶ 링크, 스크립트 등
+SKIP_CLASSES = ('headerlink',)
+SKIP_TAGS = ('script', 'style', 'svg', 'template')
+# 검색 결과 최대 개수 (Python 쪽 search(); 로더도 같은 값을 씀)
+MAX_RESULTS = 20
+
+_SPACE = re.compile(r'\s+')
+# 가변 길이 32진수 — 마지막 자리 / 앞자리 (구분자 '/', '|'와 JSON 이스케이프 문자 제외)
+DIGITS = '0123456789abcdefghijklmnopqrstuv'
+MORE_DIGITS = 'ABCDEFGHIJKLMNOPQRSTUVWXYZwxyz_-'
+
+
+# ============================================================
+# HTML -> 구역
+# ============================================================
+class SectionParser(html.parser.HTMLParser):
+    """렌더링된 페이지 본문 -> [(앵커, 제목, 본문 글자)] — 제목 태그마다 새 구역"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.sections = [['', '', []]]
+        self._skip = []         # 건너뛰는 중인 요소의 태그 스택
+        self._heading = None    # 읽는 중인 제목 태그
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if self._skip:
+            if tag not in ('br', 'img', 'hr', 'input', 'meta', 'link'):
+                self._skip.append(tag)
+            return
+        if tag in SKIP_TAGS or any(c in (attrs.get('class') or '').split() for c in SKIP_CLASSES):
+            self._skip.append(tag)
+            return
+        if tag in SECTION_TAGS:
+            self._heading = tag
+            self.sections.append([attrs.get('id') or '', '', []])
+        elif tag in ('p', 'div', 'li', 'tr', 'td', 'th', 'br', 'pre', 'summary', 'blockquote'):
+            self.sections[-1][2].append(' ')
+
+    def handle_endtag(self, tag):
+        if self._skip:
+            if tag == self._skip[-1]:
+                self._skip.pop()
+            return
+        if tag == self._heading:
+            self._heading = None
+
+    def handle_data(self, data):
+        if self._skip:
+            return
+        section = self.sections[-1]
+        if self._heading:
+            section[1] += data
+        section[2].append(data)
+
+    def result(self):
+        sections = []
+        for anchor, title, parts in self.sections:
+            text = normalize(''.join(parts))
+            if text:
+                sections.append((anchor, _SPACE.sub(' ', title).strip(), text))
+        return sections
+
+
+def page_sections(html_text):
+    parser = SectionParser()
+    parser.feed(html_text)
+    parser.close()
+    return parser.result()
+
+
+def normalize(text):
+    """색인과 질의에 같은 정규화 — NFC, 소문자, 공백 한 칸"""
+    return _SPACE.sub(' ', unicodedata.normalize('NFC', text)).strip().lower()
+
+
+# ============================================================
+# 색인
+# ============================================================
+def _varint(n):
+    n, r = divmod(n, 32)
+    digits = [DIGITS[r]]
+    while n:
+        n, r = divmod(n, 32)
+        digits.append(MORE_DIGITS[r])
+    return ''.join(reversed(digits))
+
+
+def _utf16(key):
+    return key.encode('utf-16-be')
+
+
+def _grams(text, n):
+    """text의 n-gram — 질의는 낱말 단위라 공백이 든 것은, 로더가 글자를 UTF-16 단위로 세므로
+    BMP 밖 글자(이모지 등)가 든 것은 제외"""
+    for i in range(len(text) - n + 1):
+        gram = text[i:i + n]
+        if ' ' not in gram and max(gram) <= '\uffff':
+            yield gram
+
+
+def build(pages):
+    """[(페이지 URL, 페이지 제목, HTML)] -> 색인 dict — {'pages', 'docs', 'texts', 'uni', 'bi', 'tri'}
+    n-gram -> 오름차순 구역 번호 목록 (uni는 그 글자로 시작하는 2-gram이 없는 구역만,
+    tri는 2-gram 교집합으로 얻을 수 없는 것만)"""
+    pages_out, docs, texts = [], [], []
+    for url, page_title, html_text in pages:
+        for anchor, title, text in page_sections(html_text):
+            docs.append([len(pages_out), anchor, title or page_title])
+            texts.append(text)
+        pages_out.append([url, page_title])
+    unigrams, bigrams, trigrams = {}, {}, {}
+    for doc, text in enumerate(texts):
+        for n, table in ((1, unigrams), (2, bigrams), (3, trigrams)):
+            for gram in set(_grams(text, n)):
+                table.setdefault(gram, []).append(doc)
+    starts = {}
+    for gram, docs_of in bigrams.items():
+        starts.setdefault(gram[0], set()).update(docs_of)
+    unigrams = {ch: [doc for doc in docs_of if doc not in starts.get(ch, ())]
+                for ch, docs_of in unigrams.items()}
+    implied = {}
+    for gram, docs_of in trigrams.items():
+        both = set(bigrams[gram[:2]]).intersection(bigrams[gram[1:]])
+        if len(both) != len(docs_of):
+            implied[gram] = docs_of
+    return {'pages': pages_out, 'docs': docs, 'texts': texts, 'uni': unigrams, 'bi': bigrams,
+            'tri': implied,
+            'trigrams': len(trigrams)}
+
+
+def _postings(docs):
+    prev, out = 0, []
+    for doc in docs:
+        out.append(_varint(doc - prev))
+        prev = doc
+    return ''.join(out)
+
+
+def encode(index):
+    """색인 dict -> JSON 바이트 (본문은 싣지 않음)"""
+    lines = {ch: [ch + _postings(docs)] for ch, docs in index['uni'].items()}
+    trigrams = {}
+    for gram in index['tri']:
+        trigrams.setdefault(gram[:2], []).append(gram)
+    for gram in sorted(index['bi'], key=_utf16):
+        entries = lines[gram[0]]
+        entries.append(f"/{gram[1]}{_postings(index['bi'][gram])}")
+        for tri in sorted(trigrams.get(gram, ()), key=_utf16):
+            entries.append(f"|{tri[2]}{_postings(index['tri'][tri])}")
+    payload = {
+        'v': VERSION,
+        'pages': index['pages'],
+        'docs': index['docs'],
+        'grams': '\n'.join(''.join(entries) for _, entries in sorted(lines.items(),
+                                                                     key=lambda item: _utf16(item[0]))),
+    }
+    return json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+# ============================================================
+# 질의 — 로더와 같은 절차 (검증과 CLI용)
+# ============================================================
+def _parse_line(line):
+    """grams 한 줄 -> {n-gram: 구역 목록 문자열} — 첫 글자 자신, 2-gram, 3-gram"""
+    i = 1
+    while i < len(line) and line[i] not in '/|':
+        i += 1
+    table, bigram = {line[0]: line[1:i]}, None
+    while i < len(line):
+        kind, ch = line[i], line[i + 1]
+        j = i + 2
+        while j < len(line) and line[j] not in '/|':
+            j += 1
+        if kind == '/':
+            bigram = line[0] + ch
+            table[bigram] = line[i + 2:j]
+        else:
+            table[bigram + ch] = line[i + 2:j]
+        i = j
+    return table
+
+
+def _decode(postings):
+    docs, doc, value = set(), 0, 0
+    for ch in postings or '':
+        i = DIGITS.find(ch)
+        if i < 0:
+            value = value * 32 + MORE_DIGITS.index(ch)
+            continue
+        doc += value * 32 + i
+        docs.add(doc)
+        value = 0
+    return docs
+
+
+class Index:
+    """인코딩된 색인을 그대로 들고 첫 글자로 이진 탐색 — 로더(ko-search.js)와 같은 알고리즘
+    줄은 처음 찾을 때 한 번만 풀어 둔다."""
+
+    def __init__(self, data):
+        payload = json.loads(data)
+        if payload.get('v') != VERSION:
+            raise ValueError(f"색인 버전이 다릅니다: {payload.get('v')}")
+        self.pages = payload['pages']
+        self.docs = payload['docs']
+        self.lines = payload['grams'].split('\n') if payload['grams'] else []
+        self._keys = [_utf16(line[0]) for line in self.lines]
+        self._parsed = {}
+
+    def _line(self, ch):
+        import bisect
+        if ch not in self._parsed:
+            i = bisect.bisect_left(self._keys, _utf16(ch))
+            found = i < len(self._keys) and self._keys[i] == _utf16(ch)
+            self._parsed[ch] = _parse_line(self.lines[i]) if found else {}
+        return self._parsed[ch]
+
+    def _bigram(self, gram):
+        return _decode(self._line(gram[0]).get(gram[:2]))
+
+    def _trigram(self, gram):
+        stored = self._line(gram[0]).get(gram)
+        if stored is not None:
+            return _decode(stored)
+        return self._bigram(gram[:2]) & self._bigram(gram[1:])
+
+    def _term(self, term):
+        """공백 없는 term이 들어 있는 구역"""
+        if len(term) == 1:
+            docs = set()
+            for gram, postings in self._line(term).items():
+                if len(gram) < 3:
+                    docs |= _decode(postings)
+            return docs
+        if len(term) == 2:
+            return self._bigram(term)
+        docs = None
+        for i in range(len(term) - 2):
+            found = self._trigram(term[i:i + 3])
+            docs = found if docs is None else docs & found
+            if not docs:
+                break
+        return docs
+
+    def search(self, query, limit=MAX_RESULTS):
+        """질의 -> [(구역 번호, 점수)] — 공백으로 나눈 각 낱말이 모두 들어 있는 구역
+        구역 제목에 든 낱말은 2점, 본문에만 있으면 1점. 같은 점수는 문서 순서."""
+        terms = normalize(query).split()
+        docs = None
+        for term in terms:
+            found = self._term(term)
+            docs = found if docs is None else docs & found
+            if not docs:
+                return []
+        scores = {doc: sum(2 if term in normalize(self.docs[doc][2]) else 1 for term in terms)
+                  for doc in docs or ()}
+        return sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]
+
+
+def main(argv=None):
+    """색인 파일로 질의 — python scripts/search_index.py site/search/ko-index.json 말투 변환"""
+    import sys
+    args = sys.argv[1:] if argv is None else argv
+    if len(args) < 2:
+        raise SystemExit('사용법: search_index.py 색인.json 질의...')
+    with open(args[0], 'rb') as f:
+        index = Index(f.read())
+    for doc, score in index.search(' '.join(args[1:])):
+        page, anchor, title = index.docs[doc]
+        url, page_title = index.pages[page]
+        print(f"{score:>3}  {url}{'#' + anchor if anchor else ''}  {title} — {page_title}")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
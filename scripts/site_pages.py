@@ -0,0 +1,77 @@
+"""
+문서 페이지 탐색 — nav 순서의 페이지, docs/의 마크다운과 스타일시트, 그 안의 이미지 참조
+mkdocs 훅과 보조 스크립트가 같은 규칙으로 페이지와 그림을 연결하도록 모아 둔다.
+경로는 모두 docs 디렉터리 기준, '/' 구분자.
+"""
+import os
+import posixpath
+import re
+
+# ![alt](src "title") 와 <img src="...">
+IMAGE_REF = re.compile(r'!\[[^\]]*\]\(\s*<?([^)\s>]+)>?(?:\s+"[^"]*")?\s*\)'
+                       r'|<img\b[^>]*?\bsrc="([^"]+)"')
+CSS_URL = re.compile(r'url\(\s*[\'"]?([^\'")]+)[\'"]?\s*\)')
+FENCE = re.compile(r'^(```|~~~).*?^\1', re.M | re.S)
+
+
+def _walk(docs_dir, suffix):
+    paths = []
+    for dirpath, dirnames, filenames in os.walk(docs_dir):
+        dirnames.sort()
+        rel = os.path.relpath(dirpath, docs_dir).replace(os.sep, '/')
+        for filename in sorted(filenames):
+            if filename.endswith(suffix):
+                paths.append(filename if rel == '.' else f'{rel}/{filename}')
+    return paths
+
+
+def markdown_pages(docs_dir):
+    """docs_dir 아래 마크다운 페이지 경로 (정렬)"""
+    return _walk(docs_dir, '.md')
+
+
+def nav_pages(nav):
+    """mkdocs nav를 순서대로 (제목, 페이지 경로) 목록으로 — 외부 링크는 제외"""
+    pages = []
+    for item in nav or []:
+        title, value = next(iter(item.items())) if isinstance(item, dict) else (None, item)
+        if isinstance(value, list):
+            pages += nav_pages(value)
+        elif isinstance(value, str) and '://' not in value:
+            pages.append((title, value))
+    return pages
+
+
+def stylesheets(docs_dir):
+    """docs_dir 아래 CSS 파일 경로 (정렬)"""
+    return _walk(docs_dir, '.css')
+
+
+def _resolve(src, page):
+    """페이지 기준 참조를 docs 기준 경로로 — 외부 URL이면 None"""
+    src = src.split('#')[0].split('?')[0]
+    if not src or '://' in src or src.startswith('data:'):
+        return None
+    if src.startswith('/'):
+        return posixpath.normpath(src.lstrip('/'))
+    return posixpath.normpath(posixpath.join(posixpath.dirname(page), src))
+
+
+def image_refs(markdown, page):
+    """페이지 본문의 로컬 이미지 참조 — 코드 블록 안의 예시와 외부 URL은 제외"""
+    refs = []
+    for m in IMAGE_REF.finditer(FENCE.sub('', markdown)):
+        path = _resolve(m.group(1) or m.group(2), page)
+        if path and path not in refs:
+            refs.append(path)
+    return refs
+
+
+def url_refs(css, path):
+    """스타일시트의 url(...) 참조"""
+    refs = []
+    for m in CSS_URL.finditer(css):
+        ref = _resolve(m.group(1), path)
+        if ref and ref not in refs:
+            refs.append(ref)
+    return refs
@@ -0,0 +1,232 @@
+"""
+플랫 카드 다이어그램용 경량 SVG 백엔드
+matplotlib Figure/Axes 대신 둥근 박스, 원, 텍스트, 직선 화살표를
+SVG 요소로 바로 기록한다. 좌표계(figsize, xlim/ylim, 기본 subplot 여백)와
+bbox_inches='tight' 크롭은 matplotlib과 같은 규칙을 따른다.
+"""
+from html import escape
+
+from text_metrics import LINE_HEIGHT
+
+PT_PER_INCH = 72.0
+
+# matplotlib 기본 figure.subplot.* 값 — 같은 위치에 Axes를 놓기 위해
+SUBPLOT_LEFT, SUBPLOT_RIGHT = 0.125, 0.9
+SUBPLOT_BOTTOM, SUBPLOT_TOP = 0.11, 0.88
+
+# 텍스트 — 줄 간격은 text_metrics.LINE_HEIGHT (matplotlib 여러 줄 블록의 실측 줄 높이)
+ASCENT = 0.88           # 폰트 크기 대비 기준선 위 높이 (한글 글꼴 근사)
+
+# annotate(arrowstyle='->') 기본값 — mutation_scale 10pt 기준
+ARROW_HEAD_LENGTH = 4.0
+ARROW_HEAD_WIDTH = 2.0
+ARROW_SHRINK = 2.0
+
+
+def fmt(v):
+    """좌표 숫자 — 소수점 둘째 자리까지, 불필요한 0 제거"""
+    s = f'{v:.2f}'.rstrip('0').rstrip('.')
+    return '0' if s == '-0' else s
+
+
+def char_width(ch):
+    """글자 폭 근사치 (em 단위) — 한글/CJK는 전각, 라틴은 반각"""
+    o = ord(ch)
+    if o >= 0x1100:
+        return 1.0
+    if ch == ' ':
+        return 0.3
+    if ch.isupper() or ch in 'mw':
+        return 0.68
+    return 0.55
+
+
+def text_extent(text, fontsize, weight='normal'):
+    """여러 줄 텍스트의 (폭, 높이) — 포인트 단위, 글꼴 없이 쓰는 근사치
+    Figure에 measure를 주지 않았을 때만 씀 (줄 높이는 text_metrics와 같음)."""
+    lines = text.split('\n')
+    width = max(sum(char_width(c) for c in line) for line in lines) * fontsize
+    return width, len(lines) * LINE_HEIGHT * fontsize
+
+
+class Figure:
+    """SVG 요소를 모아 두었다가 tight bbox로 잘라 직렬화
+    bbox는 matplotlib처럼 선 두께를 제외한 도형 범위로 계산한다.
+    measure(text, fontsize, weight) -> (폭, 높이)는 텍스트 배치에 쓰는 측정 함수
+    (없으면 text_extent 근사치)."""
+
+    def __init__(self, figsize, font_family, measure=None):
+        self.width, self.height = figsize
+        self.font_family = font_family
+        self.measure = measure or text_extent
+        self.axes = []
+
+    def add_subplot(self):
+        ax = Axes(self)
+        self.axes.append(ax)
+        return ax
+
+    def elements(self):
+        items = [el for ax in self.axes for el in ax.elements]
+        # zorder가 같으면 추가 순서 유지 (matplotlib과 동일)
+        return sorted(items, key=lambda el: el[0])
+
+    def to_svg(self, pad_inches=0.3, facecolor='#ffffff'):
+        items = self.elements()
+        pad = pad_inches * PT_PER_INCH
+        x0 = min(el[1][0] for el in items) - pad
+        y0 = min(el[1][1] for el in items) - pad
+        x1 = max(el[1][2] for el in items) + pad
+        y1 = max(el[1][3] for el in items) + pad
+        w, h = x1 - x0, y1 - y0
+
+        # figure 좌표(pt, y 위쪽) -> SVG 좌표(y 아래쪽)
+        def pt(x, y):
+            return fmt(x - x0), fmt(y1 - y)
+
+        family = escape(', '.join(
+            f"'{f}'" if ' ' in f else f for f in self.font_family))
+        out = [
+            '<?xml version="1.0" encoding="utf-8" standalone="no"?>',
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{fmt(w)}pt" '
+            f'height="{fmt(h)}pt" viewBox="0 0 {fmt(w)} {fmt(h)}" version="1.1">',
+            f'<rect width="{fmt(w)}" height="{fmt(h)}" fill="{facecolor}"/>',
+            f'<g font-family="{family}">',
+        ]
+        for _, _, draw in items:
+            out.append(draw(pt))
+        out.append('</g>')
+        out.append('</svg>')
+        return ('\n'.join(out) + '\n').encode('utf-8')
+
+
+class Axes:
+    """matplotlib Axes 중 다이어그램이 쓰는 부분만 흉내낸 좌표 변환기"""
+
+    def __init__(self, figure):
+        self.figure = figure
+        self.elements = []       # (zorder, bbox(pt), draw(pt) -> str)
+        self.xlim = (0.0, 1.0)
+        self.ylim = (0.0, 1.0)
+        fw = figure.width * PT_PER_INCH
+        fh = figure.height * PT_PER_INCH
+        self.left = SUBPLOT_LEFT * fw
+        self.bottom = SUBPLOT_BOTTOM * fh
+        self.right = SUBPLOT_RIGHT * fw
+        self.top = SUBPLOT_TOP * fh
+
+    # ---- matplotlib 호환 메서드 ----
+    def set_xlim(self, lo, hi):
+        self.xlim = (lo, hi)
+
+    def set_ylim(self, lo, hi):
+        self.ylim = (lo, hi)
+
+    def axis(self, mode):
+        """축은 그리지 않으므로 'off'만 지원"""
+        if mode != 'off':
+            raise ValueError(f"native 엔진은 axis('{mode}')를 지원하지 않습니다")
+
+    def set_title(self, title, fontsize=12, fontweight='normal', color='#000000', pad=6.0):
+        x = (self.left + self.right) / 2
+        self._add_text(x, self.top + pad, title, 'center', 'baseline',
+                       fontsize, color, fontweight, 'normal', 3)
+
+    def text(self, x, y, s, ha='left', va='baseline', fontsize=10,
+             color='#000000', fontweight='normal', style='normal', zorder=3):
+        px, py = self.transform(x, y)
+        self._add_text(px, py, s, ha, va, fontsize, color, fontweight, style, zorder)
+
+    # ---- 카드 프리미티브 ----
+    @property
+    def scale(self):
+        """데이터 1단위당 포인트 (x, y)"""
+        sx = (self.right - self.left) / (self.xlim[1] - self.xlim[0])
+        sy = (self.top - self.bottom) / (self.ylim[1] - self.ylim[0])
+        return sx, sy
+
+    def transform(self, x, y):
+        sx, sy = self.scale
+        return (self.left + (x - self.xlim[0]) * sx,
+                self.bottom + (y - self.ylim[0]) * sy)
+
+    def box(self, x, y, w, h, pad, fill, border, lw, zorder):
+        """FancyBboxPatch(boxstyle='round,pad=...')와 같은 모양"""
+        sx, sy = self.scale
+        bx0, by0 = self.transform(x - pad, y - pad)
+        bx1, by1 = self.transform(x + w + pad, y + h + pad)
+
+        def draw(pt):
+            X, Y = pt(bx0, by1)
+            return (f'<rect x="{X}" y="{Y}" width="{fmt(bx1 - bx0)}" '
+                    f'height="{fmt(by1 - by0)}" rx="{fmt(pad * sx)}" ry="{fmt(pad * sy)}" '
+                    f'fill="{fill}" stroke="{border}" stroke-width="{fmt(lw)}"/>')
+        self.elements.append((zorder, (bx0, by0, bx1, by1), draw))
+
+    def circle(self, x, y, r, fill, border, lw, zorder):
+        """plt.Circle — 축 비율이 1이 아니면 타원"""
+        sx, sy = self.scale
+        cx, cy = self.transform(x, y)
+        rx, ry = r * sx, r * sy
+
+        def draw(pt):
+            X, Y = pt(cx, cy)
+            return (f'<ellipse cx="{X}" cy="{Y}" rx="{fmt(rx)}" ry="{fmt(ry)}" '
+                    f'fill="{fill}" stroke="{border}" stroke-width="{fmt(lw)}"/>')
+        self.elements.append((zorder, (cx - rx, cy - ry, cx + rx, cy + ry), draw))
+
+    def arrow(self, start, end, color, lw, zorder=2):
+        """annotate('', xy=end, xytext=start, arrowprops=dict(arrowstyle='->'))"""
+        ax_, ay_ = self.transform(*start)
+        bx, by = self.transform(*end)
+        dx, dy = bx - ax_, by - ay_
+        length = (dx * dx + dy * dy) ** 0.5
+        ux, uy = dx / length, dy / length
+        ax_, ay_ = ax_ + ux * ARROW_SHRINK, ay_ + uy * ARROW_SHRINK
+        bx, by = bx - ux * ARROW_SHRINK, by - uy * ARROW_SHRINK
+        # 화살촉 양 날개
+        hx, hy = bx - ux * ARROW_HEAD_LENGTH, by - uy * ARROW_HEAD_LENGTH
+        w1 = (hx - uy * ARROW_HEAD_WIDTH, hy + ux * ARROW_HEAD_WIDTH)
+        w2 = (hx + uy * ARROW_HEAD_WIDTH, hy - ux * ARROW_HEAD_WIDTH)
+
+        def draw(pt):
+            p0, p1 = pt(ax_, ay_), pt(bx, by)
+            q1, q2 = pt(*w1), pt(*w2)
+            return (f'<path d="M{p0[0]} {p0[1]}L{p1[0]} {p1[1]}'
+                    f'M{q1[0]} {q1[1]}L{p1[0]} {p1[1]}L{q2[0]} {q2[1]}" fill="none" '
+                    f'stroke="{color}" stroke-width="{fmt(lw)}" stroke-linecap="round"/>')
+        xs = (ax_, bx, w1[0], w2[0])
+        ys = (ay_, by, w1[1], w2[1])
+        self.elements.append((zorder, (min(xs), min(ys), max(xs), max(ys)), draw))
+
+    # ---- 텍스트 ----
+    def _add_text(self, px, py, s, ha, va, fontsize, color, fontweight, style, zorder):
+        lines = s.split('\n')
+        width, height = self.figure.measure(s, fontsize, fontweight)
+        # 블록 위쪽 y (figure 좌표, 위가 +)
+        if va == 'center':
+            top = py + height / 2
+        elif va == 'top':
+            top = py
+        elif va == 'bottom':
+            top = py + height
+        else:   # baseline — 마지막 줄 기준선
+            top = py + ASCENT * fontsize + LINE_HEIGHT * fontsize * (len(lines) - 1)
+        anchor = {'center': 'middle', 'right': 'end'}.get(ha, 'start')
+        left = {'middle': px - width / 2, 'end': px - width}.get(anchor, px)
+
+        attrs = f' font-size="{fmt(fontsize)}" fill="{color}" text-anchor="{anchor}"'
+        if fontweight == 'bold':
+            attrs += ' font-weight="bold"'
+        if style == 'italic':
+            attrs += ' font-style="italic"'
+
+        def draw(pt):
+            X, Y = pt(px, top - ASCENT * fontsize)
+            if len(lines) == 1:
+                return f'<text x="{X}" y="{Y}"{attrs}>{escape(s, quote=False)}</text>'
+            dy = fmt(LINE_HEIGHT * fontsize)
+            spans = [f'<tspan x="{X}">{escape(lines[0], quote=False)}</tspan>']
+            spans += [f'<tspan x="{X}" dy="{dy}">{escape(line, quote=False)}</tspan>' for line in lines[1:]]
+            return f'<text x="{X}" y="{Y}"{attrs}>{"".join(spans)}</text>'
+        self.elements.append((zorder, (left, top - height, left + width, top), draw))
@@ -0,0 +1,171 @@
+"""
+SVG 후처리 최적화 — save_fig 다음 단계
+좌표 정밀도 축소, RDF <metadata>·DOCTYPE 제거, style 속성과 path 데이터 정리,
+그림 내부에서 반복되는 <defs> 정의(글리프, clipPath) 중복 제거,
+다크 모드 변형을 위한 색상 치환(recolor).
+모든 변환은 바이트 → 바이트이며 같은 입력이면 같은 출력이 나온다.
+"""
+import re
+
+DEFAULTS = {
+    'precision': 2,           # 소수점 자릿수 (None이면 그대로)
+    'strip_metadata': True,
+    'strip_doctype': True,
+    'collapse_styles': True,
+    'compact_paths': True,
+    'dedupe_defs': True,
+}
+
+# SVG 기본값과 같아서 지워도 되는 style 선언
+# (문서의 전역 <style> *{...} 규칙이 바꾼 속성은 제외)
+DEFAULT_STYLE = {
+    'stroke-linejoin': 'miter',
+    'stroke-linecap': 'butt',
+    'stroke-opacity': '1',
+    'fill-opacity': '1',
+    'opacity': '1',
+}
+
+# 숫자를 건드리면 안 되는 속성
+NON_NUMERIC_ATTRS = {'id', 'href', 'xlink:href', 'class', 'font-family', 'version'}
+
+# 소수점 자릿수 대신 유효 숫자로 줄이는 속성 — 글리프의 scale(0.015625)가
+# scale(0.02)가 되면 글자가 28% 커지므로 작은 배율도 상대 오차가 작게 남긴다
+SIGNIFICANT_ATTRS = {'transform'}
+SIGNIFICANT_DIGITS = 6
+
+# 색상이 들어 있는 속성 — recolor는 이 속성 값만 바꿈 (id/href의 '#...'은 그대로)
+COLOR_ATTRS = {'fill', 'stroke', 'style', 'color', 'stop-color', 'flood-color'}
+
+_METADATA = re.compile(r'\s*<metadata>.*?</metadata>', re.S)
+_DOCTYPE = re.compile(r'\s*<!DOCTYPE[^>]*>', re.S)
+_ATTR = re.compile(r'([\w:-]+)="([^"]*)"')
+_NUMBER = re.compile(r'-?\d+\.\d+')
+_STYLE = re.compile(r' style="([^"]*)"')
+_GLOBAL_STYLE = re.compile(r'<style[^>]*>\s*\*\s*\{([^}]*)\}')
+_PATH_DATA = re.compile(r' d="([^"]*)"')
+_PATH_CMD = re.compile(r'\s*([MLHVCSQTAZmlhvcsqtaz])\s*')
+_DEF_PATH = re.compile(r'\s*<path id="([^"]+)" d="([^"]*)"\s*/>')
+_CLIP = re.compile(r'\s*<clipPath id="([^"]+)">(.*?)</clipPath>', re.S)
+_EMPTY_DEFS = re.compile(r'\s*<defs>\s*</defs>')
+_HEX_COLOR = re.compile(r'#(?:[0-9a-fA-F]{6}|[0-9a-fA-F]{3})\b')
+_SVG_OPEN = re.compile(r'<svg\b')
+
+
+def _round_numbers(text, precision):
+    def repl_num(m):
+        s = f'{float(m.group()):.{precision}f}'.rstrip('0').rstrip('.')
+        return '0' if s in ('-0', '') else s
+
+    def repl_significant(m):
+        value = float(m.group())
+        s = f'{value:.{SIGNIFICANT_DIGITS}g}'
+        if 'e' in s:        # 지수 표기 대신 소수 — 아주 작은 값은 0
+            s = f'{value:.{precision + SIGNIFICANT_DIGITS}f}'.rstrip('0').rstrip('.')
+        return '0' if s in ('-0', '') else s
+
+    def repl_attr(m):
+        name, value = m.groups()
+        if name in NON_NUMERIC_ATTRS:
+            return m.group()
+        repl = repl_significant if name in SIGNIFICANT_ATTRS else repl_num
+        return f'{name}="{_NUMBER.sub(repl, value)}"'
+    # 태그 안의 속성만 — 텍스트 내용의 숫자는 그대로
+    return re.sub(r'<[^<>]+>', lambda t: _ATTR.sub(repl_attr, t.group()), text)
+
+
+def _parse_decls(style):
+    decls = {}
+    for part in style.split(';'):
+        if ':' in part:
+            key, value = (p.strip() for p in part.split(':', 1))
+            decls[key] = value      # 같은 속성이 두 번이면 마지막 값
+    return decls
+
+
+def _collapse_styles(text):
+    defaults = dict(DEFAULT_STYLE)
+    m = _GLOBAL_STYLE.search(text)
+    if m:
+        for key in _parse_decls(m.group(1)):
+            defaults.pop(key, None)
+
+    def repl(m):
+        decls = {k: v for k, v in _parse_decls(m.group(1)).items()
+                 if defaults.get(k) != v}
+        if not decls:
+            return ''
+        return ' style="' + ';'.join(f'{k}:{v}' for k, v in decls.items()) + '"'
+    return _STYLE.sub(repl, text)
+
+
+def _compact_path(m):
+    d = _PATH_CMD.sub(r'\1', m.group(1))
+    return ' d="' + re.sub(r'\s+', ' ', d) + '"'
+
+
+def _dedupe(text, pattern, ref_format):
+    """내용이 같은 정의를 첫 번째 id로 합치고 참조를 다시 씀"""
+    first_by_body = {}
+    alias = {}
+
+    def repl(m):
+        ident, body = m.groups()
+        keep = first_by_body.setdefault(body, ident)
+        if keep == ident:
+            return m.group()
+        alias[ident] = keep
+        return ''
+    text = pattern.sub(repl, text)
+    for old, new in alias.items():
+        text = text.replace(ref_format.format(old), ref_format.format(new))
+    return text
+
+
+def optimize(data, **settings):
+    """SVG 바이트 최적화 — settings는 DEFAULTS의 일부를 덮어씀"""
+    opts = {**DEFAULTS, **settings}
+    text = data.decode('utf-8')
+    if opts['strip_metadata']:
+        text = _METADATA.sub('', text)
+    if opts['strip_doctype']:
+        text = _DOCTYPE.sub('', text)
+    if opts['collapse_styles']:
+        text = _collapse_styles(text)
+    if opts['compact_paths']:
+        text = _PATH_DATA.sub(_compact_path, text)
+    if opts['dedupe_defs']:
+        text = _dedupe(text, _DEF_PATH, '#{}"')
+        text = _dedupe(text, _CLIP, '#{})')
+        text = _EMPTY_DEFS.sub('', text)
+    if opts['precision'] is not None:
+        text = _round_numbers(text, opts['precision'])
+    return text.encode('utf-8')
+
+
+def _hex6(color):
+    """'#ABC', '#aabbcc' -> '#aabbcc'"""
+    color = color.lower()
+    if len(color) == 4:
+        color = '#' + ''.join(c * 2 for c in color[1:])
+    return color
+
+
+def recolor(data, mapping, default_fill=None):
+    """색상 속성의 hex 색을 mapping에 따라 바꿈 (대소문자, 3자리 표기 무관)
+    default_fill은 fill을 지정하지 않은 요소(matplotlib의 기본 검정 글자 등)가 물려받을 색."""
+    table = {_hex6(k): v for k, v in mapping.items()}
+    text = data.decode('utf-8')
+
+    def repl_color(m):
+        return table.get(_hex6(m.group()), m.group())
+
+    def repl_attr(m):
+        name, value = m.groups()
+        if name not in COLOR_ATTRS:
+            return m.group()
+        return f'{name}="{_HEX_COLOR.sub(repl_color, value)}"'
+    text = re.sub(r'<[^<>]+>', lambda t: _ATTR.sub(repl_attr, t.group()), text)
+    if default_fill:
+        text = _SVG_OPEN.sub(f'<svg fill="{default_fill}"', text, count=1)
+    return text.encode('utf-8')
@@ -0,0 +1,125 @@
+"""
+챕터 스프라이트 — 한 챕터의 그림 SVG 여러 개를 파일 하나로 묶음
+그림마다 <symbol>로 감싸 세로로 쌓고(<use>), 같은 영역을 가리키는 <view id="그림 이름">을 두어
+<img src="sprite.svg#그림">으로 그림 하나만 보이게 한다. 여러 그림이 같이 쓰는 글리프
+윤곽선과 clipPath 정의(<defs>)는 한 번만 싣고, 그림 전역 스타일(*{...})은 그림의 symbol
+안쪽으로 범위를 좁힌다. 모든 변환은 바이트 → 바이트이며 같은 입력이면 같은 출력이 나온다.
+"""
+import re
+
+# 쌓은 그림 사이 간격 (SVG 단위) — 이웃 그림의 안티에일리어싱이 view 가장자리에 비치지 않게
+GAP = 8
+
+SVG_NS = 'http://www.w3.org/2000/svg'
+XLINK_NS = 'http://www.w3.org/1999/xlink'
+
+# symbol로 옮기지 않는 루트 속성 — 나머지(fill 등 상속 속성)는 symbol이 물려받음
+ROOT_ONLY_ATTRS = {'xmlns', 'xmlns:xlink', 'width', 'height', 'viewBox', 'version'}
+
+_PROLOG = re.compile(r'<\?xml[^>]*\?>|<!DOCTYPE[^>]*>|<metadata>.*?</metadata>', re.S)
+_ROOT = re.compile(r'<svg\b([^>]*)>(.*)</svg>', re.S)
+_ATTR = re.compile(r'([\w:-]+)="([^"]*)"')
+_DEFS = re.compile(r'<defs>(.*?)</defs>', re.S)
+_ELEMENT = re.compile(r'<([\w:]+)\b[^>]*?(?:/>|>.*?</\1>)', re.S)
+_STYLE = re.compile(r'<style[^>]*>(.*?)</style>', re.S)
+_RULE = re.compile(r'([^{}]+)\{([^}]*)\}')
+_ID = re.compile(r'\sid="([^"]+)"')
+_REF = re.compile(r'#([^\s"\')]+)[")]')
+_VIEW = re.compile(r'<view id="([^"]+)" viewBox="([^"]+)"/>')
+
+
+def _number(v):
+    s = f'{v:.3f}'.rstrip('0').rstrip('.')
+    return '0' if s == '-0' else s
+
+
+def _parse(data):
+    """그림 SVG -> (루트 속성, (폭, 높이), defs 요소 목록, 스타일 규칙, 본문)"""
+    text = _PROLOG.sub('', data.decode('utf-8'))
+    m = _ROOT.search(text)
+    if m is None:
+        raise ValueError('SVG 루트 요소가 없습니다')
+    attrs = dict(_ATTR.findall(m.group(1)))
+    if 'viewBox' in attrs:
+        _, _, width, height = (float(v) for v in attrs['viewBox'].split())
+    else:
+        width, height = (float(attrs[k].rstrip('pt')) for k in ('width', 'height'))
+    inner = m.group(2)
+    defs, rules = [], []
+    for block in _DEFS.findall(inner):
+        for element in _ELEMENT.finditer(block):
+            if element.group(1) == 'style':
+                rules += _RULE.findall(_STYLE.search(element.group()).group(1))
+            else:
+                defs.append(element.group())
+    body = _DEFS.sub('', inner)
+    return attrs, (width, height), defs, rules, body
+
+
+def _rename(text, renames):
+    for old, new in renames.items():
+        text = text.replace(f'#{old}"', f'#{new}"').replace(f'#{old})', f'#{new})')
+        text = text.replace(f' id="{old}"', f' id="{new}"')
+    return text
+
+
+def build(figures):
+    """[(그림 이름, SVG 바이트)] -> 스프라이트 SVG 바이트 (그림은 주어진 순서로 위에서 아래로)"""
+    shared = {}             # 정의 id -> 요소 (처음 나온 그림 기준)
+    rules = {}              # 스타일 선언 -> [symbol 범위 선택자]
+    symbols, placements = [], []
+    width, y = 0.0, 0.0
+    for name, data in figures:
+        attrs, (w, h), defs, figure_rules, body = _parse(data)
+        symbol_id = f'{name}-symbol'
+        # id가 같고 내용이 다른 정의만 그림 이름을 붙여 분리
+        renames = {}
+        kept = []
+        for element in defs:
+            ident = _ID.search(element).group(1)
+            if shared.get(ident, element) != element:
+                renames[ident] = f'{ident}-{name}'
+            kept.append(element)
+        body = _rename(body, renames)
+        for element in kept:
+            element = _rename(element, renames)
+            shared.setdefault(_ID.search(element).group(1), element)
+        # 어디서도 참조하지 않는 id(figure_1, patch_3 등)는 지움
+        used = set(_REF.findall(body)) | {ref for el in kept for ref in _REF.findall(el)}
+        body = _ID.sub(lambda m: m.group() if m.group(1) in used else '', body)
+        for selectors, decls in figure_rules:
+            scoped = [f'#{symbol_id} {s.strip()}' for s in selectors.split(',')]
+            rules.setdefault(decls.strip(), []).extend(scoped)
+
+        inherited = ''.join(f' {k}="{v}"' for k, v in attrs.items() if k not in ROOT_ONLY_ATTRS)
+        symbols.append(f'<symbol id="{symbol_id}" viewBox="0 0 {_number(w)} {_number(h)}"'
+                       f'{inherited}>{body.strip()}</symbol>')
+        placements.append(f'<view id="{name}" viewBox="0 {_number(y)} {_number(w)} {_number(h)}"/>'
+                          f'<use xlink:href="#{symbol_id}" y="{_number(y)}" '
+                          f'width="{_number(w)}" height="{_number(h)}"/>')
+        width = max(width, w)
+        y += h + GAP
+    height = max(y - GAP, 0)
+
+    style = ''.join(f"{', '.join(selectors)}{{{decls}}}" for decls, selectors in rules.items())
+    out = [
+        '<?xml version="1.0" encoding="utf-8" standalone="no"?>',
+        f'<svg xmlns="{SVG_NS}" xmlns:xlink="{XLINK_NS}" version="1.1" '
+        f'width="{_number(width)}pt" height="{_number(height)}pt" '
+        f'viewBox="0 0 {_number(width)} {_number(height)}">',
+        '<defs>',
+    ]
+    if style:
+        out.append(f'<style type="text/css">{style}</style>')
+    out += list(shared.values())
+    out += symbols
+    out.append('</defs>')
+    out += placements
+    out.append('</svg>')
+    return ('\n'.join(out) + '\n').encode('utf-8')
+
+
+def views(data):
+    """스프라이트의 그림 이름 -> (x, y, 폭, 높이) — SVG 단위"""
+    return {name: tuple(float(v) for v in box.split())
+            for name, box in _VIEW.findall(data.decode('utf-8'))}
@@ -0,0 +1,51 @@
+"""
+글자 폭 측정 — 글꼴 파일의 글리프 advance를 한 번씩만 읽어 두고 문자열 폭을 합산
+렌더러로 글자를 그려 보지 않고 카드에 글이 들어가는지 판단하는 용도.
+advance는 글꼴 크기에 비례하므로 글꼴마다 1pt 기준 표 하나를 캐시하고,
+힌팅 없이 읽어 matplotlib SVG 렌더러의 폭과 일치한다 (커닝은 무시).
+"""
+import functools
+import threading
+
+# 줄당 높이 (글자 크기 대비) — matplotlib Text 여러 줄 블록의 실측치(1.0~1.03)보다 약간 여유
+LINE_HEIGHT = 1.05
+
+
+class AdvanceTable:
+    """글꼴 하나의 글자별 advance (1pt 기준, 포인트) — 처음 쓰는 글자만 글꼴에서 읽음"""
+
+    def __init__(self, path):
+        from matplotlib import ft2font
+        # matplotlib 3.10부터 LoadFlags, 그 전에는 모듈 상수
+        flags = getattr(ft2font, 'LoadFlags', None)
+        self._flags = flags.NO_HINTING if flags else ft2font.LOAD_NO_HINTING
+        self._font = ft2font.FT2Font(path)
+        self._font.set_size(1, 72)
+        self._advances = {}
+        self._lock = threading.Lock()     # FT2Font는 스레드 간 공유 불가
+        self.path = path
+
+    def advance(self, ch):
+        width = self._advances.get(ch)
+        if width is None:
+            with self._lock:
+                glyph = self._font.load_char(ord(ch), flags=self._flags)
+            width = self._advances[ch] = glyph.linearHoriAdvance / 65536
+        return width
+
+    def width(self, line):
+        return sum(self.advance(ch) for ch in line)
+
+
+@functools.lru_cache(maxsize=None)
+def advance_table(path):
+    """글꼴 파일마다 하나 — 프로세스 안에서 재사용"""
+    return AdvanceTable(path)
+
+
+def text_extent(path, text, fontsize):
+    """여러 줄 텍스트의 (폭, 높이) — 포인트 단위"""
+    table = advance_table(path)
+    lines = text.split('\n')
+    width = max(table.width(line) for line in lines) * fontsize
+    return width, len(lines) * LINE_HEIGHT * fontsize
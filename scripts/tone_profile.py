@@ -0,0 +1,298 @@
+"""
+말투 프로필 채점 — 4장 레이더의 여섯 축(친근감·전문성·격식·설득력·객관성·간결함)을
+글에서 잴 수 있는 특징으로 계산한다. 종결 어미 유형 비율, 평균 문장 길이, 비유·경험·인용
+표지, 숫자와 영문 용어 밀도, 5장 규칙의 슬롭 구절 밀도 등을 문서 묶음 전체에 대해
+한 번에 세어 (문서 × 특징) 행렬로 만들고, 축별 가중치 행렬을 곱해 1~5점으로 환산한다.
+문서마다 파이썬 반복을 돌지 않도록 묶음의 글을 하나로 이어 정규식을 한 번씩만 돌리고,
+일치 위치를 searchsorted로 문서 번호에 대응시켜 bincount로 합산한다.
+
+사용법:
+    python scripts/tone_profile.py rewrites/ -o scores.jsonl --radar radar.svg --group-by dir
+    python scripts/tone_profile.py variants/ --radar grid.svg --radar-mode grid
+    python scripts/tone_profile.py --book          # 4장 생성 결과 A~F 채점
+"""
+import argparse
+import json
+import os
+import re
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import ai_style_lint  # noqa: E402
+
+AXES = ['친근감', '전문성', '격식', '설득력', '객관성', '간결함']
+BOOK_CHAPTER = os.path.join(ai_style_lint.DOCS_DIR, 'part2', 'ch04-writing-with-tone.md')
+
+# 한 번에 행렬로 만드는 문서 수 — 이어 붙인 글과 일치 위치 배열의 메모리 상한
+BATCH_SIZE = 2000
+
+# 문장 끝 어절 — 마침표/물음표/느낌표 앞, 또는 문서 끝
+# (어절에 문서 구분자를 넣지 않아야 한 문장이 앞뒤 문서에 걸치지 않음)
+_SENTENCE_END = re.compile(r'([^\s\x00]+?)[.!?…]+["\'”’)\]]*(?=\s|\x00)|([^\s\x00]+)(?=\x00)')
+_NUMBER = re.compile(r'\d+(?:[.,]\d+)*')
+_LATIN = re.compile(r'[A-Za-z][A-Za-z0-9+#.-]*')
+_QUESTION = re.compile(r'\?')
+_SPACE = re.compile(r'\s+')
+# 묶음 안 문서 경계 — 본문에 나오지 않는 문자
+SEPARATOR = '\x00'
+
+# 종결 어미 유형 — 문장 끝 어절의 접미사 (위에서부터 먼저 맞는 것)
+ENDINGS = {
+    'formal': ('니다', '니까'),                         # 하십시오체: ~입니다, ~됩니다
+    'polite': ('요', '죠'),                             # 해요체: ~거든요, ~잖아요
+    'plain': ('다',),                                   # 해라체(문어): ~한다, ~알려졌다
+}
+# 어느 것에도 맞지 않는 한글 어절은 'casual' (반말·명사형: ~거야, ~돼, ~뺏어감)
+
+# 표지 어휘 — 문장당 빈도
+MARKERS = {
+    'analogy': ['처럼', '마치', '비슷한', '같은 원리', '예를 들어', '비유하면'],
+    'experience': ['해 보', '해보', '실제로', '현실적으로', '예전에', '지금은', '골치', '꽤', '재미있'],
+    'attribution': ['에 따르면', '것으로 알려', '것으로 보인', '업계', '측은', '밝혔다', '전망'],
+    'persuasion': ['비용', '비싼', '절감', '절반', '효율', '가치', '만에', '도입', '누구나', '지금 바로'],
+}
+# 5장 규칙 중 밀도로 쓰는 종류
+SLOP_CATEGORIES = ('slop', 'translationese', 'meta')
+
+# 특징 이름 (행렬 열 순서)과 정규화 구간 — (하한, 상한)을 0..1로 선형 변환 후 자름
+FEATURES = {
+    'formal': (0, 1),               # 문장 비율
+    'polite': (0, 1),
+    'plain': (0, 1),
+    'casual': (0, 1),
+    'sentence_chars': (20, 120),     # 평균 문장 길이 (글자)
+    'analogy': (0, 0.4),            # 문장당
+    'experience': (0, 0.6),
+    'attribution': (0, 0.6),
+    'persuasion': (0, 0.8),
+    'question': (0, 0.3),
+    'numbers': (0, 4),              # 100자당
+    'latin': (0, 5),
+    'slop': (0, 1.5),
+}
+
+# 축별 (절편, {특징: 가중치}) — 점수 = 1 + 4 × clip(절편 + Σ 가중치 × 정규화 특징, 0, 1)
+AXIS_WEIGHTS = {
+    '친근감': (0.35, {'polite': 0.45, 'casual': 0.55, 'analogy': 0.35, 'experience': 0.25,
+                      'formal': -0.25, 'plain': -0.35, 'attribution': -0.3}),
+    '전문성': (0.1, {'latin': 0.35, 'numbers': 0.25, 'sentence_chars': 0.3, 'experience': 0.2,
+                      'casual': -0.35, 'analogy': -0.2, 'persuasion': -0.1}),
+    '격식': (0.2, {'formal': 0.45, 'plain': 0.55, 'sentence_chars': 0.3,
+                    'casual': -0.6, 'polite': -0.3, 'analogy': -0.1}),
+    '설득력': (0.15, {'persuasion': 0.6, 'numbers': 0.15, 'question': 0.2, 'experience': 0.25,
+                      'formal': 0.1, 'slop': -0.2}),
+    '객관성': (0.45, {'attribution': 0.45, 'plain': 0.3, 'formal': 0.3, 'numbers': 0.15,
+                      'experience': -0.2, 'casual': -0.3, 'polite': -0.2, 'analogy': -0.2,
+                      'persuasion': -0.25}),
+    '간결함': (1.0, {'sentence_chars': -0.9, 'slop': -0.3, 'analogy': -0.15}),
+}
+
+
+# ============================================================
+# 특징 행렬
+# ============================================================
+def _phrase_regex(phrases):
+    """구절 목록 -> 한 정규식 (긴 구절 먼저)"""
+    return re.compile('|'.join(re.escape(p) for p in sorted(set(phrases), key=len, reverse=True)))
+
+
+class Scorer:
+    """가중치 행렬과 정규식을 한 번 만들어 두고 묶음마다 features() / scores()"""
+
+    def __init__(self, rules=None):
+        rules = rules or ai_style_lint.load_rules()
+        self.markers = {name: _phrase_regex(words) for name, words in MARKERS.items()}
+        self.slop = _phrase_regex(phrase for _, category, phrase, _ in rules['phrases']
+                                  if category in SLOP_CATEGORIES)
+        self.features_names = list(FEATURES)
+        bounds = np.array([FEATURES[f] for f in self.features_names], dtype=float)
+        self.lo, self.span = bounds[:, 0], bounds[:, 1] - bounds[:, 0]
+        self.bias = np.array([AXIS_WEIGHTS[axis][0] for axis in AXES])
+        self.weights = np.zeros((len(self.features_names), len(AXES)))
+        for j, axis in enumerate(AXES):
+            for feature, weight in AXIS_WEIGHTS[axis][1].items():
+                self.weights[self.features_names.index(feature), j] = weight
+
+    def features(self, texts):
+        """문서 목록 -> (문서 수 × 특징 수) 원시 특징 행렬"""
+        docs = [_SPACE.sub(' ', text).strip() for text in texts]
+        n = len(docs)
+        lengths = np.fromiter((len(d) + 1 for d in docs), dtype=np.int64, count=n)
+        starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        corpus = SEPARATOR.join(docs) + SEPARATOR
+
+        def doc_of(positions):
+            return np.searchsorted(starts, positions, side='right') - 1
+
+        def per_doc(regex):
+            positions = np.fromiter((m.start() for m in regex.finditer(corpus)), dtype=np.int64)
+            return np.bincount(doc_of(positions), minlength=n).astype(float)
+
+        ends, positions = [], []
+        for m in _SENTENCE_END.finditer(corpus):
+            ends.append(m.group(1) or m.group(2))
+            positions.append(m.start())
+        ends = np.array(ends, dtype=str)
+        sentence_doc = doc_of(np.array(positions, dtype=np.int64))
+        sentences = np.bincount(sentence_doc, minlength=n).astype(float)
+        per_sentence = np.maximum(sentences, 1)
+        per_100 = np.maximum(lengths - 1, 1) / 100
+
+        # 종결 어미 유형 — 앞에서 맞은 유형은 뒤 유형에서 제외
+        last = np.array([end[-1:] for end in ends], dtype='<U1')
+        remaining = (last >= '가') & (last <= '힣')
+        columns = {}
+        for kind, suffixes in ENDINGS.items():
+            hit = np.zeros(len(ends), dtype=bool)
+            for suffix in suffixes:
+                hit |= np.char.endswith(ends, suffix)
+            hit &= remaining
+            remaining &= ~hit
+            columns[kind] = np.bincount(sentence_doc, weights=hit, minlength=n) / per_sentence
+        columns['casual'] = np.bincount(sentence_doc, weights=remaining, minlength=n) / per_sentence
+        columns['sentence_chars'] = (lengths - 1) / per_sentence
+        for name, regex in self.markers.items():
+            columns[name] = per_doc(regex) / per_sentence
+        columns['question'] = per_doc(_QUESTION) / per_sentence
+        columns['numbers'] = per_doc(_NUMBER) / per_100
+        columns['latin'] = per_doc(_LATIN) / per_100
+        columns['slop'] = per_doc(self.slop) / per_100
+        return np.column_stack([columns[f] for f in self.features_names])
+
+    def scores(self, features):
+        """원시 특징 행렬 -> (문서 수 × 6) 점수, 1~5"""
+        normalized = np.clip((features - self.lo) / self.span, 0, 1)
+        return 1 + 4 * np.clip(self.bias + normalized @ self.weights, 0, 1)
+
+    def score_texts(self, texts):
+        """(특징, 점수) — BATCH_SIZE씩 나눠 계산해 이어 붙임"""
+        features = [self.features(texts[i:i + BATCH_SIZE]) for i in range(0, len(texts), BATCH_SIZE)]
+        features = np.vstack(features) if features else np.zeros((0, len(self.features_names)))
+        return features, self.scores(features)
+
+
+def group_means(scores, groups):
+    """그룹별 평균 점수 — (그룹 이름 목록, 그룹 수 × 6)"""
+    names, index = np.unique(np.asarray(groups, dtype=str), return_inverse=True)
+    totals = np.zeros((len(names), scores.shape[1]))
+    np.add.at(totals, index, scores)
+    return names.tolist(), totals / np.bincount(index)[:, None]
+
+
+# ============================================================
+# 입력
+# ============================================================
+_QUOTE_SECTION = re.compile(r'^### ([^\n]+?)(?: — [^\n]*)?\n(.*?)(?=^#{2,3} |\Z)', re.M | re.S)
+_QUOTE = re.compile(r'^!!! quote[^\n]*\n((?:    .*\n?|\s*\n)+)', re.M)
+
+
+def book_samples(path=BOOK_CHAPTER):
+    """4장의 말투별 생성 결과 — [(말투 이름, 본문)]"""
+    with open(path, encoding='utf-8') as f:
+        markdown = f.read()
+    samples = []
+    for m in _QUOTE_SECTION.finditer(markdown):
+        quote = _QUOTE.search(m.group(2))
+        if quote:
+            samples.append((m.group(1).strip(), ' '.join(line.strip() for line in quote.group(1).splitlines())))
+    return samples
+
+
+def read_documents(paths):
+    """[(경로, 본문)] — 코드 블록은 빼고 읽음"""
+    docs = []
+    for path in ai_style_lint.iter_paths(paths):
+        with open(path, encoding='utf-8', errors='replace') as f:
+            text = f.read()
+        docs.append((path, re.sub(r'^(```|~~~).*?^\1', '', text, flags=re.M | re.S)))
+    return docs
+
+
+# ============================================================
+# 출력
+# ============================================================
+def render_radar(names, scores, path, title='말투 프로필', mode='overlay'):
+    """점수를 4장 레이더로 그려 path에 저장 — 형식은 확장자
+    overlay는 극좌표 하나에 겹쳐서(radar_chart), grid는 프로필마다 작은 칸으로(radar_grid)."""
+    import generate_diagrams as gd
+    profiles = [(name, row.tolist(), None) for name, row in zip(names, scores)]
+    if mode == 'grid':
+        fig, _ = gd.radar_grid(AXES, profiles, title)
+    else:
+        fig, ax = gd.make_polar_axes((8, 8))
+        gd.radar_chart(ax, AXES, profiles, title)
+    fmt = os.path.splitext(path)[1].lstrip('.') or 'svg'
+    fig.savefig(path, format=fmt, bbox_inches='tight', pad_inches=0.3, facecolor='white',
+                edgecolor='none', metadata={'Date': None} if fmt == 'svg' else None)
+
+
+def print_table(names, scores, out=sys.stderr):
+    width = max([len(n) for n in names] + [4])
+    print(f"{'':<{width}} " + ' '.join(f'{axis:>4}' for axis in AXES), file=out)
+    for name, row in zip(names, scores):
+        print(f"{name:<{width}} " + ' '.join(f'{v:>7.2f}' for v in row), file=out)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='글에서 4장 레이더의 여섯 축 점수를 계산')
+    parser.add_argument('paths', nargs='*', help='채점할 파일 또는 폴더 (.md/.txt)')
+    parser.add_argument('--book', action='store_true',
+                        help='4장의 말투별 생성 결과(A~F)를 채점')
+    parser.add_argument('-o', '--output', metavar='PATH',
+                        help='문서별 점수 JSONL (기본: 표준 출력)')
+    parser.add_argument('--features', action='store_true',
+                        help='JSONL에 원시 특징 값도 기록')
+    parser.add_argument('--group-by', choices=['file', 'dir'], default='file',
+                        help='레이더/요약 표의 프로필 단위 (기본: file, dir은 폴더별 평균)')
+    parser.add_argument('--radar', metavar='PATH',
+                        help='프로필을 레이더 차트로 저장 (.svg/.png)')
+    parser.add_argument('--radar-mode', choices=['overlay', 'grid'], default='overlay',
+                        help='overlay: 한 차트에 겹침 / grid: 프로필마다 작은 칸 (기본: overlay)')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.book:
+        docs = book_samples()
+    elif args.paths:
+        docs = read_documents(args.paths)
+    else:
+        raise SystemExit('채점할 파일이나 폴더를 지정하세요 (또는 --book)')
+    scorer = Scorer()
+    start = time.perf_counter()
+    features, scores = scorer.score_texts([text for _, text in docs])
+    elapsed = time.perf_counter() - start
+
+    out = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    try:
+        for i, (name, _) in enumerate(docs):
+            record = {'path': name, 'scores': dict(zip(AXES, np.round(scores[i], 3).tolist()))}
+            if args.features:
+                record['features'] = dict(zip(scorer.features_names, np.round(features[i], 4).tolist()))
+            out.write(json.dumps(record, ensure_ascii=False) + '\n')
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    if args.group_by == 'dir':
+        names, profiles = group_means(scores, [os.path.dirname(name) or '.' for name, _ in docs])
+    else:
+        names = [name if args.book else os.path.splitext(os.path.basename(name))[0] for name, _ in docs]
+        profiles = scores
+    if len(names) <= 20:
+        print_table(names, profiles)
+    chars = sum(len(text) for _, text in docs)
+    print(f"\n문서 {len(docs):,}개, {chars:,}자 채점 {elapsed:.2f}s", file=sys.stderr)
+    if args.radar:
+        render_radar(names, profiles, args.radar, mode=args.radar_mode)
+        print(f"  -> {args.radar} (프로필 {len(names)}개)", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,514 @@
+"""
+그림 시각 회귀 검사 — docs/assets/images/figures/ 아래 생성된 SVG를 래스터로 그려
+골든 래스터와 비교한다. 네이티브 SVG 출력, SVG 최적화, text/path 글꼴 모드처럼
+바이트는 바뀌지만 겉모습은 같아야 하는 변경을 generate_diagrams.py에 넣기 전후로 돌린다.
+비교는 NumPy 벡터 연산 두 가지 — 채널 차이가 PIXEL_TOLERANCE를 넘는 픽셀 비율과
+휘도 SSIM(적분 영상으로 구한 상자 창 평균) — 이고, 그림마다 점수와 차이 이미지를 남긴다.
+골든은 .diagram-cache/golden/에 로컬 렌더링 기준으로 저장하며 (저장소의 SVG는 macOS 렌더링이라
+글꼴이 다른 환경의 골든은 커밋하지 않음), 골든을 만들 때와 SVG 바이트·래스터라이저가 같으면
+다시 그리지 않고 '같음'으로 처리한다.
+--check-optimize는 골든 없이 다이어그램을 최적화하지 않고 렌더링해, svg_optimize 전후의
+래스터가 같은지 본다 (좌표 반올림 같은 최적화가 겉모습을 바꾸지 않았는지).
+
+사용법:
+    python scripts/visual_regress.py --update         # 변경 전: 골든 저장
+    python scripts/generate_diagrams.py --force       # generate_diagrams.py 수정 후 다시 렌더링
+    python scripts/visual_regress.py                  # 비교 — 기준을 넘으면 종료 코드 1
+    python scripts/visual_regress.py 'ch04/*' --rasterizer pymupdf
+    python scripts/visual_regress.py --check-optimize  # 최적화 전후 비교 (한글 글꼴 필요)
+"""
+import argparse
+import fnmatch
+import hashlib
+import io
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import generate_diagrams as gd  # noqa: E402
+import svg_optimize  # noqa: E402
+
+GOLDEN_DIR = os.path.join(gd.CACHE_DIR, 'golden')
+GOLDEN_MANIFEST = os.path.join(GOLDEN_DIR, 'golden.json')
+DIFF_DIR = os.path.join(gd.CACHE_DIR, 'visual-diff')
+REPORT_PATH = os.path.join(DIFF_DIR, 'report.json')
+
+# SVG 래스터라이저 — 글꼴 체인처럼 앞에서부터 쓸 수 있는 첫 번째를 사용
+RASTERIZERS = ['cairosvg', 'rsvg-convert', 'pymupdf', 'resvg']
+RASTER_DPI = gd.RASTER_DPI      # SVG pt 크기를 CSS 픽셀로 — 웹에 보이는 크기 그대로 비교
+BACKGROUND = 'white'            # 다크 변형의 투명 배경도 같은 바탕에 합성
+
+PIXEL_TOLERANCE = 16            # 채널 차이 이 값 이하는 안티에일리어싱 흔들림으로 보고 무시
+SSIM_WINDOW = 8
+SSIM_C1 = (0.01 * 255) ** 2
+SSIM_C2 = (0.03 * 255) ** 2
+LUMA = np.array([0.299, 0.587, 0.114], dtype=np.float32)
+# 실패 기준 — 바뀐 픽셀 비율 상한, SSIM 하한 (둘 중 하나라도 넘으면 실패)
+THRESHOLDS = {'changed': 0.001, 'ssim': 0.995}
+
+RUN_CHUNKS_PER_WORKER = gd.RUN_CHUNKS_PER_WORKER
+# 실패로 치는 상태 — 'new'(골든 없음)는 새 그림이라 경고만
+FAILING = ('changed', 'missing', 'error')
+
+
+# ============================================================
+# 래스터라이저
+# ============================================================
+def _cairosvg():
+    import cairosvg
+    # 모듈만 있고 libcairo가 없으면 첫 변환에서 OSError — 여기서 미리 확인
+    import cairocffi  # noqa: F401
+
+    def draw(svg):
+        return cairosvg.svg2png(bytestring=svg, dpi=RASTER_DPI, background_color=BACKGROUND)
+    return draw, cairosvg.__version__
+
+
+def _rsvg_convert():
+    version = subprocess.run(['rsvg-convert', '--version'], capture_output=True,
+                             text=True, check=True).stdout.split()[-1]
+
+    def draw(svg):
+        return subprocess.run(['rsvg-convert', '-d', str(RASTER_DPI), '-p', str(RASTER_DPI),
+                               '-b', BACKGROUND], input=svg, capture_output=True,
+                              check=True).stdout
+    return draw, version
+
+
+def _pymupdf():
+    import pymupdf
+
+    def draw(svg):
+        with pymupdf.open(stream=svg, filetype='svg') as doc:
+            pixmap = doc[0].get_pixmap(dpi=RASTER_DPI, alpha=False)
+        return np.frombuffer(pixmap.samples, np.uint8).reshape(pixmap.height, pixmap.width, 3)
+    return draw, pymupdf.VersionBind
+
+
+def _resvg():
+    import resvg_py
+    from importlib.metadata import version
+
+    def draw(svg):
+        return bytes(resvg_py.svg_to_bytes(svg_string=svg.decode('utf-8'), dpi=RASTER_DPI,
+                                           background=BACKGROUND))
+    return draw, version('resvg_py')
+
+
+_LOADERS = {'cairosvg': _cairosvg, 'rsvg-convert': _rsvg_convert,
+            'pymupdf': _pymupdf, 'resvg': _resvg}
+
+# 워커 프로세스 안에서 한 번만 불러온 래스터라이저 (이름, 함수, 버전)
+_RASTERIZER = None
+
+
+def load_rasterizer(name):
+    """이름 -> (그리기 함수, 버전), 쓸 수 없으면 None"""
+    try:
+        return _LOADERS[name]()
+    except (ImportError, OSError, subprocess.CalledProcessError):
+        return None
+
+
+def resolve_rasterizer(preferred=None):
+    """(이름, 버전) — preferred가 있으면 그것만, 없으면 RASTERIZERS 순서로 첫 번째"""
+    global _RASTERIZER
+    names = [preferred] if preferred else RASTERIZERS
+    for name in names:
+        loaded = load_rasterizer(name)
+        if loaded:
+            _RASTERIZER = (name, *loaded)
+            return name, loaded[1]
+    raise SystemExit(f"SVG 래스터라이저를 찾지 못했습니다 ({', '.join(names)}) — "
+                     "pip install cairosvg(libcairo 필요) / pymupdf / resvg-py 또는 "
+                     "librsvg(rsvg-convert)를 설치하세요")
+
+
+def init_worker(name, options=None):
+    """래스터라이저와 (최적화 검사면) 다이어그램 렌더링 옵션을 워커마다 한 번"""
+    if options is not None:
+        gd.init_worker(options)
+    if _RASTERIZER is None or _RASTERIZER[0] != name:
+        resolve_rasterizer(name)
+
+
+def rasterize(svg):
+    """SVG 바이트 -> (높이, 폭, 3) uint8 RGB"""
+    pixels = _RASTERIZER[1](svg)
+    if isinstance(pixels, np.ndarray):
+        return pixels
+    return decode_png(pixels)
+
+
+def decode_png(data):
+    from PIL import Image
+    with Image.open(io.BytesIO(data)) as image:
+        if image.mode in ('RGBA', 'LA', 'P'):
+            # 배경 옵션을 무시하는 래스터라이저 대비 — 흰 바탕에 합성
+            image = image.convert('RGBA')
+            canvas = Image.new('RGBA', image.size, BACKGROUND)
+            image = Image.alpha_composite(canvas, image)
+        return np.asarray(image.convert('RGB'))
+
+
+def encode_png(pixels):
+    from PIL import Image
+    out = io.BytesIO()
+    Image.fromarray(pixels).save(out, format='PNG', compress_level=1)
+    return out.getvalue()
+
+
+# ============================================================
+# 비교
+# ============================================================
+def pad_to(pixels, shape):
+    """오른쪽/아래를 흰색으로 채워 (높이, 폭)을 shape에 맞춤 — 크기가 바뀐 그림도 겹쳐 보도록"""
+    height, width = pixels.shape[:2]
+    if (height, width) == shape:
+        return pixels
+    out = np.full((*shape, 3), 255, np.uint8)
+    out[:height, :width] = pixels
+    return out
+
+
+def box_mean(x, k):
+    """k×k 상자 창 평균 — 적분 영상의 네 모서리 차, 유효 창만 (H-k+1, W-k+1)"""
+    s = np.zeros((x.shape[0] + 1, x.shape[1] + 1), np.float64)
+    np.cumsum(np.cumsum(x, axis=0), axis=1, out=s[1:, 1:])
+    return (s[k:, k:] - s[:-k, k:] - s[k:, :-k] + s[:-k, :-k]) / (k * k)
+
+
+def ssim(a, b, k=SSIM_WINDOW):
+    """휘도 영상 두 장의 평균 SSIM (상자 창)"""
+    if min(a.shape) < k:
+        k = min(a.shape)
+    mu_a, mu_b = box_mean(a, k), box_mean(b, k)
+    var_a = box_mean(a * a, k) - mu_a * mu_a
+    var_b = box_mean(b * b, k) - mu_b * mu_b
+    cov = box_mean(a * b, k) - mu_a * mu_b
+    score = (((2 * mu_a * mu_b + SSIM_C1) * (2 * cov + SSIM_C2))
+             / ((mu_a * mu_a + mu_b * mu_b + SSIM_C1) * (var_a + var_b + SSIM_C2)))
+    return float(score.mean())
+
+
+def compare(golden, current):
+    """(점수 dict, 차이 이미지 또는 None) — 픽셀이 모두 같으면 SSIM을 건너뜀"""
+    sizes = {'size': list(current.shape[1::-1]), 'golden_size': list(golden.shape[1::-1])}
+    if golden.shape == current.shape and np.array_equal(golden, current):
+        return {'changed': 0.0, 'max_delta': 0, 'ssim': 1.0, **sizes}, None
+    shape = (max(golden.shape[0], current.shape[0]), max(golden.shape[1], current.shape[1]))
+    golden, current = pad_to(golden, shape), pad_to(current, shape)
+    delta = np.abs(golden.astype(np.int16) - current).max(axis=2)
+    changed = delta > PIXEL_TOLERANCE
+    luma_golden = golden.astype(np.float32) @ LUMA
+    luma_current = current.astype(np.float32) @ LUMA
+    scores = {'changed': float(changed.mean()), 'max_delta': int(delta.max()),
+              'ssim': ssim(luma_golden, luma_current), **sizes}
+    return scores, diff_image(luma_current, delta, changed)
+
+
+def diff_image(luma, delta, changed):
+    """현재 그림을 옅은 회색으로 깔고 바뀐 픽셀을 차이만큼 진한 빨강으로"""
+    base = (255 - (255 - luma) * 0.25).astype(np.uint8)
+    out = np.repeat(base[:, :, None], 3, axis=2)
+    strength = np.clip(delta[changed].astype(np.float32) / 128, 0.35, 1)
+    out[changed] = np.stack([np.full_like(strength, 230), 40 * (1 - strength),
+                             40 * (1 - strength)], axis=1).astype(np.uint8)
+    return out
+
+
+def failed(scores, thresholds):
+    return (scores['changed'] > thresholds['changed'] or scores['ssim'] < thresholds['ssim']
+            or scores['size'] != scores['golden_size'])
+
+
+# ============================================================
+# 그림 단위 작업 (워커)
+# ============================================================
+def svg_paths(patterns=()):
+    """BASE_DIR 기준 SVG 경로 (정렬) — 스프라이트는 그림을 다시 묶은 것이라 제외"""
+    paths = []
+    for folder, _, files in os.walk(gd.BASE_DIR):
+        for filename in files:
+            rel = os.path.relpath(os.path.join(folder, filename), gd.BASE_DIR).replace(os.sep, '/')
+            if not filename.endswith('.svg') or gd._SPRITE_FILE.search(rel):
+                continue
+            if patterns and not any(fnmatch.fnmatch(rel, p) for p in patterns):
+                continue
+            paths.append(rel)
+    return sorted(paths)
+
+
+def golden_path(rel):
+    return os.path.join(GOLDEN_DIR, *rel.split('/')) + '.png'
+
+
+def diff_path(rel):
+    return os.path.join(DIFF_DIR, *os.path.splitext(rel)[0].split('/')) + '.png'
+
+
+def update_one(rel):
+    """골든 저장 — (경로, SVG sha1, 소요 ms)"""
+    start = time.perf_counter()
+    with open(os.path.join(gd.BASE_DIR, rel), 'rb') as f:
+        svg = f.read()
+    path = golden_path(rel)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    gd.write_if_changed(path, encode_png(rasterize(svg)))
+    return rel, hashlib.sha1(svg).hexdigest(), (time.perf_counter() - start) * 1000
+
+
+def judge(scores, diff, thresholds, path):
+    """상태와 (차이가 있으면) 차이 이미지 경로 — 차이 이미지는 path에 저장"""
+    if diff is None:
+        return {'status': 'same'}
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(encode_png(diff))
+    return {'status': 'changed' if failed(scores, thresholds) else 'ok',
+            'diff': os.path.relpath(path, gd.ROOT_DIR).replace(os.sep, '/')}
+
+
+def check_one(job):
+    """(경로, 골든 SVG sha1 또는 None, 기준) -> 결과 dict"""
+    rel, golden_sha, thresholds = job
+    start = time.perf_counter()
+    result = {'figure': rel}
+    try:
+        with open(os.path.join(gd.BASE_DIR, rel), 'rb') as f:
+            svg = f.read()
+        if golden_sha is not None and hashlib.sha1(svg).hexdigest() == golden_sha:
+            result.update(status='same', changed=0.0, max_delta=0, ssim=1.0)
+        elif not os.path.exists(golden_path(rel)):
+            result['status'] = 'new'
+        else:
+            with open(golden_path(rel), 'rb') as f:
+                golden = decode_png(f.read())
+            scores, diff = compare(golden, rasterize(svg))
+            result.update(scores)
+            result.update(judge(scores, diff, thresholds, diff_path(rel)))
+    except Exception as e:      # 한 그림의 실패로 전체 검사를 멈추지 않음
+        result.update(status='error', error=f'{type(e).__name__}: {e}')
+    result['ms'] = round((time.perf_counter() - start) * 1000, 1)
+    return result
+
+
+def optimize_one(job):
+    """(다이어그램 이름, 최적화 설정, 기준) -> 그 다이어그램 SVG마다 최적화 전후 비교 결과"""
+    name, settings, thresholds = job
+    try:
+        outputs = gd.render_bytes(name)
+    except Exception as e:
+        return [{'figure': name, 'status': 'error', 'error': f'{type(e).__name__}: {e}'}]
+    results = []
+    for path, raw in outputs.items():
+        if not path.endswith('.svg'):
+            continue
+        start = time.perf_counter()
+        rel = os.path.relpath(os.path.join(gd.ROOT_DIR, path), gd.BASE_DIR).replace(os.sep, '/')
+        result = {'figure': rel}
+        try:
+            optimized = svg_optimize.optimize(raw, **settings)
+            scores, diff = compare(rasterize(raw), rasterize(optimized))
+            result.update(scores, bytes=[len(raw), len(optimized)])
+            result.update(judge(scores, diff, thresholds,
+                                os.path.join(DIFF_DIR, 'optimize', *rel.split('/')) + '.png'))
+        except Exception as e:
+            result.update(status='error', error=f'{type(e).__name__}: {e}')
+        result['ms'] = round((time.perf_counter() - start) * 1000, 1)
+        results.append(result)
+    return results
+
+
+def run(fn, jobs_list, jobs, rasterizer, options=None):
+    """jobs_list를 순서대로 fn에 — jobs > 1이면 프로세스 풀 (래스터라이저는 워커마다 한 번 로드)"""
+    if jobs > 1 and len(jobs_list) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        workers = min(jobs, len(jobs_list))
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker,
+                                 initargs=(rasterizer, options)) as pool:
+            chunksize = max(1, len(jobs_list) // (workers * RUN_CHUNKS_PER_WORKER))
+            yield from pool.map(fn, jobs_list, chunksize=chunksize)
+        return
+    init_worker(rasterizer, options)
+    yield from map(fn, jobs_list)
+
+
+# ============================================================
+# 골든 관리
+# ============================================================
+def load_manifest():
+    try:
+        with open(GOLDEN_MANIFEST, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def update(paths, patterns, rasterizer, version, jobs):
+    """골든 저장 — 패턴 없이 전부 갱신하면 사라진 그림의 골든도 지움"""
+    manifest = load_manifest()
+    if patterns and manifest and (manifest['rasterizer'], manifest['dpi']) != (rasterizer, RASTER_DPI):
+        raise SystemExit(f"골든이 {manifest['rasterizer']}({manifest['dpi']}dpi)로 만들어져 "
+                         "일부만 갱신할 수 없습니다 — 패턴 없이 --update로 전부 다시 만드세요")
+    figures = dict(manifest['figures']) if patterns and manifest else {}
+    start = time.perf_counter()
+    for rel, sha, ms in run(update_one, paths, jobs, rasterizer):
+        figures[rel] = sha
+        print(f"  {rel:<56} {ms:7.1f}ms")
+    if not patterns:
+        for rel in svg_paths_in(GOLDEN_DIR, '.svg.png'):
+            if rel not in figures:
+                os.remove(golden_path(rel))
+    os.makedirs(GOLDEN_DIR, exist_ok=True)
+    manifest = {'rasterizer': rasterizer, 'version': version, 'dpi': RASTER_DPI,
+                'figures': dict(sorted(figures.items()))}
+    with open(GOLDEN_MANIFEST, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=1)
+    print(f"골든 {len(paths)}개 저장 ({rasterizer} {version}, {RASTER_DPI}dpi) — "
+          f"{time.perf_counter() - start:.2f}s → {os.path.relpath(GOLDEN_DIR, gd.ROOT_DIR)}")
+
+
+def svg_paths_in(folder, suffix):
+    """folder 아래 suffix로 끝나는 파일 -> suffix 앞 '.svg'까지 붙인 BASE_DIR 기준 경로"""
+    paths = []
+    for root, _, files in os.walk(folder):
+        for filename in files:
+            if filename.endswith(suffix):
+                rel = os.path.relpath(os.path.join(root, filename), folder).replace(os.sep, '/')
+                paths.append(rel[:-len(suffix)] + '.svg')
+    return sorted(paths)
+
+
+# ============================================================
+# 비교 실행과 보고
+# ============================================================
+def check(paths, patterns, manifest, rasterizer, version, thresholds, jobs, rehash):
+    same_rasterizer = (manifest['rasterizer'], manifest.get('version'), manifest['dpi']) \
+        == (rasterizer, version, RASTER_DPI)
+    known = manifest['figures'] if same_rasterizer and not rehash else {}
+    shutil.rmtree(DIFF_DIR, ignore_errors=True)
+    jobs_list = [(rel, known.get(rel), thresholds) for rel in paths]
+    results = list(run(check_one, jobs_list, jobs, rasterizer))
+    present = set(paths)
+    for rel in manifest['figures']:
+        if rel not in present and (not patterns or any(fnmatch.fnmatch(rel, p) for p in patterns)):
+            results.append({'figure': rel, 'status': 'missing'})
+    return results
+
+
+def check_optimize(rasterizer, thresholds, jobs):
+    """다이어그램 전부를 최적화 없이 메모리에 렌더링해 svg_optimize 전후 래스터 비교"""
+    settings = dict(gd.OPTIMIZE or svg_optimize.DEFAULTS)
+    options = {**gd.current_options(), 'OPTIMIZE': None, 'DARK_VARIANT': False,
+               'RASTER': {**gd.RASTER, 'all': False}, 'PRECOMPRESS': []}
+    names = list(gd.DIAGRAM_BY_NAME)
+    shutil.rmtree(os.path.join(DIFF_DIR, 'optimize'), ignore_errors=True)
+    jobs_list = [(name, settings, thresholds) for name in names]
+    jobs = max(1, min(jobs, len(names)))
+    return [result for results in run(optimize_one, jobs_list, jobs, rasterizer, options)
+            for result in results], jobs
+
+
+def report(results, elapsed, rasterizer, version, jobs, verbose=False):
+    counts = {}
+    for result in results:
+        counts[result['status']] = counts.get(result['status'], 0) + 1
+    shown = [r for r in results if verbose or r['status'] != 'same']
+    if shown:
+        print(f"{'그림':<56} {'상태':<8} {'바뀐 픽셀':>9} {'최대차':>6} {'SSIM':>7} {'ms':>7}")
+    for r in shown:
+        if 'changed' in r:
+            scores = f"{r['changed']:>9.3%} {r['max_delta']:>6} {r['ssim']:>7.4f}"
+        else:
+            scores = f"{'-':>9} {'-':>6} {'-':>7}"
+        line = f"{r['figure']:<56} {r['status']:<8} {scores} {r.get('ms', 0):>7.1f}"
+        if r.get('size') and r['size'] != r['golden_size']:
+            line += f"  크기 {r['golden_size'][0]}×{r['golden_size'][1]} → {r['size'][0]}×{r['size'][1]}"
+        if r.get('error'):
+            line += f"  {r['error']}"
+        print(line)
+    summary = ', '.join(f'{status} {n}' for status, n in sorted(counts.items()))
+    print(f"\n그림 {len(results)}개 ({summary}) — {elapsed:.2f}s, {rasterizer} {version}, "
+          f"프로세스 {jobs}개")
+    diffs = [r for r in results if r.get('diff')]
+    if diffs:
+        print(f"차이 이미지 {len(diffs)}개 → {os.path.relpath(DIFF_DIR, gd.ROOT_DIR)}")
+    os.makedirs(DIFF_DIR, exist_ok=True)
+    with open(REPORT_PATH, 'w', encoding='utf-8') as f:
+        json.dump({'rasterizer': rasterizer, 'version': version, 'dpi': RASTER_DPI,
+                   'elapsed': round(elapsed, 3), 'counts': counts, 'figures': results},
+                  f, ensure_ascii=False, indent=1)
+    if counts.get('new'):
+        print(f"골든이 없는 그림 {counts['new']}개 — --update로 추가하세요")
+    return sum(counts.get(status, 0) for status in FAILING)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='생성된 SVG 그림을 골든 래스터와 비교')
+    parser.add_argument('patterns', nargs='*', metavar='GLOB',
+                        help='figures/ 기준 경로 패턴 (예: ch04/*, */*-dark.svg / 기본: 전부)')
+    parser.add_argument('--update', action='store_true',
+                        help='비교하지 않고 현재 SVG로 골든 저장')
+    parser.add_argument('--rasterizer', choices=RASTERIZERS,
+                        help='SVG 래스터라이저 (기본: 골든을 만든 것, 없으면 쓸 수 있는 첫 번째)')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1,
+                        help='비교 프로세스 수 (기본: CPU 코어 수)')
+    parser.add_argument('--max-changed', type=float, default=THRESHOLDS['changed'] * 100,
+                        metavar='PCT', help='바뀐 픽셀 비율 상한 %% (기본: %(default)g)')
+    parser.add_argument('--min-ssim', type=float, default=THRESHOLDS['ssim'],
+                        help='SSIM 하한 (기본: %(default)g)')
+    parser.add_argument('--check-optimize', action='store_true',
+                        help='골든 대신 다이어그램을 최적화 없이 렌더링해 svg_optimize 전후 비교')
+    parser.add_argument('--rehash', action='store_true',
+                        help='SVG 바이트가 골든과 같아도 다시 그려 비교')
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help="'같음'인 그림도 표에 출력")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    thresholds = {'changed': args.max_changed / 100, 'ssim': args.min_ssim}
+    if args.check_optimize:
+        rasterizer, version = resolve_rasterizer(args.rasterizer)
+        start = time.perf_counter()
+        results, jobs = check_optimize(rasterizer, thresholds, args.jobs)
+        failures = report(results, time.perf_counter() - start, rasterizer, version, jobs,
+                          args.verbose)
+        return 1 if failures else 0
+    paths = svg_paths(args.patterns)
+    if not paths and (args.update or not args.patterns):
+        raise SystemExit(f"SVG 그림이 없습니다: {gd.BASE_DIR} — generate_diagrams.py를 먼저 실행하세요")
+    manifest = None if args.update else load_manifest()
+    if not args.update and manifest is None:
+        raise SystemExit(f"골든이 없습니다: {GOLDEN_MANIFEST} — 변경 전에 --update로 만드세요")
+    preferred = args.rasterizer
+    if preferred is None and manifest and load_rasterizer(manifest['rasterizer']):
+        preferred = manifest['rasterizer']
+    rasterizer, version = resolve_rasterizer(preferred)
+    if manifest and (manifest['rasterizer'], manifest['dpi']) != (rasterizer, RASTER_DPI):
+        raise SystemExit(f"골든은 {manifest['rasterizer']}({manifest['dpi']}dpi)로 만들어졌습니다 — "
+                         f"같은 래스터라이저를 설치하거나 --update --rasterizer {rasterizer}로 "
+                         "변경 전 그림의 골든을 다시 만드세요")
+    jobs = max(1, min(args.jobs, len(paths)))
+    if args.update:
+        update(paths, args.patterns, rasterizer, version, jobs)
+        return 0
+    start = time.perf_counter()
+    results = check(paths, args.patterns, manifest, rasterizer, version, thresholds,
+                    jobs, args.rehash)
+    failures = report(results, time.perf_counter() - start, rasterizer, version, jobs,
+                      args.verbose)
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
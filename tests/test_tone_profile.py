@@ -0,0 +1,35 @@
+"""tone_profile — 묶음 채점이 문서별 채점과 같은지"""
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+
+import tone_profile  # noqa: E402
+
+
+@pytest.fixture(scope='module')
+def scorer():
+    return tone_profile.Scorer()
+
+
+def assert_batch_matches_single(scorer, texts):
+    batch = scorer.features(texts)
+    single = np.vstack([scorer.features([text]) for text in texts])
+    np.testing.assert_allclose(batch, single)
+    np.testing.assert_allclose(scorer.scores(batch), scorer.scores(single))
+
+
+def test_sentence_does_not_cross_document_boundary(scorer):
+    # 앞 문서가 문장 부호 없이 끝나면 다음 문서의 첫 문장이 앞 문서로 넘어가면 안 됨
+    texts = ['정말 좋아요. 그래서 산책을 했다', '그렇다. 이건 새 문서의 끝이다.',
+             '마침표 없는 문서', '', '마지막 문서입니다!']
+    assert_batch_matches_single(scorer, texts)
+
+
+def test_book_samples_batch_matches_single(scorer):
+    texts = [text for _, text in tone_profile.book_samples()]
+    assert texts
+    assert_batch_matches_single(scorer, texts)